@@ -5,6 +5,8 @@ Add Off-Roll category for aide/tutor/assistant courses.
 
 import json
 
+from course_record import Course, load_catalog
+
 def move_to_offroll(courses):
     """Move aide/tutor/assistant courses to Off-Roll pathway"""
     fixes = 0
@@ -34,7 +36,7 @@ def main():
     print('\nLoading courses_complete.json...\n')
 
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
     print('Moving aide/tutor/assistant courses to Off-Roll...\n')
@@ -46,7 +48,7 @@ def main():
     # Save
     print('Saving updated data...')
     with open('src/data/courses_complete.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=Course.to_dict)
 
     print('✓ Done!\n')
 
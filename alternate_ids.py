@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Alternate course ID extraction and variant collapsing.
+Course descriptions list the other numbers a course is scheduled under:
+
+    Alternate Course ID Number: US History 1-2 (Hybrid - Online & In Person)
+    801376 - 801377, US History 1-2 (with AVID 5-6) 091376-091377
+
+The parser left these inside the description and prerequisite text and
+alternate_ids empty. This fixer parses them into alternate_ids (as
+course IDs, "801376-801377"), cuts them out of the prerequisite text, and
+collapses the separate Hybrid/AVID section records ("U.S. HISTORY 1-2
+(Linked w/AVID 5-6)") into the course they are an alternate of,
+rewriting references to them. catalog_bundle.py adds the reverse index
+(alternate number or ID -> canonical course_id) to the app's catalog as
+"alternate_index", so a lookup by any district number is one dict access.
+
+    python3 alternate_ids.py            # report only
+    python3 alternate_ids.py --write    # update courses_complete.json
+"""
+
+import argparse
+import json
+import re
+from typing import List, Dict, Any
+
+from course_record import Course, load_catalog
+from parser_diff import course_numbers
+
+CATALOG_PATH = "src/data/courses_complete.json"
+
+ALTERNATE_MARKER = re.compile(r'Alternate Course ID Numbers?:\s*', re.I)
+# One "<label> <number>[ - <number>]" entry, after an optional ", or " separator
+ALTERNATE_ENTRY = re.compile(r'(?:\s*,\s*|\s+)?(?:or\s+)?(?P<label>[^,]*?)\s*(?P<first>\d{6})(?:\s*-\s*(?P<last>\d{6}))?')
+# Variants that are the same course in another format
+COLLAPSIBLE_VARIANT = re.compile(r'\bHYBRID\b|\bAVID\b', re.I)
+
+# Fields holding course IDs that must follow a collapsed record
+ID_FIELDS = ['linked_courses', 'pair_course_id', 'replacement_equivalents',
+             'prerequisites_required_ids', 'prerequisites_recommended_ids']
+# Text fields the parser spilled the alternate list into
+TEXT_FIELDS = ['prerequisites_required', 'prerequisites_recommended']
+
+def parse_alternates(text: str) -> List[Dict[str, str]]:
+    """[{"label", "id"}] for the alternate numbers listed in a description"""
+    marker = ALTERNATE_MARKER.search(text or '')
+    if not marker:
+        return []
+    alternates = []
+    pos = marker.end()
+    while True:
+        match = ALTERNATE_ENTRY.match(text, pos)
+        # Entries follow each other directly; the description starts after the last
+        if not match or len(match.group('label')) > 80:
+            break
+        # A range cut off by the text's truncation ("811393-")
+        if re.match(r'\s*-', text[match.end():]):
+            break
+        first, last = match.group('first'), match.group('last')
+        alternates.append({'label': match.group('label').strip(),
+                           'id': f"{first}-{last}" if last else first})
+        pos = match.end()
+    return alternates
+
+def course_alternates(course) -> List[Dict[str, str]]:
+    """Alternates named in a course's notes or prerequisite text, first mention wins"""
+    seen = {}
+    for text in [course.get('notes') or ''] + [t for f in TEXT_FIELDS for t in (course.get(f) or [])]:
+        for alternate in parse_alternates(text):
+            seen.setdefault(alternate['id'], alternate)
+    return list(seen.values())
+
+def strip_alternates(text: str) -> str:
+    """Prerequisite text without the alternate list (and the description after it)"""
+    marker = ALTERNATE_MARKER.search(text)
+    return text[:marker.start()].strip() if marker else text
+
+def alternate_index(courses: List) -> Dict[str, str]:
+    """Reverse index: every alternate ID and number -> canonical course_id
+
+    Numbers of a course that is itself in the catalog are left out, so an
+    alternate never shadows a real record.
+    """
+    own = {number for course in courses for number in course_numbers(course)}
+    own.update(course['course_id'] for course in courses)
+    index = {}
+    for course in courses:
+        for alternate_id in course.get('alternate_ids') or []:
+            for key in [alternate_id] + re.findall(r'\d{6}', alternate_id):
+                if key not in own:
+                    index.setdefault(key, course['course_id'])
+    return index
+
+def resolve_course_id(index: Dict[str, str], course_id: str) -> str:
+    """Canonical course_id for any course or alternate ID (mirrors resolveCourseId in JS)"""
+    return index.get(course_id, course_id)
+
+def add_alternate_index(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The catalog with its alternate ID reverse index"""
+    return {**data, 'alternate_index': alternate_index(data['courses'])}
+
+def collapse_variants(courses: List) -> Dict[str, Any]:
+    """Fill alternate_ids and fold Hybrid/AVID section records into their canonical course
+
+    Returns {"courses": kept courses, "collapsed": {variant course_id: canonical course_id},
+    "conflicts": [...alternates that are separate, non-variant records]}.
+    """
+    by_id = {course['course_id']: course for course in courses}
+    collapsed = {}
+    conflicts = []
+
+    for course in courses:
+        alternates = course_alternates(course)
+        ids = list(course.get('alternate_ids') or [])
+        for alternate in alternates:
+            if alternate['id'] not in ids:
+                ids.append(alternate['id'])
+        course['alternate_ids'] = ids
+
+        for alternate in alternates:
+            record = by_id.get(alternate['id'])
+            if record is None or record is course:
+                continue
+            if COLLAPSIBLE_VARIANT.search(alternate['label']) or COLLAPSIBLE_VARIANT.search(record['full_name']):
+                collapsed[alternate['id']] = course['course_id']
+            else:
+                conflicts.append({'course': course['full_name'], 'alternate': alternate['id'],
+                                  'record': record['full_name']})
+
+    kept = [course for course in courses if course['course_id'] not in collapsed]
+    for course in kept:
+        for field in ID_FIELDS:
+            value = course.get(field)
+            if isinstance(value, str):
+                course[field] = collapsed.get(value, value)
+            elif value:
+                resolved = []
+                for course_id in value:
+                    course_id = collapsed.get(course_id, course_id)
+                    if course_id != course['course_id'] and course_id not in resolved:
+                        resolved.append(course_id)
+                course[field] = resolved
+        for field in TEXT_FIELDS:
+            if course.get(field):
+                course[field] = [text for text in (strip_alternates(t) for t in course[field]) if text]
+
+    return {'courses': kept, 'collapsed': collapsed, 'conflicts': conflicts}
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract alternate course IDs and collapse Hybrid/AVID variants")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('--write', action='store_true', help="Save the result to the catalog")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        data = load_catalog(f)
+    before = len(data['courses'])
+
+    result = collapse_variants(data['courses'])
+    data['courses'] = result['courses']
+    if 'total_courses' in data:
+        data['total_courses'] = len(data['courses'])
+
+    print("ALTERNATE IDS:")
+    for course in data['courses']:
+        if course['alternate_ids']:
+            print(f"  {course['full_name'][:44]:<44} {', '.join(course['alternate_ids'])}")
+
+    print(f"\nCOLLAPSED ({len(result['collapsed'])}):")
+    for variant, canonical in result['collapsed'].items():
+        print(f"  {variant} -> {canonical}")
+    if result['conflicts']:
+        print(f"\nKEPT, alternate is a separate course ({len(result['conflicts'])}):")
+        for conflict in result['conflicts']:
+            print(f"  {conflict['course'][:40]:<40} lists {conflict['alternate']} ({conflict['record']})")
+
+    index = alternate_index(data['courses'])
+    print(f"\n{before} -> {len(data['courses'])} courses, {len(index)} alternate index entries")
+
+    if args.write:
+        with open(args.catalog, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=Course.to_dict)
+        print(f"Saved to {args.catalog}")
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,13 @@
 Analyze scheduling patterns in the course catalog JSON.
 """
 
-import json
 from collections import defaultdict, Counter
 
+from course_record import load_catalog
+
 def load_courses():
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
     return data['courses']
 
 def analyze_patterns(courses):
@@ -33,18 +34,18 @@ def analyze_patterns(courses):
             patterns['yearlong_courses'].append({
                 'name': course['full_name'],
                 'id': course['course_id'],
-                'offered_terms': course.get('offered_terms', [])
+                'offered_terms': list(course.get('offered_terms', []))
             })
         elif term_length == 'semester':
             patterns['semester_only_courses'].append({
                 'name': course['full_name'],
                 'id': course['course_id'],
-                'offered_terms': course.get('offered_terms', []),
+                'offered_terms': list(course.get('offered_terms', [])),
                 'semester_restrictions': course.get('semester_restrictions')
             })
 
-        # AP/Honors pairs
-        if course.get('is_ap_or_honors_pair'):
+        # AP/Honors courses and their counterparts (pair_courses.py)
+        if course.get('is_ap_or_honors_pair') or course.get('pair_course_id'):
             patterns['ap_honors_pairs'].append({
                 'name': course['full_name'],
                 'id': course['course_id'],
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark labelled-field extraction: regexes over course text vs. the
+word-level spatial index (word_index.py), on the full catalog.
+
+Both paths start from the same extracted lines (extract_page_lines also
+does the column and header detection that finds the course blocks), so
+that work is timed once as shared. The regex path then only searches the
+block text; the index path also extracts the page words and builds the
+index.
+"""
+
+import re
+import sys
+import time
+from typing import Dict, List
+
+import pdfplumber
+
+from catalog_sections import find_sections, shard_sections
+from final_parser import extract_page_lines, find_course_entries, build_provenance_regions
+from word_index import FIELD_LABELS, PageWordIndex, extract_label_fields
+
+REGEX_PATTERNS = {
+    label.rstrip(':'): re.compile(re.escape(label) + r'[ \t]*([^\n]*)')
+    for label in FIELD_LABELS
+}
+
+def regex_fields(block_text: str) -> Dict[str, str]:
+    """Field values for one course block using one regex search per label"""
+    fields = {}
+    for key, pattern in REGEX_PATTERNS.items():
+        match = pattern.search(block_text)
+        if match:
+            fields[key] = match.group(1).strip()
+    return fields
+
+def run_benchmark(pdf_path: str) -> Dict[str, float]:
+    timings = {'char_parsing': 0.0, 'line_extraction': 0.0, 'word_extraction': 0.0, 'index_build': 0.0,
+               'regex_queries': 0.0, 'index_queries': 0.0}
+
+    with pdfplumber.open(pdf_path) as pdf:
+        sections = shard_sections(find_sections(pdf))
+        page_numbers = [n for s in sections for n in range(s['start_page'], s['end_page'] + 1)]
+        print(f"Benchmarking {len(page_numbers)} course pages...\n")
+
+        lines: List[str] = []
+        sources: List[Dict] = []
+        indexes: Dict[int, PageWordIndex] = {}
+
+        for page_no in page_numbers:
+            page = pdf.pages[page_no - 1]
+
+            # Both paths share pdfplumber's char parsing and the line
+            # extraction that locates the course blocks
+            start = time.perf_counter()
+            page.chars
+            timings['char_parsing'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            page_lines, page_sources = extract_page_lines(page, page_no)
+            timings['line_extraction'] += time.perf_counter() - start
+            lines.extend(page_lines)
+            sources.extend(page_sources)
+
+            start = time.perf_counter()
+            words = page.extract_words()
+            timings['word_extraction'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            indexes[page_no] = PageWordIndex(words, page_no)
+            timings['index_build'] += time.perf_counter() - start
+
+    entries = find_course_entries(lines)
+    blocks = []
+    for data in entries:
+        span = slice(data['line_start'], data['line_end'] + 1)
+        regions = build_provenance_regions(sources[span])
+        blocks.append(('\n'.join(lines[span]), regions))
+
+    regex_results = []
+    start = time.perf_counter()
+    for block_text, _ in blocks:
+        regex_results.append(regex_fields(block_text))
+    timings['regex_queries'] = time.perf_counter() - start
+
+    index_results = []
+    start = time.perf_counter()
+    for _, regions in blocks:
+        index_results.append(extract_label_fields([
+            (indexes[r['page']], r['bbox']) for r in regions
+        ]))
+    timings['index_queries'] = time.perf_counter() - start
+
+    found = sum(len(r) for r in regex_results)
+    agree = sum(1 for a, b in zip(regex_results, index_results)
+                for key in a if b.get(key) == a[key])
+
+    print(f"Courses: {len(blocks)}")
+    print(f"Fields found (regex): {found}")
+    print(f"Fields found (index): {sum(len(r) for r in index_results)}")
+    print(f"Agreement: {agree}/{found}\n")
+
+    return timings
+
+def main():
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else "Westview Course Catalog 2025-2026.pdf"
+
+    print("=== Field Extraction Benchmark ===\n")
+    timings = run_benchmark(pdf_path)
+
+    shared_total = timings['char_parsing'] + timings['line_extraction']
+    regex_total = timings['regex_queries']
+    index_total = timings['word_extraction'] + timings['index_build'] + timings['index_queries']
+
+    print("Timings:")
+    for name, seconds in timings.items():
+        print(f"  {name:18s} {seconds * 1000:10.1f} ms")
+    print(f"\n  shared             {shared_total * 1000:10.1f} ms  (char parsing + line extraction)")
+    print(f"  regex path         {regex_total * 1000:10.1f} ms  (regex queries)")
+    print(f"  index path         {index_total * 1000:10.1f} ms  (word extraction + index build + queries)")
+
+if __name__ == "__main__":
+    main()
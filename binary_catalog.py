@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped binary catalog format.
+json.load parses the whole catalog even to read one field. A .wcat file is
+laid out so a reader can mmap it and decode only what it touches:
+
+    header        magic, version, counts and section offsets
+    string table  (offset, length) per unique string, then the UTF-8 bytes
+    list table    u32 items (string ids or ints) for every list field
+    record table  one fixed-width struct per course
+    number index  open-addressing hash of course number -> record
+
+Records keep their original key order, and values that don't fit the
+fixed layout go to a per-record JSON "extras" string, so every record reads
+back exactly as the dict it was written from.
+
+    python3 binary_catalog.py build src/data/courses_complete.json courses.wcat
+    python3 binary_catalog.py get courses.wcat 001395
+    python3 binary_catalog.py bench src/data/courses_complete.json --copies 500
+"""
+
+import argparse
+import json
+import math
+import mmap
+import re
+import struct
+import sys
+import time
+from typing import List, Dict, Any, Optional, Iterator
+
+MAGIC = b'WCAT'
+VERSION = 1
+
+# Null string id / empty hash slot
+NONE = 0xFFFFFFFF
+
+STRING_FIELDS = [
+    'course_id', 'full_name', 'credit_type', 'uc_csu_category', 'pathway',
+    'term_length', 'pair_course_id', 'semester_restrictions', 'notes',
+]
+NUMBER_FIELDS = ['credits', 'homework_hours_per_week', 'uc_honors_weight']
+INT_FIELDS = ['category_priority']
+BOOL_FIELDS = [
+    'is_replacement_course', 'is_ap_or_honors_pair', 'fall_to_spring_dependency',
+    'is_graduation_requirement',
+]
+# List field -> item kind
+LIST_FIELDS = {
+    'course_numbers': 'str',
+    'grades_allowed': 'int',
+    'offered_terms': 'str',
+    'prerequisites_required': 'str',
+    'prerequisites_recommended': 'str',
+    'replacement_equivalents': 'str',
+    'linked_courses': 'str',
+    'alternate_ids': 'str',
+    'prerequisites_required_ids': 'str',
+    'prerequisites_recommended_ids': 'str',
+}
+
+# magic, version, record count, string count, list item count, hash slots,
+# then the offsets of the string table, string bytes, list table, record
+# table and number index
+HEADER = struct.Struct('<4sHIIIIQQQQQ')
+
+# key order id, extras id, strings, numbers, int-valued number bits, ints,
+# bool bits, then (start, count) per list field
+RECORD = struct.Struct('<II' + 'I' * len(STRING_FIELDS) + 'd' * len(NUMBER_FIELDS) + 'B'
+                       + 'i' * len(INT_FIELDS) + 'B' + 'II' * len(LIST_FIELDS))
+
+STRING_REF = struct.Struct('<II')
+HASH_SLOT = struct.Struct('<II')
+
+def record_numbers(course: Dict) -> List[int]:
+    """Course numbers to index a course by (falls back to those in course_id)"""
+    numbers = [str(n) for n in course.get('course_numbers') or []]
+    numbers = numbers or re.findall(r'\d{6}', str(course.get('course_id', '')))
+    return [int(n) for n in numbers if n.isdigit()]
+
+def slot_for(number: int, mask: int) -> int:
+    return (number * 2654435761) & 0xFFFFFFFF & mask
+
+def fits(key: str, value: Any) -> bool:
+    """Check if a value can be stored in its field's fixed slot"""
+    if key in STRING_FIELDS:
+        return value is None or isinstance(value, str)
+    if key in NUMBER_FIELDS:
+        return value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+    if key in INT_FIELDS:
+        return isinstance(value, int) and not isinstance(value, bool) and -2**31 <= value < 2**31
+    if key in BOOL_FIELDS:
+        return isinstance(value, bool)
+    if key in LIST_FIELDS:
+        if not isinstance(value, list):
+            return False
+        if LIST_FIELDS[key] == 'int':
+            return all(isinstance(v, int) and not isinstance(v, bool) and 0 <= v < NONE for v in value)
+        return all(isinstance(v, str) for v in value)
+    return False
+
+def write_catalog(courses: List[Dict], path: str):
+    """Write courses (dicts or Course records) to a .wcat file"""
+    strings = {}
+    list_items = []
+    records = []
+
+    def sid(value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        return strings.setdefault(value, len(strings))
+
+    courses = [course.to_dict() if hasattr(course, 'to_dict') else course for course in courses]
+    for course in courses:
+        stored = {key: value for key, value in course.items() if fits(key, value)}
+        extras = {key: value for key, value in course.items() if key not in stored}
+
+        values = [sid(json.dumps(list(course), ensure_ascii=False)),
+                  sid(json.dumps(extras, ensure_ascii=False)) if extras else NONE]
+        values += [sid(stored.get(key)) for key in STRING_FIELDS]
+
+        int_bits = 0
+        for bit, key in enumerate(NUMBER_FIELDS):
+            number = stored.get(key)
+            values.append(math.nan if number is None else float(number))
+            if isinstance(number, int):
+                int_bits |= 1 << bit
+        values.append(int_bits)
+
+        values += [stored.get(key, 0) for key in INT_FIELDS]
+        values.append(sum(1 << bit for bit, key in enumerate(BOOL_FIELDS) if stored.get(key)))
+
+        for key, kind in LIST_FIELDS.items():
+            items = stored.get(key, [])
+            values += [len(list_items), len(items)]
+            if kind == 'str':
+                list_items.extend(sid(v) for v in items)
+            else:
+                list_items.extend(items)
+
+        records.append(RECORD.pack(*values))
+
+    # Hash index, at most half full so probes stay short
+    numbers = [record_numbers(course) for course in courses]
+    for course, course_numbers in zip(courses, numbers):
+        too_large = [n for n in course_numbers if n >= NONE]
+        if too_large:
+            raise ValueError(f"Course number {too_large[0]} of {course.get('course_id')!r} "
+                             f"does not fit the .wcat number index (below {NONE})")
+    slots = 1
+    while slots < 2 * max(1, sum(len(n) for n in numbers)):
+        slots *= 2
+    table = [(NONE, NONE)] * slots
+    for index, course_numbers in enumerate(numbers):
+        for number in course_numbers:
+            slot = slot_for(number, slots - 1)
+            while table[slot][0] not in (NONE, number):
+                slot = (slot + 1) & (slots - 1)
+            if table[slot][0] == NONE:
+                table[slot] = (number, index)
+
+    encoded = [s.encode('utf-8') for s in strings]
+    string_refs = bytearray()
+    offset = 0
+    for data in encoded:
+        string_refs += STRING_REF.pack(offset, len(data))
+        offset += len(data)
+
+    string_table = HEADER.size
+    string_bytes = string_table + len(string_refs)
+    list_table = string_bytes + offset
+    record_table = list_table + 4 * len(list_items)
+    number_index = record_table + RECORD.size * len(records)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records), len(encoded), len(list_items), slots,
+                            string_table, string_bytes, list_table, record_table, number_index))
+        f.write(string_refs)
+        for data in encoded:
+            f.write(data)
+        f.write(struct.pack(f'<{len(list_items)}I', *list_items))
+        for record in records:
+            f.write(record)
+        for number, index in table:
+            f.write(HASH_SLOT.pack(number, index))
+
+class BinaryCatalog:
+    """Read-only view of a .wcat file; records are decoded on access"""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.count, self.string_count, _, self.slots, self._string_table,
+         self._string_bytes, self._list_table, self._record_table,
+         self._number_index) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} catalog")
+        self._key_orders = {}
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'BinaryCatalog':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> 'CatalogRecord':
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return CatalogRecord(self, index, RECORD.unpack_from(self._map, self._record_table + index * RECORD.size))
+
+    def __iter__(self) -> Iterator['CatalogRecord']:
+        for index in range(self.count):
+            yield self[index]
+
+    def string(self, string_id: int) -> Optional[str]:
+        if string_id == NONE:
+            return None
+        offset, length = STRING_REF.unpack_from(self._map, self._string_table + string_id * STRING_REF.size)
+        start = self._string_bytes + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def list_items(self, start: int, count: int) -> tuple:
+        return struct.unpack_from(f'<{count}I', self._map, self._list_table + 4 * start)
+
+    def key_order(self, string_id: int) -> tuple:
+        keys = self._key_orders.get(string_id)
+        if keys is None:
+            keys = self._key_orders[string_id] = tuple(json.loads(self.string(string_id)))
+        return keys
+
+    def find(self, course_number: str) -> Optional['CatalogRecord']:
+        """The course with a given course number, or None (one hash probe sequence)"""
+        if not str(course_number).isdigit():
+            return None
+        number = int(course_number)
+        mask = self.slots - 1
+        slot = slot_for(number, mask)
+        while True:
+            key, index = HASH_SLOT.unpack_from(self._map, self._number_index + slot * HASH_SLOT.size)
+            if key == NONE:
+                return None
+            if key == number:
+                return self[index]
+            slot = (slot + 1) & mask
+
+# Position of each field's value(s) in an unpacked record
+_FIELD_POSITIONS = {}
+_position = 2
+for _key in STRING_FIELDS:
+    _FIELD_POSITIONS[_key] = ('str', _position)
+    _position += 1
+for _bit, _key in enumerate(NUMBER_FIELDS):
+    _FIELD_POSITIONS[_key] = ('number', _position, _bit)
+    _position += 1
+_INT_BITS = _position
+_position += 1
+for _key in INT_FIELDS:
+    _FIELD_POSITIONS[_key] = ('int', _position)
+    _position += 1
+_BOOL_BITS = _position
+_position += 1
+for _bit, _key in enumerate(BOOL_FIELDS):
+    _FIELD_POSITIONS[_key] = ('bool', _BOOL_BITS, _bit)
+for _key, _kind in LIST_FIELDS.items():
+    _FIELD_POSITIONS[_key] = ('list', _position, _kind)
+    _position += 2
+
+class CatalogRecord:
+    """One course, decoding fields from the mapped file as they are read"""
+
+    __slots__ = ('_catalog', 'index', '_values', '_extras')
+
+    def __init__(self, catalog: BinaryCatalog, index: int, values: tuple):
+        self._catalog = catalog
+        self.index = index
+        self._values = values
+        self._extras = None
+
+    def keys(self) -> tuple:
+        return self._catalog.key_order(self._values[0])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self.keys() else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys():
+            raise KeyError(key)
+
+        if self._values[1] != NONE:
+            if self._extras is None:
+                self._extras = json.loads(self._catalog.string(self._values[1]))
+            if key in self._extras:
+                return self._extras[key]
+
+        kind, position, *rest = _FIELD_POSITIONS[key]
+        value = self._values[position]
+        if kind == 'str':
+            return self._catalog.string(value)
+        if kind == 'number':
+            if math.isnan(value):
+                return None
+            return int(value) if self._values[_INT_BITS] >> rest[0] & 1 else value
+        if kind == 'int':
+            return value
+        if kind == 'bool':
+            return bool(value >> rest[0] & 1)
+        items = self._catalog.list_items(value, self._values[position + 1])
+        return list(items) if rest[0] == 'int' else [self._catalog.string(i) for i in items]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self.keys()}
+
+def bench(json_path: str, copies: int):
+    """Compare json.load with opening a .wcat of the same catalog copied N times"""
+    import os
+    import random
+    import tempfile
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    courses = data['courses'] * copies
+
+    with tempfile.TemporaryDirectory(prefix='wcat_') as workdir:
+        big_json = os.path.join(workdir, 'catalog.json')
+        big_wcat = os.path.join(workdir, 'catalog.wcat')
+        with open(big_json, 'w', encoding='utf-8') as f:
+            json.dump({'courses': courses}, f, ensure_ascii=False)
+
+        start = time.perf_counter()
+        write_catalog(courses, big_wcat)
+        print(f"{len(courses)} courses, wrote .wcat in {time.perf_counter() - start:.2f}s "
+              f"({os.path.getsize(big_wcat) / 1e6:.1f} MB vs {os.path.getsize(big_json) / 1e6:.1f} MB JSON)")
+
+        start = time.perf_counter()
+        with open(big_json, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)['courses']
+        json_seconds = time.perf_counter() - start
+        name = loaded[len(loaded) // 2]['full_name']
+        print(f"  json.load + read one field: {json_seconds:.3f}s ({name})")
+
+        start = time.perf_counter()
+        with BinaryCatalog(big_wcat) as catalog:
+            name = catalog[len(catalog) // 2]['full_name']
+            open_seconds = time.perf_counter() - start
+
+            picks = [random.randrange(len(catalog)) for _ in range(10000)]
+            start = time.perf_counter()
+            for index in picks:
+                catalog[index]['pathway']
+            index_seconds = (time.perf_counter() - start) / len(picks)
+
+            numbers = [str(n).zfill(6) for c in data['courses'] for n in record_numbers(c)]
+            start = time.perf_counter()
+            for number in numbers:
+                catalog.find(number)
+            find_seconds = (time.perf_counter() - start) / max(1, len(numbers))
+
+            matches = all(catalog[i].to_dict() == courses[i] for i in range(len(data['courses'])))
+
+        print(f"  mmap open + read one field: {open_seconds * 1000:.2f}ms ({name})")
+        print(f"  random record field read: {index_seconds * 1e6:.1f}us, find by number: {find_seconds * 1e6:.1f}us")
+        print(f"  records round-trip: {matches}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory-mapped binary course catalog")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Convert a catalog JSON file to .wcat")
+    build.add_argument('json_path', nargs='?', default="src/data/courses_complete.json")
+    build.add_argument('wcat_path', nargs='?', default="courses_complete.wcat")
+
+    get = commands.add_parser('get', help="Print one course by course number or index")
+    get.add_argument('wcat_path')
+    get.add_argument('key', help="Course number, or #index")
+
+    timing = commands.add_parser('bench', help="Time loading against json.load")
+    timing.add_argument('json_path', nargs='?', default="src/data/courses_complete.json")
+    timing.add_argument('--copies', type=int, default=500, help="Copies of the catalog to load")
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        with open(args.json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        courses = data['courses'] if isinstance(data, dict) else data
+        write_catalog(courses, args.wcat_path)
+        print(f"Wrote {len(courses)} courses to {args.wcat_path}")
+
+    elif args.command == 'get':
+        with BinaryCatalog(args.wcat_path) as catalog:
+            if args.key.startswith('#'):
+                record = catalog[int(args.key[1:])]
+            else:
+                record = catalog.find(args.key)
+            if record is None:
+                print(f"No course with number {args.key}")
+                sys.exit(1)
+            print(json.dumps(record.to_dict(), indent=2, ensure_ascii=False))
+
+    else:
+        bench(args.json_path, args.copies)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Compact catalog bundle for the planner frontend.
+Turns src/data/courses_complete.json into a columnar bundle: repeated
+values (pathways, terms, categories, grade arrays, key orders) become one
+array of small integer codes per field, indexing per-field dictionaries,
+and only the mostly-unique text is kept per course. src/utils/catalogBundle.js decodes it
+back into the exact catalog object. The bundle is also written
+precompressed as .gz (and .br when the brotli package is installed).
+Descriptions are left out unless --keep-notes is given; the app loads them
+on demand from the store description_store.py builds. Derived fields
+(course_enrichment.py, ranking_features.py), the eligibility matrix
+(eligibility_matrix.py) and the alternate ID index (alternate_ids.py) are
+added here.
+
+    python3 catalog_bundle.py
+    python3 catalog_bundle.py src/data/courses_complete.json -o src/data/courses_bundle.json
+
+Re-run after any fixer changes courses_complete.json.
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from typing import List, Dict, Any, Optional
+
+from alternate_ids import add_alternate_index
+from course_enrichment import enrich_catalog
+from description_store import core_catalog
+from eligibility_matrix import add_eligibility
+from ranking_features import add_rank_features
+
+CATALOG_PATH = "src/data/courses_complete.json"
+BUNDLE_PATH = "src/data/courses_bundle.json"
+BUNDLE_FORMAT = 1
+
+# Column holding each course's key order (dictionary-encoded like any other)
+KEYS_COLUMN = '_keys'
+
+def value_key(value: Any) -> str:
+    """Hashable identity of a JSON value (so 10 and 10.0 stay distinct)"""
+    return json.dumps(value, ensure_ascii=False)
+
+def encode_column(values: List[Any]) -> Optional[Dict[str, Any]]:
+    """A column as {"dict", "codes"}, or None when its values rarely repeat
+
+    Dictionary encoding pays off once each distinct value is used at least
+    twice on average.
+    """
+    dictionary = []
+    codes = []
+    seen = {}
+    for value in values:
+        key = value_key(value)
+        code = seen.get(key)
+        if code is None:
+            code = seen[key] = len(dictionary)
+            dictionary.append(value)
+        codes.append(code)
+
+    if len(dictionary) * 2 <= len(values):
+        return {'dict': dictionary, 'codes': codes}
+    return None
+
+def build_bundle(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Columnar, dictionary-encoded form of a catalog
+
+    Fields that don't dictionary-encode (names, notes, prerequisite text)
+    stay together per course in "rows": the prerequisite text repeats parts
+    of the notes, and gzip only finds those repeats when they are close.
+    """
+    courses = data['courses']
+    fields = []
+    for course in courses:
+        for key in course:
+            if key not in fields:
+                fields.append(key)
+    field_index = {field: i for i, field in enumerate(fields)}
+
+    # Absent keys are null; the key order says which keys a course has
+    columns = {KEYS_COLUMN: encode_column([[field_index[k] for k in course] for course in courses])}
+    row_fields = []
+    for field in fields:
+        column = encode_column([course.get(field) for course in courses])
+        if column is None:
+            row_fields.append(field)
+        else:
+            columns[field] = column
+
+    return {
+        'format': BUNDLE_FORMAT,
+        'meta': {k: v for k, v in data.items() if k != 'courses'},
+        'count': len(courses),
+        'fields': fields,
+        'columns': columns,
+        'row_fields': row_fields,
+        'rows': [[course.get(field) for field in row_fields] for course in courses]
+    }
+
+def decode_bundle(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    """The catalog a bundle was built from (mirrors decodeCatalog in JS)"""
+    columns = bundle['columns']
+    fields = bundle['fields']
+    row_position = {field: i for i, field in enumerate(bundle['row_fields'])}
+    keys = columns[KEYS_COLUMN]
+
+    courses = []
+    for i, row in enumerate(bundle['rows']):
+        course = {}
+        for f in keys['dict'][keys['codes'][i]]:
+            field = fields[f]
+            if field in row_position:
+                course[field] = row[row_position[field]]
+            else:
+                column = columns[field]
+                course[field] = column['dict'][column['codes'][i]]
+        courses.append(course)
+
+    data = dict(bundle['meta'])
+    data['courses'] = courses
+    return data
+
+def frontend_catalog(data: Dict[str, Any], keep_notes: bool = False) -> Dict[str, Any]:
+    """The catalog as the app loads it: descriptions split out, derived fields added"""
+    if not keep_notes:
+        data = core_catalog(data)
+    return add_alternate_index(add_eligibility(add_rank_features(enrich_catalog(data))))
+
+def compress(raw: bytes) -> Dict[str, Optional[bytes]]:
+    """gzip and (if available) brotli encodings of a file's bytes"""
+    # mtime=0 keeps the .gz byte-identical between builds
+    encodings = {'gz': gzip.compress(raw, compresslevel=9, mtime=0), 'br': None}
+    try:
+        import brotli
+        encodings['br'] = brotli.compress(raw, quality=11)
+    except ImportError:
+        pass
+    return encodings
+
+def write_bundle(bundle: Dict[str, Any], path: str) -> Dict[str, Optional[int]]:
+    """Write the bundle and its precompressed copies; returns their sizes"""
+    raw = json.dumps(bundle, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(raw)
+
+    sizes = {'raw': len(raw)}
+    for encoding, content in compress(raw).items():
+        sizes[encoding] = None
+        if content is not None:
+            with open(f"{path}.{encoding}", 'wb') as f:
+                f.write(content)
+            sizes[encoding] = len(content)
+    return sizes
+
+def time_best(fn, repeat: int = 20) -> float:
+    """Fastest of several runs, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def format_size(size: Optional[int]) -> str:
+    return f"{size / 1024:.1f} KB" if size is not None else "-"
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the compact catalog bundle for the frontend")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('-o', '--output', default=BUNDLE_PATH)
+    parser.add_argument('--keep-notes', action='store_true',
+                        help="Keep descriptions in the bundle instead of the description store")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'rb') as f:
+        original = f.read()
+    data = json.loads(original)
+    data = frontend_catalog(data, args.keep_notes)
+
+    bundle = build_bundle(data)
+    if decode_bundle(bundle) != data:
+        print("ERROR: bundle does not decode back to the catalog")
+        sys.exit(1)
+
+    sizes = write_bundle(bundle, args.output)
+    original_sizes = {'raw': len(original)}
+    original_sizes.update({k: len(v) if v else None for k, v in compress(original).items()})
+
+    encoded = len(bundle['fields']) - len(bundle['row_fields'])
+    print(f"Bundled {bundle['count']} courses: {encoded}/{len(bundle['fields'])} fields dictionary-encoded")
+    print(f"Saved to {args.output}")
+    if sizes['br'] is None:
+        print("(brotli not installed, skipped .br)")
+
+    print(f"\n  {'':<10} {'catalog':>10} {'bundle':>10} {'saved':>7}")
+    for encoding in ('raw', 'gz', 'br'):
+        before, after = original_sizes[encoding], sizes[encoding]
+        saved = f"{100 * (1 - after / before):.0f}%" if before and after else "-"
+        print(f"  {encoding:<10} {format_size(before):>10} {format_size(after):>10} {saved:>7}")
+
+    with open(args.output, 'rb') as f:
+        bundled = f.read()
+    parse_ms = time_best(lambda: json.loads(original))
+    decode_ms = time_best(lambda: decode_bundle(json.loads(bundled)))
+    print(f"\n  parse catalog:          {parse_ms:.2f} ms")
+    print(f"  parse + decode bundle:  {decode_ms:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Department sectioning for the Westview course catalog.
+Reads the table of contents (or, failing that, the department headings at the
+top of each page) and maps every page range under COURSE DESCRIPTIONS to its
+department and pathway.
+"""
+
+import re
+from bisect import bisect_right
+from typing import List, Dict, Optional
+
+# TOC entries look like "Mathematics.............30"
+TOC_ENTRY_PATTERN = re.compile(r'^(.+?)\s*\.{3,}\s*(\d+)\s*$')
+
+# Department headings repeat the A-G category on the same line,
+# e.g. "History/Social Science UC/CSU “A”"
+HEADING_SUFFIX_PATTERN = re.compile(r'\s*UC/CSU\s*[“"\']?[A-G]?[”"\']?\s*$')
+
+# Only look this far into the TOC / heading band of a page
+TOC_SEARCH_PAGES = 5
+HEADING_BAND = 60
+
+# Department -> pathway (same names determine_pathway returns, so the
+# consolidation scripts keep working). None means the department mixes
+# subjects and the pathway still has to come from the course itself.
+SECTION_PATHWAYS = {
+    'history/social science': 'History/Social Science',
+    'english': 'English',
+    'mathematics': 'Mathematics',
+    'science - biological': 'Science - Biological',
+    'science - physical': 'Science - Physical',
+    'world language': 'World Language',
+    'fine arts - performing': 'Visual & Performing Arts',
+    'fine arts - visual': 'Visual & Performing Arts',
+    'physical education/health': 'Physical Education',
+    "junior reserve officers' training corps": 'Physical Education',
+    'electives': 'Elective',
+    'academic support': 'Elective',
+    'avid': 'Elective',
+    'business & finance': 'Career Technical Education',
+    'engineering & architecture': 'Computer Science & Engineering',
+    'information & communication technology': 'Computer Science & Engineering',
+    'journalism': 'Elective',
+    'school service & leadership': 'Elective',
+    'social science/english electives': None,
+    'dual enrollment': None,
+    'english language development': 'English',
+    'special education': None,
+}
+
+def normalize_title(title: str) -> str:
+    """Normalize a section title for lookup (case, quotes, spacing)"""
+    title = title.replace('’', "'").replace('‘', "'")
+    title = HEADING_SUFFIX_PATTERN.sub('', title)
+    return re.sub(r'\s+', ' ', title).strip().lower()
+
+def is_known_section(title: str) -> bool:
+    """Check if a title is one of the catalog's course departments"""
+    return normalize_title(title) in SECTION_PATHWAYS
+
+def section_pathway(title: str) -> Optional[str]:
+    """Pathway for a department, or None if it has to be guessed per course"""
+    return SECTION_PATHWAYS.get(normalize_title(title))
+
+def parse_toc(toc_text: str) -> List[Dict]:
+    """Parse the COURSE DESCRIPTIONS part of the table of contents"""
+    entries = []
+    in_courses = False
+
+    for line in toc_text.split('\n'):
+        line = line.strip()
+
+        if line.upper() == 'COURSE DESCRIPTIONS':
+            in_courses = True
+            continue
+
+        match = TOC_ENTRY_PATTERN.match(line)
+        if not match:
+            # Another all-caps part heading ends the course listing
+            if in_courses and line.isupper() and entries:
+                break
+            continue
+
+        if in_courses:
+            entries.append({
+                'title': match.group(1).strip(),
+                'start_page': int(match.group(2))
+            })
+
+    return entries
+
+def build_sections(entries: List[Dict], total_pages: int) -> List[Dict]:
+    """Turn TOC entries into page ranges with pathways
+
+    Page numbers are 1-based. A parent heading that shares its start page
+    with its first subsection (Electives / Academic Support) ends up with a
+    one-page range that the subsection overrides in section_for_page.
+    """
+    entries = sorted(entries, key=lambda e: e['start_page'])
+    sections = []
+
+    for i, entry in enumerate(entries):
+        if i + 1 < len(entries):
+            end_page = max(entries[i + 1]['start_page'] - 1, entry['start_page'])
+        else:
+            end_page = total_pages
+
+        sections.append({
+            'title': entry['title'],
+            'pathway': section_pathway(entry['title']),
+            'start_page': entry['start_page'],
+            'end_page': end_page
+        })
+
+    return sections
+
+def find_toc_sections(pdf) -> List[Dict]:
+    """Find sections from the table of contents in the first few pages"""
+    for page in pdf.pages[:TOC_SEARCH_PAGES]:
+        text = page.extract_text() or ''
+        if 'TABLE OF CONTENTS' not in text.upper():
+            continue
+        entries = parse_toc(text)
+        if entries:
+            return build_sections(entries, len(pdf.pages))
+    return []
+
+def find_heading_sections(pdf) -> List[Dict]:
+    """Find sections from department headings at the top of each page
+
+    Used when the catalog has no usable table of contents. Only the heading
+    band of each page is extracted, so this stays cheap.
+    """
+    entries = []
+    for page_no, page in enumerate(pdf.pages, 1):
+        band = page.crop((0, 0, page.width, min(HEADING_BAND, page.height)))
+        for line in (band.extract_text() or '').split('\n')[:2]:
+            if is_known_section(line):
+                entries.append({
+                    'title': HEADING_SUFFIX_PATTERN.sub('', line).strip(),
+                    'start_page': page_no
+                })
+                break
+
+    return build_sections(entries, len(pdf.pages))
+
+def find_sections(pdf) -> List[Dict]:
+    """Department sections for an open pdfplumber document"""
+    sections = find_toc_sections(pdf)
+    if not sections:
+        print("No table of contents found, scanning page headings...")
+        sections = find_heading_sections(pdf)
+    return sections
+
+def section_for_page(sections: List[Dict], page_no: int) -> Optional[Dict]:
+    """Section containing a 1-based page number (latest start page wins)"""
+    starts = [s['start_page'] for s in sections]
+    i = bisect_right(starts, page_no) - 1
+    if i < 0 or page_no > sections[i]['end_page']:
+        return None
+    return sections[i]
+
+def shard_sections(sections: List[Dict]) -> List[Dict]:
+    """Sections with overlapping parent headings removed, ready to parse
+
+    Each page belongs to exactly one shard, so shards can be parsed
+    independently without duplicating courses.
+    """
+    shards = []
+    for i, section in enumerate(sections):
+        next_start = sections[i + 1]['start_page'] if i + 1 < len(sections) else None
+        if next_start is not None and next_start <= section['start_page']:
+            continue
+        shards.append(section)
+    return shards
+
+def find_section(sections: List[Dict], title: str) -> Optional[Dict]:
+    """Look up a section by title (case-insensitive)"""
+    wanted = normalize_title(title)
+    for section in sections:
+        if normalize_title(section['title']) == wanted:
+            return section
+    return None
+
+def main():
+    import sys
+    import pdfplumber
+
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else "Westview Course Catalog 2025-2026.pdf"
+
+    with pdfplumber.open(pdf_path) as pdf:
+        sections = find_sections(pdf)
+
+    print(f"Found {len(sections)} sections\n")
+    for section in sections:
+        pathway = section['pathway'] or '(per course)'
+        print(f"  pages {section['start_page']:3d}-{section['end_page']:3d}  {section['title']}  →  {pathway}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+SQLite store for catalog editions.
+Each imported JSON catalog (parser output, courses_complete.json, backups)
+becomes an edition. Courses are stored one table per entity with indexes
+on course number, pathway, grade and UC/CSU category, and an FTS5 index
+over names and descriptions, so cross-edition queries don't have to scan
+JSON. Fix scripts can run against an edition as a single transaction.
+
+    python3 catalog_store.py import src/data/courses_complete.json westview_courses_final.json
+    python3 catalog_store.py search "marine biology"
+    python3 catalog_store.py find 001395
+    python3 catalog_store.py query --edition courses_complete --pathway Math --grade 9
+    python3 catalog_store.py fix courses_complete fix_english_terms:fix_english_terms
+    python3 catalog_store.py export courses_complete out.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator
+
+DEFAULT_DB_PATH = "catalog.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS editions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    source_path TEXT,
+    generated_for TEXT,
+    schema_version TEXT,
+    imported_at TEXT NOT NULL,
+    course_count INTEGER NOT NULL DEFAULT 0,
+    -- Top-level keys other than courses, as JSON in their original order
+    -- (courses is kept as a null placeholder for its position)
+    metadata TEXT
+);
+
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY,
+    edition_id INTEGER NOT NULL REFERENCES editions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    course_id TEXT,
+    full_name TEXT,
+    credits REAL,
+    credit_type TEXT,
+    uc_csu_category TEXT,
+    pathway TEXT,
+    term_length TEXT,
+    is_replacement_course INTEGER,
+    is_ap_or_honors_pair INTEGER,
+    pair_course_id TEXT,
+    fall_to_spring_dependency INTEGER,
+    category_priority INTEGER,
+    is_graduation_requirement INTEGER,
+    semester_restrictions TEXT,
+    notes TEXT,
+    -- Keys in their original order and any values kept as JSON, so an
+    -- edition exports back exactly as it was imported
+    key_order TEXT NOT NULL,
+    extra_json TEXT
+);
+CREATE INDEX IF NOT EXISTS courses_edition ON courses(edition_id, position);
+CREATE INDEX IF NOT EXISTS courses_course_id ON courses(course_id);
+CREATE INDEX IF NOT EXISTS courses_pathway ON courses(edition_id, pathway);
+CREATE INDEX IF NOT EXISTS courses_uc_csu ON courses(edition_id, uc_csu_category);
+
+CREATE TABLE IF NOT EXISTS course_numbers (
+    course_pk INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    number TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS course_numbers_number ON course_numbers(number);
+CREATE INDEX IF NOT EXISTS course_numbers_course ON course_numbers(course_pk);
+
+CREATE TABLE IF NOT EXISTS course_grades (
+    course_pk INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    grade INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS course_grades_grade ON course_grades(grade, course_pk);
+CREATE INDEX IF NOT EXISTS course_grades_course ON course_grades(course_pk);
+
+CREATE TABLE IF NOT EXISTS course_terms (
+    course_pk INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    term TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS course_terms_course ON course_terms(course_pk);
+
+-- Prerequisite text and resolved ids; kind is the JSON field name
+CREATE TABLE IF NOT EXISTS course_prerequisites (
+    course_pk INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS course_prerequisites_course ON course_prerequisites(course_pk);
+
+-- Linked, replacement and alternate course references
+CREATE TABLE IF NOT EXISTS course_relations (
+    course_pk INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS course_relations_course ON course_relations(course_pk);
+CREATE INDEX IF NOT EXISTS course_relations_value ON course_relations(value);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5(
+    full_name, notes, content='courses', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS courses_fts_insert AFTER INSERT ON courses BEGIN
+    INSERT INTO courses_fts(rowid, full_name, notes) VALUES (new.id, new.full_name, new.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS courses_fts_delete AFTER DELETE ON courses BEGIN
+    INSERT INTO courses_fts(courses_fts, rowid, full_name, notes)
+    VALUES ('delete', old.id, old.full_name, old.notes);
+END;
+"""
+
+# Scalar JSON fields stored as columns of courses
+COLUMNS = [
+    'course_id', 'full_name', 'credits', 'credit_type', 'uc_csu_category', 'pathway',
+    'term_length', 'is_replacement_course', 'is_ap_or_honors_pair', 'pair_course_id',
+    'fall_to_spring_dependency', 'category_priority', 'is_graduation_requirement',
+    'semester_restrictions', 'notes',
+]
+BOOL_COLUMNS = {
+    'is_replacement_course', 'is_ap_or_honors_pair', 'fall_to_spring_dependency',
+    'is_graduation_requirement',
+}
+
+# List JSON fields -> (table, value column, kind or None)
+LIST_TABLES = {
+    'course_numbers': ('course_numbers', 'number', None),
+    'grades_allowed': ('course_grades', 'grade', None),
+    'offered_terms': ('course_terms', 'term', None),
+    'prerequisites_required': ('course_prerequisites', 'value', 'prerequisites_required'),
+    'prerequisites_recommended': ('course_prerequisites', 'value', 'prerequisites_recommended'),
+    'prerequisites_required_ids': ('course_prerequisites', 'value', 'prerequisites_required_ids'),
+    'prerequisites_recommended_ids': ('course_prerequisites', 'value', 'prerequisites_recommended_ids'),
+    'linked_courses': ('course_relations', 'value', 'linked_courses'),
+    'replacement_equivalents': ('course_relations', 'value', 'replacement_equivalents'),
+    'alternate_ids': ('course_relations', 'value', 'alternate_ids'),
+}
+
+def column_value(key: str, value: Any) -> Any:
+    """SQLite value for a scalar field, or raises TypeError if it needs JSON"""
+    if key in BOOL_COLUMNS:
+        if not isinstance(value, bool):
+            raise TypeError(key)
+        return int(value)
+    if key == 'credits':
+        if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool)):
+            raise TypeError(key)
+        return value
+    if key == 'category_priority':
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(key)
+        return value
+    if value is not None and not isinstance(value, str):
+        raise TypeError(key)
+    return value
+
+def list_storable(key: str, value: Any) -> bool:
+    if not isinstance(value, list):
+        return False
+    if key == 'grades_allowed':
+        return all(isinstance(v, int) and not isinstance(v, bool) for v in value)
+    return all(isinstance(v, str) for v in value)
+
+class CatalogStore:
+    """Catalog editions in one SQLite database"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        # Databases created before editions kept their top-level metadata
+        edition_columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(editions)")}
+        if 'metadata' not in edition_columns:
+            self.conn.execute("ALTER TABLE editions ADD COLUMN metadata TEXT")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'CatalogStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Import / export
+
+    def import_catalog(self, path: str, edition: Optional[str] = None) -> int:
+        """Load a catalog JSON file as an edition, replacing one of the same name"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        courses = data['courses'] if isinstance(data, dict) else data
+        meta = data if isinstance(data, dict) else {}
+        name = edition or edition_name(path)
+
+        with self.conn:
+            self.conn.execute("DELETE FROM editions WHERE name = ?", (name,))
+            edition_id = self.conn.execute(
+                "INSERT INTO editions (name, source_path, generated_for, schema_version, imported_at,"
+                " course_count, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, path, meta.get('generated_for'), meta.get('schema_version'),
+                 time.strftime('%Y-%m-%dT%H:%M:%S'), len(courses),
+                 json.dumps({key: None if key == 'courses' else value for key, value in meta.items()},
+                            ensure_ascii=False) if meta else None)
+            ).lastrowid
+            self._insert_courses(edition_id, courses)
+
+        return edition_id
+
+    def _insert_courses(self, edition_id: int, courses: List[Dict]):
+        rows = {table: [] for table, _, _ in LIST_TABLES.values()}
+
+        for position, course in enumerate(courses):
+            if hasattr(course, 'to_dict'):
+                course = course.to_dict()
+
+            values = {}
+            extra = {}
+            for key, value in course.items():
+                if key in COLUMNS:
+                    try:
+                        values[key] = column_value(key, value)
+                    except TypeError:
+                        extra[key] = value
+                    # The REAL column answers queries; the JSON copy keeps 10 from
+                    # coming back as 10.0
+                    if key == 'credits' and isinstance(value, int) and not isinstance(value, bool):
+                        extra[key] = value
+                elif key in LIST_TABLES and list_storable(key, value):
+                    pass
+                else:
+                    extra[key] = value
+
+            course_pk = self.conn.execute(
+                f"INSERT INTO courses (edition_id, position, key_order, extra_json, {', '.join(COLUMNS)})"
+                f" VALUES (?, ?, ?, ?, {', '.join('?' * len(COLUMNS))})",
+                [edition_id, position, json.dumps(list(course)),
+                 json.dumps(extra, ensure_ascii=False) if extra else None]
+                + [values.get(key) for key in COLUMNS]
+            ).lastrowid
+
+            # Catalogs without course_numbers (courses_complete.json) are indexed
+            # by the numbers in their course_id; export skips these rows since
+            # the key isn't in key_order
+            if 'course_numbers' not in course or 'course_numbers' in extra:
+                derived = re.findall(r'\d{6}', str(course.get('course_id') or ''))
+                rows['course_numbers'].extend((course_pk, i, n) for i, n in enumerate(derived))
+
+            for key, (table, column, kind) in LIST_TABLES.items():
+                if key in extra or key not in course:
+                    continue
+                for i, value in enumerate(course[key]):
+                    rows[table].append((course_pk, i, value) if kind is None else (course_pk, kind, i, value))
+
+        for key, (table, column, kind) in LIST_TABLES.items():
+            if not rows[table]:
+                continue
+            if kind is None:
+                self.conn.executemany(f"INSERT INTO {table} (course_pk, position, {column}) VALUES (?, ?, ?)",
+                                      rows[table])
+            else:
+                self.conn.executemany(f"INSERT INTO {table} (course_pk, kind, position, {column}) VALUES (?, ?, ?, ?)",
+                                      rows[table])
+            rows[table] = []
+
+    def export_catalog(self, edition: str) -> Dict[str, Any]:
+        """An edition as catalog JSON data, as it was imported"""
+        row = self._edition(edition)
+        if row['metadata'] is not None:
+            data = json.loads(row['metadata'])
+            data['courses'] = self.load_courses(row['id'])
+            return data
+
+        data = {}
+        if row['generated_for'] is not None:
+            data['generated_for'] = row['generated_for']
+        if row['schema_version'] is not None:
+            data['schema_version'] = row['schema_version']
+        data['courses'] = self.load_courses(row['id'])
+        return data
+
+    def load_courses(self, edition_id: int, where: str = "", params: tuple = ()) -> List[Dict]:
+        """Rebuild course dicts for an edition (optionally filtered)"""
+        rows = self.conn.execute(
+            f"SELECT * FROM courses WHERE edition_id = ? {where} ORDER BY position",
+            (edition_id,) + params
+        ).fetchall()
+        return self._build_courses(rows)
+
+    def _build_courses(self, rows: List[sqlite3.Row]) -> List[Dict]:
+        if not rows:
+            return []
+        pks = [row['id'] for row in rows]
+        lists = {pk: {} for pk in pks}
+
+        # One query per list table for the whole batch
+        marks = ', '.join('?' * len(pks))
+        for table, column, has_kind in [('course_numbers', 'number', False), ('course_grades', 'grade', False),
+                                        ('course_terms', 'term', False), ('course_prerequisites', 'value', True),
+                                        ('course_relations', 'value', True)]:
+            kind_column = 'kind' if has_kind else 'NULL'
+            for course_pk, kind, value in self.conn.execute(
+                    f"SELECT course_pk, {kind_column}, {column} FROM {table}"
+                    f" WHERE course_pk IN ({marks}) ORDER BY course_pk, position", pks):
+                lists[course_pk].setdefault(kind or table, []).append(value)
+
+        table_keys = {'course_numbers': 'course_numbers', 'grades_allowed': 'course_grades',
+                      'offered_terms': 'course_terms'}
+        courses = []
+        for row in rows:
+            extra = json.loads(row['extra_json']) if row['extra_json'] else {}
+            found = lists[row['id']]
+            course = {}
+            for key in json.loads(row['key_order']):
+                if key in extra:
+                    course[key] = extra[key]
+                elif key in COLUMNS:
+                    value = row[key]
+                    course[key] = bool(value) if key in BOOL_COLUMNS and value is not None else value
+                else:
+                    course[key] = found.get(table_keys.get(key, key), [])
+            courses.append(course)
+        return courses
+
+    # Queries
+
+    def _edition(self, edition: str) -> sqlite3.Row:
+        row = self.conn.execute("SELECT * FROM editions WHERE name = ?", (edition,)).fetchone()
+        if row is None:
+            raise ValueError(f"No edition named '{edition}'")
+        return row
+
+    def editions(self) -> List[Dict]:
+        return [dict(row) for row in self.conn.execute("SELECT * FROM editions ORDER BY id")]
+
+    def find_by_number(self, number: str, edition: Optional[str] = None) -> List[Dict]:
+        """Courses with a course number, in every edition (or one)"""
+        sql = ("SELECT DISTINCT c.*, e.name AS edition FROM course_numbers n"
+               " JOIN courses c ON c.id = n.course_pk JOIN editions e ON e.id = c.edition_id"
+               " WHERE n.number = ?")
+        params = [number]
+        if edition:
+            sql += " AND e.name = ?"
+            params.append(edition)
+        rows = self.conn.execute(sql + " ORDER BY e.id", params).fetchall()
+        return self._with_edition(rows)
+
+    def query(self, edition: str, pathway: Optional[str] = None, grade: Optional[int] = None,
+              uc_csu: Optional[str] = None) -> List[Dict]:
+        """Courses in an edition matching every given filter"""
+        where = ""
+        params = []
+        if pathway:
+            where += " AND pathway = ?"
+            params.append(pathway)
+        if uc_csu:
+            where += " AND uc_csu_category = ?"
+            params.append(uc_csu)
+        if grade is not None:
+            where += " AND id IN (SELECT course_pk FROM course_grades WHERE grade = ?)"
+            params.append(grade)
+        return self.load_courses(self._edition(edition)['id'], where, tuple(params))
+
+    def search(self, text: str, edition: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Full-text search over names and descriptions, best matches first"""
+        sql = ("SELECT c.*, e.name AS edition FROM courses_fts f"
+               " JOIN courses c ON c.id = f.rowid JOIN editions e ON e.id = c.edition_id"
+               " WHERE courses_fts MATCH ?")
+        params = [fts_query(text)]
+        if edition:
+            sql += " AND e.name = ?"
+            params.append(edition)
+        sql += " ORDER BY bm25(courses_fts) LIMIT ?"
+        params.append(limit)
+        return self._with_edition(self.conn.execute(sql, params).fetchall())
+
+    def _with_edition(self, rows: List[sqlite3.Row]) -> List[Dict]:
+        courses = self._build_courses(rows)
+        for course, row in zip(courses, rows):
+            course['_edition'] = row['edition']
+        return courses
+
+    # Editing
+
+    @contextmanager
+    def edit(self, edition: str) -> Iterator[List[Dict]]:
+        """Edit an edition's courses as a list of dicts, saved in one transaction
+
+        Changes are written back when the block exits normally; if it raises,
+        the edition is left as it was.
+        """
+        row = self._edition(edition)
+        courses = self.load_courses(row['id'])
+        yield courses
+
+        with self.conn:
+            self.conn.execute("DELETE FROM courses WHERE edition_id = ?", (row['id'],))
+            self._insert_courses(row['id'], courses)
+            self.conn.execute("UPDATE editions SET course_count = ? WHERE id = ?", (len(courses), row['id']))
+
+def edition_name(path: str) -> str:
+    """Default edition name for a catalog file (its name without .json)"""
+    name = os.path.basename(path)
+    return name.replace('.json', '') if name.endswith('.json') or '.json.' in name else name
+
+def fts_query(text: str) -> str:
+    """Quote each word so user text can't be read as FTS5 syntax"""
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+def print_courses(courses: List[Dict]):
+    for course in courses:
+        edition = f"[{course['_edition']}] " if '_edition' in course else ''
+        print(f"  {edition}{course.get('course_id')}: {course.get('full_name')} "
+              f"({course.get('pathway')}, grades {course.get('grades_allowed')})")
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite store for catalog editions")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    load = commands.add_parser('import', help="Import catalog JSON files as editions")
+    load.add_argument('paths', nargs='+')
+    load.add_argument('--edition', help="Edition name (only with one path)")
+
+    commands.add_parser('list', help="List editions")
+
+    search = commands.add_parser('search', help="Full-text search names and descriptions")
+    search.add_argument('text')
+    search.add_argument('--edition')
+    search.add_argument('--limit', type=int, default=20)
+
+    find = commands.add_parser('find', help="Find a course number across editions")
+    find.add_argument('number')
+    find.add_argument('--edition')
+
+    query = commands.add_parser('query', help="Filter one edition's courses")
+    query.add_argument('--edition', required=True)
+    query.add_argument('--pathway')
+    query.add_argument('--grade', type=int)
+    query.add_argument('--uc-csu')
+
+    fix = commands.add_parser('fix', help="Run a fixer function (module:function) on an edition")
+    fix.add_argument('edition')
+    fix.add_argument('fixer', help="e.g. fix_english_terms:fix_english_terms")
+
+    export = commands.add_parser('export', help="Write an edition back to JSON")
+    export.add_argument('edition')
+    export.add_argument('output')
+
+    args = parser.parse_args()
+
+    with CatalogStore(args.db) as store:
+        start = time.perf_counter()
+
+        if args.command == 'import':
+            if args.edition and len(args.paths) > 1:
+                parser.error("--edition needs a single path")
+            for path in args.paths:
+                store.import_catalog(path, args.edition)
+                print(f"Imported {path} as '{args.edition or edition_name(path)}'")
+
+        elif args.command == 'list':
+            for edition in store.editions():
+                print(f"  {edition['name']}: {edition['course_count']} courses "
+                      f"(from {edition['source_path']}, {edition['imported_at']})")
+
+        elif args.command == 'search':
+            print_courses(store.search(args.text, args.edition, args.limit))
+
+        elif args.command == 'find':
+            print_courses(store.find_by_number(args.number, args.edition))
+
+        elif args.command == 'query':
+            print_courses(store.query(args.edition, args.pathway, args.grade, args.uc_csu))
+
+        elif args.command == 'fix':
+            module_name, _, function_name = args.fixer.partition(':')
+            try:
+                fixer = getattr(importlib.import_module(module_name), function_name or module_name)
+            except (ImportError, AttributeError) as e:
+                print(f"ERROR: {e}")
+                sys.exit(1)
+            try:
+                with store.edit(args.edition) as courses:
+                    result = fixer(courses)
+            except Exception as e:
+                print(f"ERROR: {e} (edition left unchanged)")
+                sys.exit(1)
+            print(f"{args.fixer} returned {result}")
+
+        elif args.command == 'export':
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(store.export_catalog(args.edition), f, indent=2, ensure_ascii=False)
+            print(f"Wrote '{args.edition}' to {args.output}")
+
+        print(f"({(time.perf_counter() - start) * 1000:.1f}ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Column-aware text extraction for catalog pages.
+extract_text() reads multi-column pages straight across, interleaving the
+columns. Here gutters are found from the x-coverage of the page's chars,
+each column is cropped with page.crop and extracted on its own, and the
+columns are joined left to right. Pages are extracted in parallel batches.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import pdfplumber
+
+# A gutter is an x-range at least this wide (points) with no chars at all
+GUTTER_MIN_WIDTH = 12.0
+
+# Each side of a gutter must hold this share of the page's chars, so a few
+# stray words in the margin don't turn into a column
+COLUMN_MIN_SHARE = 0.15
+
+# Pages per worker task
+PAGE_BATCH_SIZE = 8
+
+def find_gutters(chars: List[dict]) -> List[float]:
+    """x-positions of the column gutters on a page (empty if single-column)"""
+    chars = [c for c in chars if c['text'].strip()]
+    if not chars:
+        return []
+
+    x_min = int(min(c['x0'] for c in chars))
+    x_max = int(max(c['x1'] for c in chars)) + 1
+    coverage = bytearray(x_max - x_min + 1)
+    for c in chars:
+        start = int(c['x0']) - x_min
+        end = int(c['x1']) - x_min + 1
+        coverage[start:end] = b'\x01' * (end - start)
+
+    gaps = []
+    gap_start = None
+    for x, covered in enumerate(coverage):
+        if not covered and gap_start is None:
+            gap_start = x
+        elif covered and gap_start is not None:
+            if x - gap_start >= GUTTER_MIN_WIDTH:
+                gaps.append(x_min + (gap_start + x) / 2)
+            gap_start = None
+
+    gutters = []
+    left_edge = float(x_min)
+    for i, gap in enumerate(gaps):
+        right_edge = gaps[i + 1] if i + 1 < len(gaps) else float(x_max)
+        left = sum(1 for c in chars if left_edge <= c['x0'] < gap)
+        right = sum(1 for c in chars if gap <= c['x0'] < right_edge)
+        if left >= COLUMN_MIN_SHARE * len(chars) and right >= COLUMN_MIN_SHARE * len(chars):
+            gutters.append(gap)
+            left_edge = gap
+
+    return gutters
+
+def column_boxes(page) -> List[Tuple[float, float, float, float]]:
+    """Crop boxes for each column of a page, left to right"""
+    x0, top, x1, bottom = page.bbox
+    edges = [x0] + find_gutters(page.chars) + [x1]
+    return [(edges[i], top, edges[i + 1], bottom) for i in range(len(edges) - 1)]
+
+def page_columns(page) -> List:
+    """The page itself if single-column, otherwise one cropped page per column"""
+    boxes = column_boxes(page)
+    if len(boxes) == 1:
+        return [page]
+    return [page.crop(box) for box in boxes]
+
+def extract_page_text(page) -> str:
+    """Page text with columns extracted independently, in reading order"""
+    texts = [column.extract_text() or '' for column in page_columns(page)]
+    return '\n'.join(text for text in texts if text)
+
+def extract_page_batch(pdf_path: str, page_numbers: List[int]) -> List[str]:
+    """Extract a batch of pages (1-based numbers) in one worker"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [extract_page_text(pdf.pages[n - 1]) for n in page_numbers]
+
+def extract_pdf_pages(pdf_path: str, page_numbers: Optional[List[int]] = None,
+                      workers: Optional[int] = None) -> List[str]:
+    """Column-aware text for each page, extracted in parallel batches
+
+    Returns texts in the order of page_numbers (default: every page).
+    """
+    if page_numbers is None:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_numbers = list(range(1, len(pdf.pages) + 1))
+
+    batches = [page_numbers[i:i + PAGE_BATCH_SIZE]
+               for i in range(0, len(page_numbers), PAGE_BATCH_SIZE)]
+
+    texts = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_texts in executor.map(extract_page_batch, [pdf_path] * len(batches), batches):
+            texts.extend(batch_texts)
+            print(f"  Processed {len(texts)}/{len(page_numbers)} pages...")
+
+    return texts
@@ -15,6 +15,8 @@ Consolidate and fix course pathway categories to match curriculum structure:
 import json
 import re
 
+from course_record import Course, load_catalog
+
 def fix_course_names(courses):
     """Replace L/ prefix with Special Ed and expand ELL"""
     fixes = 0
@@ -217,7 +219,7 @@ def main():
     print('\nLoading courses_complete.json...\n')
 
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
 
@@ -234,7 +236,7 @@ def main():
     # Save fixed data
     print('Saving consolidated data to courses_complete.json...')
     with open('src/data/courses_complete.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=Course.to_dict)
 
     print('✓ Done!\n')
 
@@ -1,7 +1,37 @@
 import pdfplumber
+import asyncio
 import json
+import random
 import re
-from typing import List, Dict, Optional
+import sys
+import time
+from typing import List, Dict, Optional, Tuple
+
+from llm_cache import DEFAULT_CACHE_DIR, ResponseCache
+
+MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 4000
+BATCH_SEPARATOR = "\n\n---COURSE SEPARATOR---\n\n"
+
+# Westview course headers: name, 6-digit course number(s), then GRADES:
+# e.g. "AP PRE-CALCULUS 1-2 001085 - 001086 GRADES: 9-12 UC/CSU: "C""
+COURSE_HEADER_PATTERN = re.compile(r'\b\d{6}(?:\s*-\s*\d{6})?\s+GRADES?:')
+
+# Rough token estimate for English catalog text
+CHARS_PER_TOKEN = 4
+
+# Course text per request, in estimated tokens
+INPUT_TOKEN_BUDGET = 6000
+
+# Expected reply size per course: the filled-in schema plus notes that grow
+# with the course text. Batches are kept under OUTPUT_TOKEN_BUDGET so the
+# reply is not cut off at MAX_TOKENS.
+OUTPUT_TOKENS_PER_COURSE = 300
+OUTPUT_NOTES_RATIO = 0.25
+OUTPUT_TOKEN_BUDGET = int(MAX_TOKENS * 0.8)
+
+# Appended to the header line of every piece of a split course after the first
+CONTINUED_MARKER = " (continued)"
 
 def extract_pdf_text(pdf_path: str) -> str:
     """Extract all text from PDF"""
@@ -11,16 +41,9 @@ def extract_pdf_text(pdf_path: str) -> str:
             text += page.extract_text() + "\n"
     return text
 
-def parse_courses_with_claude(text_chunk: str) -> List[Dict]:
-    """
-    Use Claude API to parse a chunk of course text into structured JSON.
-    This processes small chunks to avoid context limits.
-    """
-    import anthropic
-    
-    client = anthropic.Anthropic()
-    
-    prompt = f"""Parse the following course catalog text into JSON array matching this exact schema:
+def build_prompt(text_chunk: str) -> str:
+    """Prompt asking the model to parse a chunk of course text"""
+    return f"""Parse the following course catalog text into JSON array matching this exact schema:
 
 {{
   "course_id": "string",
@@ -53,41 +76,372 @@ Course text:
 
 Return ONLY a JSON array, no explanation."""
 
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4000,
-        messages=[{"role": "user", "content": prompt}]
-    )
-    
-    # Extract JSON from response
-    response_text = response.content[0].text
+def parse_response_text(response_text: str) -> List[Dict]:
+    """Parse the model's reply into a list of courses"""
     # Strip markdown code blocks if present
     response_text = re.sub(r'```json\n?', '', response_text)
     response_text = re.sub(r'```\n?', '', response_text)
     
     return json.loads(response_text.strip())
 
+def parse_courses_with_claude(text_chunk: str, client=None) -> List[Dict]:
+    """
+    Use Claude API to parse a chunk of course text into structured JSON.
+    This processes small chunks to avoid context limits.
+    Pass a client to reuse one connection pool across calls.
+    """
+    prompt = build_prompt(text_chunk)
+    
+    if client is None:
+        import anthropic
+        client = anthropic.Anthropic()
+    
+    response = client.messages.create(
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    
+    return parse_response_text(response.content[0].text)
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter: refills `rate` tokens per second up to
+    `capacity`, and each request takes one token.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits, overloads, server errors and dropped connections are retried"""
+    import anthropic
+    
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError,
+                          anthropic.InternalServerError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code in (408, 409, 429, 529)
+
+def retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """Exponential backoff with jitter, honouring a retry-after header"""
+    response = getattr(error, 'response', None)
+    if response is not None:
+        retry_after = response.headers.get('retry-after')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return base_delay * (2 ** attempt) * (0.5 + random.random())
+
+async def parse_courses_async(client, text_chunk: str, semaphore: asyncio.Semaphore,
+                              bucket: TokenBucket, max_retries: int = 4,
+                              base_delay: float = 1.0) -> List[Dict]:
+    """Parse one batch on the shared async client, retrying transient errors"""
+    prompt = build_prompt(text_chunk)
+    for attempt in range(max_retries + 1):
+        try:
+            async with semaphore:
+                await bucket.acquire()
+                response = await client.messages.create(
+                    model=MODEL,
+                    max_tokens=MAX_TOKENS,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+            return parse_response_text(response.content[0].text)
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            # Back off outside the semaphore so other batches keep going
+            await asyncio.sleep(retry_delay(e, attempt, base_delay))
+
+async def process_batches_async(batches: List[str], concurrency: int = 8,
+                                requests_per_second: float = 4.0, max_retries: int = 4,
+                                base_url: Optional[str] = None) -> List:
+    """
+    Send all batches concurrently on one client. Returns one entry per batch,
+    in input order: the parsed courses, or the exception if it failed.
+    """
+    import anthropic
+    
+    # Retries are handled here so they share the rate limiter
+    client = anthropic.AsyncAnthropic(base_url=base_url, max_retries=0)
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(requests_per_second)
+    
+    async def run(index: int, batch_text: str):
+        result = await parse_courses_async(client, batch_text, semaphore, bucket, max_retries)
+        print(f"Finished batch {index + 1}/{len(batches)}")
+        return result
+    
+    try:
+        return await asyncio.gather(*(run(i, batch) for i, batch in enumerate(batches)),
+                                    return_exceptions=True)
+    finally:
+        await client.close()
+
 def chunk_text_by_courses(text: str, separator: str = "\n\n") -> List[str]:
     """
-    Split text into course chunks. Adjust separator based on your PDF structure.
-    Common patterns: double newlines, course codes, page breaks
+    Split text into course chunks at Westview course header lines.
+    A header whose number starts the line takes the name from the line above.
     """
-    # Try to split by course pattern (adjust regex to match your PDF format)
-    # Example: splits on course codes like "MATH-101" or numbered courses
-    chunks = re.split(r'\n(?=[A-Z]{2,4}[-\s]\d{3})', text)
+    lines = text.split('\n')
+    starts = []
+    for i, line in enumerate(lines):
+        match = COURSE_HEADER_PATTERN.search(line)
+        if not match:
+            continue
+        if not line[:match.start()].strip() and i > 0 and (not starts or starts[-1] < i - 1):
+            starts.append(i - 1)
+        else:
+            starts.append(i)
     
-    # If that doesn't work, split by paragraph
-    if len(chunks) == 1:
+    if starts:
+        starts.append(len(lines))
+        chunks = ['\n'.join(lines[starts[k]:starts[k + 1]]) for k in range(len(starts) - 1)]
+    else:
+        # No recognizable headers: fall back to paragraphs
         chunks = text.split(separator)
     
     # Filter out very short chunks (likely not complete courses)
     return [c.strip() for c in chunks if len(c.strip()) > 100]
 
-def process_pdf_to_json(pdf_path: str, output_path: str, chunk_size: int = 5):
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a piece of text"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def estimate_output_tokens(chunk: str) -> int:
+    """Approximate reply tokens for one course chunk"""
+    return OUTPUT_TOKENS_PER_COURSE + int(estimate_tokens(chunk) * OUTPUT_NOTES_RATIO)
+
+def split_oversized_chunk(chunk: str, input_budget: int = INPUT_TOKEN_BUDGET) -> List[str]:
+    """
+    Split a course chunk that is over the input budget at line boundaries.
+    Every piece after the first repeats the header line marked "(continued)",
+    so the model returns the same course numbers and merge_continued_courses
+    can put it back together.
+    """
+    if estimate_tokens(chunk) <= input_budget:
+        return [chunk]
+    
+    lines = chunk.split('\n')
+    header = f"{lines[0]}{CONTINUED_MARKER}"
+    pieces = []
+    current = [lines[0]]
+    size = estimate_tokens(lines[0])
+    for line in lines[1:]:
+        line_size = estimate_tokens(line) + 1
+        if size + line_size > input_budget and len(current) > 1:
+            pieces.append('\n'.join(current))
+            current = [header]
+            size = estimate_tokens(header)
+        current.append(line)
+        size += line_size
+    pieces.append('\n'.join(current))
+    return pieces
+
+def pack_batches(course_chunks: List[str], input_budget: int = INPUT_TOKEN_BUDGET,
+                 output_budget: int = OUTPUT_TOKEN_BUDGET,
+                 max_courses: Optional[int] = None) -> List[List[str]]:
+    """
+    Pack course chunks, in order, into as few requests as possible while
+    keeping each under the input and estimated output token budgets.
+    Oversized chunks are split first; one chunk always fits on its own.
+    """
+    batches = []
+    current = []
+    input_used = output_used = 0
+    
+    for course_chunk in course_chunks:
+        for piece in split_oversized_chunk(course_chunk, input_budget):
+            piece_input = estimate_tokens(piece) + estimate_tokens(BATCH_SEPARATOR)
+            piece_output = estimate_output_tokens(piece)
+            
+            full = (input_used + piece_input > input_budget
+                    or output_used + piece_output > output_budget
+                    or (max_courses is not None and len(current) >= max_courses))
+            if current and full:
+                batches.append(current)
+                current = []
+                input_used = output_used = 0
+            
+            current.append(piece)
+            input_used += piece_input
+            output_used += piece_output
+    
+    if current:
+        batches.append(current)
+    return batches
+
+def is_continuation(piece: str) -> bool:
+    """Whether a piece is a later part of a course split_oversized_chunk cut up"""
+    return piece.split('\n', 1)[0].endswith(CONTINUED_MARKER)
+
+def merge_continued_courses(pieces: List[str], per_piece: List[List[Dict]]) -> List[Dict]:
+    """
+    Flatten the courses parsed from each piece, folding those from
+    "(continued)" pieces into the course before them. Only pieces the
+    splitter produced are folded: separate courses that share course
+    numbers (the Studio Art variants) stay separate.
+    """
+    merged = []
+    for piece, courses in zip(pieces, per_piece):
+        for course in courses:
+            previous = merged[-1] if merged else None
+            if (is_continuation(piece) and previous is not None and course.get('course_numbers')
+                    and course.get('course_numbers') == previous.get('course_numbers')):
+                previous['notes'] = ' '.join(n for n in (previous.get('notes'), course.get('notes')) if n)
+                continue
+            merged.append(course)
+    return merged
+
+def split_chunks(course_chunks: List[str], input_budget: int = INPUT_TOKEN_BUDGET) -> List[str]:
+    """Course chunks with the oversized ones split into pieces"""
+    return [piece for chunk in course_chunks for piece in split_oversized_chunk(chunk, input_budget)]
+
+def chunk_numbers(chunk: str) -> List[str]:
+    """Course numbers in a chunk's header"""
+    match = COURSE_HEADER_PATTERN.search(chunk)
+    return re.findall(r'\d{6}', match.group(0)) if match else []
+
+def assign_courses(chunks: List[str], courses: List[Dict]) -> Tuple[List[List[Dict]], List[Dict]]:
+    """Split a batch's reply into the courses parsed from each of its chunks
+
+    Courses come back in chunk order, so each is given to the next chunk
+    whose header numbers it shares (a chunk answered twice keeps both).
+    Returns the courses per chunk and those matching no chunk.
+    """
+    numbers = [set(chunk_numbers(chunk)) for chunk in chunks]
+    per_chunk: List[List[Dict]] = [[] for _ in chunks]
+    unassigned = []
+    position = 0
+    for course in courses:
+        course_numbers = {str(n) for n in course.get('course_numbers') or []}
+        matches = [i for i in range(position, len(chunks)) if numbers[i] & course_numbers]
+        # Prefer a chunk that has no course yet (two pieces of one course share numbers)
+        target = next((i for i in matches if not per_chunk[i]), matches[0] if matches else None)
+        if target is None:
+            unassigned.append(course)
+            continue
+        per_chunk[target].append(course)
+        position = target
+    return per_chunk, unassigned
+
+def parse_chunks_with_model(chunks: List[str], cache: Optional[ResponseCache] = None,
+                            concurrent: bool = True, concurrency: int = 8,
+                            requests_per_second: float = 4.0, base_url: Optional[str] = None,
+                            max_courses: Optional[int] = None,
+                            partial_path: Optional[str] = None) -> List[Dict]:
+    """
+    Parse course chunks with the model, answering from the cache per chunk.
+    
+    Each chunk is cached under the prompt it would have on its own, so the
+    cache survives changes to the chunker's packing or token budgets: only
+    the chunks without an entry are packed into requests. Replies are split
+    back into chunks by course number; chunks a reply can't be split to are
+    left uncached and sent again next run.
+    
+    If any batch still fails after retries, the courses parsed so far are
+    written to partial_path and a RuntimeError is raised; the successful
+    chunks are cached, so a rerun only sends the failed ones.
+    """
+    pieces = split_chunks(chunks)
+    results: List[Optional[List[Dict]]] = [None] * len(pieces)
+    if cache is not None:
+        for i, piece in enumerate(pieces):
+            cached = cache.get(MODEL, build_prompt(piece))
+            if cached is not None:
+                results[i] = parse_response_text(cached)
+    
+    misses = [i for i, result in enumerate(results) if result is None]
+    packed = pack_batches([pieces[i] for i in misses], max_courses=max_courses)
+    batches = [BATCH_SEPARATOR.join(batch) for batch in packed]
+    print(f"{len(pieces) - len(misses)}/{len(pieces)} course chunks cached, "
+          f"sending {len(misses)} in {len(batches)} requests")
+    
+    # Chunk indexes of each batch (packing keeps order and doesn't split pieces again)
+    batch_indexes = []
+    offset = 0
+    for batch in packed:
+        batch_indexes.append(misses[offset:offset + len(batch)])
+        offset += len(batch)
+    
+    extra: Dict[int, List[Dict]] = {}
+    failed: List[int] = []
+    
+    def store(batch_number: int, courses: List[Dict]):
+        indexes = batch_indexes[batch_number]
+        per_chunk, unassigned = assign_courses([pieces[i] for i in indexes], courses)
+        for i, chunk_courses in zip(indexes, per_chunk):
+            results[i] = chunk_courses
+            if cache is not None and (chunk_courses or not unassigned):
+                cache.put(MODEL, build_prompt(pieces[i]), json.dumps(chunk_courses, ensure_ascii=False))
+        # Courses that match no chunk are kept, after the batch's last chunk
+        if unassigned:
+            extra.setdefault(indexes[-1], []).extend(unassigned)
+    
+    if batches and concurrent:
+        print(f"Dispatching {len(batches)} batches (concurrency {concurrency}, {requests_per_second}/s)...")
+        replies = asyncio.run(process_batches_async(batches, concurrency, requests_per_second,
+                                                    base_url=base_url))
+        for batch_number, reply in enumerate(replies):
+            if isinstance(reply, Exception):
+                print(f"Error processing batch {batch_number + 1}: {reply}")
+                failed.append(batch_number)
+            else:
+                store(batch_number, reply)
+    elif batches:
+        import anthropic
+        client = anthropic.Anthropic(base_url=base_url)
+        
+        for batch_number, batch_text in enumerate(batches):
+            print(f"Processing batch {batch_number + 1}/{len(batches)} ({len(packed[batch_number])} chunks)...")
+            try:
+                store(batch_number, parse_courses_with_claude(batch_text, client))
+            except Exception as e:
+                print(f"Error processing batch {batch_number + 1}: {e}")
+                failed.append(batch_number)
+    
+    if failed:
+        # Save what we have so far rather than return an incomplete catalog
+        if partial_path:
+            with open(partial_path, 'w') as f:
+                json.dump([c for r in results if r for c in r], f, indent=2)
+        raise RuntimeError(f"{len(failed)}/{len(batches)} batches failed"
+                           + (f"; partial results saved to {partial_path}" if partial_path else ""))
+    
+    return merge_continued_courses(pieces, [(result or []) + extra.get(i, [])
+                                            for i, result in enumerate(results)])
+
+def process_pdf_to_json(pdf_path: str, output_path: str, chunk_size: Optional[int] = None,
+                        concurrent: bool = False, concurrency: int = 8,
+                        requests_per_second: float = 4.0, base_url: Optional[str] = None,
+                        cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
     """
     Main function: extract PDF, chunk it, process with Claude, save to JSON
     
-    chunk_size: number of course entries to process per API call
+    chunk_size: optional cap on course entries per API call; batches are
+        otherwise packed up to INPUT_TOKEN_BUDGET / OUTPUT_TOKEN_BUDGET
+    concurrent: dispatch batches with asyncio (bounded by concurrency and
+        requests_per_second) instead of one at a time
+    base_url: point the client at another messages endpoint (e.g. llm_stub_server.py)
+    cache_dir: response cache directory, one entry per course chunk; reruns
+        only send chunks without a cached response (None disables the cache)
     """
     print("Extracting text from PDF...")
     full_text = extract_pdf_text(pdf_path)
@@ -96,24 +450,10 @@ def process_pdf_to_json(pdf_path: str, output_path: str, chunk_size: int = 5):
     course_chunks = chunk_text_by_courses(full_text)
     print(f"Found {len(course_chunks)} potential course entries")
     
-    all_courses = []
-    
-    # Process in batches to manage API calls efficiently
-    for i in range(0, len(course_chunks), chunk_size):
-        batch = course_chunks[i:i+chunk_size]
-        batch_text = "\n\n---COURSE SEPARATOR---\n\n".join(batch)
-        
-        print(f"Processing courses {i+1} to {min(i+chunk_size, len(course_chunks))}...")
-        
-        try:
-            parsed_courses = parse_courses_with_claude(batch_text)
-            all_courses.extend(parsed_courses)
-        except Exception as e:
-            print(f"Error processing batch {i//chunk_size + 1}: {e}")
-            # Save what we have so far
-            with open(f"{output_path}.partial.json", 'w') as f:
-                json.dump(all_courses, f, indent=2)
-            continue
+    cache = ResponseCache(cache_dir) if cache_dir else None
+    all_courses = parse_chunks_with_model(course_chunks, cache, concurrent, concurrency,
+                                          requests_per_second, base_url, max_courses=chunk_size,
+                                          partial_path=f"{output_path}.partial.json")
     
     # Save final output
     print(f"Saving {len(all_courses)} courses to {output_path}...")
@@ -125,8 +465,25 @@ def process_pdf_to_json(pdf_path: str, output_path: str, chunk_size: int = 5):
 
 # Usage
 if __name__ == "__main__":
-    pdf_path = "course_catalog.pdf"  # Replace with your PDF path
-    output_path = "courses.json"
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Parse a course catalog PDF with Claude")
+    parser.add_argument('pdf_path', nargs='?', default="course_catalog.pdf")
+    parser.add_argument('--output', default="courses.json")
+    parser.add_argument('--concurrent', action='store_true', help="Dispatch batches concurrently")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--rps', type=float, default=4.0, help="Max requests per second")
+    parser.add_argument('--base-url', default=None, help="Messages API base URL (e.g. a local stub)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Response cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="Send every batch, ignoring the cache")
+    args = parser.parse_args()
     
-    courses = process_pdf_to_json(pdf_path, output_path)
+    try:
+        courses = process_pdf_to_json(args.pdf_path, args.output, concurrent=args.concurrent,
+                                      concurrency=args.concurrency, requests_per_second=args.rps,
+                                      base_url=args.base_url,
+                                      cache_dir=None if args.no_cache else args.cache_dir)
+    except RuntimeError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     print(f"Extracted {len(courses)} courses")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Derived course attributes, parsed once from course names at build time.
+The frontend re-derives these in hot loops (extractLanguage in four
+classes, level regexes in the sequencing rules) and the analysis scripts
+with chained str.replace calls. This stage parses every name once with
+compiled patterns into:
+
+    language          Foreign Language courses only ("SPANISH", "CHINESE"), else null
+    level_start/end   the name's level range ("SPANISH 3-4" -> 3, 4), else null
+    base_name         name without AP/HONORS markers or level ("HONORS SPANISH 7-8" -> "SPANISH")
+    is_ap, is_honors  AP / Honors by whole word (not substring)
+    sequence_index    0-based step among courses sharing base_name ordered
+                      by level (ranges or roman numerals), null for courses
+                      without a level or whose base has only one
+
+catalog_bundle.py adds them to the app's catalog; src/utils/courseAttributes.js
+reads them, parsing names only for courses built without them.
+
+    python3 course_enrichment.py               # print the enriched names
+    python3 course_enrichment.py --sequences   # only courses in a multi-level sequence
+"""
+
+import argparse
+import json
+import re
+from typing import Dict, Any, Optional, Tuple
+
+from ranking_features import normalize_pathway
+
+CATALOG_PATH = "src/data/courses_complete.json"
+
+ENRICHED_FIELDS = ['language', 'level_start', 'level_end', 'base_name',
+                   'is_ap', 'is_honors', 'sequence_index']
+
+LEVEL_RANGE = re.compile(r'(\d+)-(\d+)')
+AP_MARKER = re.compile(r'^AP\s+|\s*\(AP\)|\bADVANCED PLACEMENT\s+')
+HONORS_MARKER = re.compile(r'^HONORS?\s+|\s+HONORS?$|\s*\(H(?:ONORS)?\)|\bHONORS?\b\s*')
+LEVEL_SUFFIX = re.compile(r'\s+\d+[A-Z]?-\d+[A-Z]?\b')
+# "INTEGRATED MATHEMATICS II", "INTEGRATED MATHEMATICS IIa-IIb"
+ROMAN_SUFFIX = re.compile(r'\s+(I{1,3}|IV|V|VI{1,3})(?:A-\1B)?\s*$')
+LANGUAGE_SUFFIX = re.compile(r'\s+(?:LANGUAGE|LITERATURE)(?:\s.*)?$')
+TRAILING_PUNCTUATION = re.compile(r'[\s:,-]+$')
+LETTERS = re.compile(r'^[A-Z]+$')
+
+ROMAN_VALUES = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5, 'VI': 6, 'VII': 7, 'VIII': 8}
+
+def extract_language(name: str) -> str:
+    """Language of a Foreign Language course title
+
+    The frontend's extractLanguage rule (first word, or first two when the
+    second is a word: "CHINESE MANDARIN 1-2"), applied after removing the
+    AP/Honors markers and a LANGUAGE/LITERATURE suffix, so "AP SPANISH
+    LANGUAGE 1-2" and "HONORS SPANISH 7-8" are both SPANISH.
+    """
+    words = LANGUAGE_SUFFIX.sub('', base_name(name)).split(' ')
+    if len(words) > 1 and LETTERS.match(words[1]):
+        return f"{words[0]} {words[1]}"
+    return words[0]
+
+def level_range(name: str) -> Tuple[Optional[int], Optional[int]]:
+    match = LEVEL_RANGE.search(name)
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+def base_name(name: str) -> str:
+    """Name without AP/Honors markers and level ("AP CALCULUS AB 1-2" -> "CALCULUS AB")"""
+    base = ' ' + re.sub(r'\s+', ' ', name.upper()).strip()
+    base = AP_MARKER.sub(' ', base.strip())
+    base = HONORS_MARKER.sub(' ', base.strip())
+    base = LEVEL_SUFFIX.sub('', base)
+    base = ROMAN_SUFFIX.sub('', base)
+    return TRAILING_PUNCTUATION.sub('', re.sub(r'\s+', ' ', base).strip())
+
+def sequence_level(name: str) -> int:
+    """Ordering level within a base: the level range, else a trailing roman numeral, else 0"""
+    start, _ = level_range(name)
+    if start is not None:
+        return start
+    match = ROMAN_SUFFIX.search(re.sub(r'\s+', ' ', name.upper()).strip())
+    return ROMAN_VALUES.get(match.group(1), 0) if match else 0
+
+def enrich_course(course: Dict[str, Any]) -> Dict[str, Any]:
+    """Derived attributes of one course (sequence_index is set per catalog)"""
+    name = course.get('full_name') or ''
+    name_upper = name.upper()
+    pathway = normalize_pathway(course.get('pathway'), name, course.get('uc_csu_category'))
+    start, end = level_range(name_upper)
+    return {
+        'language': extract_language(name) if pathway == 'Foreign Language' else None,
+        'level_start': start,
+        'level_end': end,
+        'base_name': base_name(name),
+        'is_ap': bool(re.match(r'AP\b', name_upper) or 'ADVANCED PLACEMENT' in name_upper),
+        'is_honors': bool(re.search(r'\bHONORS?\b|\(H\)', name_upper)),
+        'sequence_index': None,
+    }
+
+def enrich_catalog(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The catalog with ENRICHED_FIELDS on every course"""
+    courses = []
+    levels_by_base: Dict[str, set] = {}
+    for course in data['courses']:
+        course = {**course, **enrich_course(course)}
+        level = sequence_level(course['full_name'])
+        if level:
+            levels_by_base.setdefault(course['base_name'], set()).add(level)
+        courses.append(course)
+
+    # Rank of each level among its base's distinct levels
+    ranks = {base: {level: i for i, level in enumerate(sorted(levels))}
+             for base, levels in levels_by_base.items() if len(levels) > 1}
+    for course in courses:
+        base_ranks = ranks.get(course['base_name'])
+        level = sequence_level(course['full_name'])
+        if base_ranks and level:
+            course['sequence_index'] = base_ranks[level]
+
+    return {**data, 'courses': courses}
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the derived attributes of every course")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('--sequences', action='store_true', help="Only courses that are part of a sequence")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        courses = enrich_catalog(json.load(f))['courses']
+
+    if args.sequences:
+        courses = sorted((c for c in courses if c['sequence_index'] is not None),
+                         key=lambda c: (c['base_name'], c['sequence_index']))
+
+    print(f"{'course':<42} {'base_name':<32} {'language':<12} {'levels':<7} {'seq':>3}  flags")
+    for c in courses:
+        levels = f"{c['level_start']}-{c['level_end']}" if c['level_start'] is not None else ''
+        seq = c['sequence_index'] if c['sequence_index'] is not None else ''
+        flags = ' '.join(f for f, on in (('AP', c['is_ap']), ('H', c['is_honors'])) if on)
+        print(f"{c['full_name'][:42]:<42} {c['base_name'][:32]:<32} {c['language'] or '':<12} "
+              f"{levels:<7} {seq:>3}  {flags}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory course record.
+A catalog course as a slotted dataclass instead of a 23-key dict:
+categorical strings ("fall", "semester", "Electives", ...) are interned,
+small lists are stored as tuples, and common tuples and key orders are
+shared between records, so large multi-district catalogs take a fraction
+of the memory. Course also answers dict-style access (course['pathway'],
+course.get(...), course[...] = ...), so the fixers and analyzers work on
+it unchanged, and to_dict() gives back exactly the dict it was built from.
+
+    with open('src/data/courses_complete.json') as f:
+        data = load_catalog(f)
+    ...
+    json.dump(data, f, indent=2, default=Course.to_dict)
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Optional, Tuple
+
+# String fields with a small set of repeated values
+CATEGORICAL_FIELDS = frozenset([
+    'credit_type', 'uc_csu_category', 'pathway', 'term_length', 'semester_restrictions',
+])
+
+# List fields, stored as tuples
+LIST_FIELDS = frozenset([
+    'course_numbers', 'grades_allowed', 'offered_terms', 'prerequisites_required',
+    'prerequisites_recommended', 'replacement_equivalents', 'linked_courses',
+    'alternate_ids', 'prerequisites_required_ids', 'prerequisites_recommended_ids',
+])
+
+# List fields whose items are categorical too (their tuples are shared)
+SHARED_LIST_FIELDS = frozenset(['grades_allowed', 'offered_terms'])
+
+_shared_tuples: Dict[tuple, tuple] = {}
+_shared_keys: Dict[tuple, tuple] = {}
+
+def _share(value: tuple) -> tuple:
+    """One copy of each distinct small tuple across all records"""
+    return _shared_tuples.setdefault(value, value)
+
+def _convert(key: str, value: Any) -> Any:
+    """Storage form of a field value"""
+    if key in LIST_FIELDS and isinstance(value, list):
+        if key in SHARED_LIST_FIELDS:
+            return _share(tuple(sys.intern(v) if isinstance(v, str) else v for v in value))
+        return tuple(value)
+    if key in CATEGORICAL_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+@dataclass(slots=True, eq=False)
+class Course:
+    """One catalog course (see COURSE_SCHEMA.md for the fields)"""
+
+    course_id: str = ''
+    full_name: str = ''
+    course_numbers: Tuple[str, ...] = ()
+    grades_allowed: Tuple[int, ...] = ()
+    credits: float = 10.0
+    credit_type: str = 'standard'
+    uc_csu_category: Optional[str] = None
+    pathway: str = ''
+    term_length: str = 'yearlong'
+    offered_terms: Tuple[str, ...] = ()
+    prerequisites_required: Tuple[str, ...] = ()
+    prerequisites_recommended: Tuple[str, ...] = ()
+    is_replacement_course: bool = False
+    replacement_equivalents: Tuple[str, ...] = ()
+    is_ap_or_honors_pair: bool = False
+    pair_course_id: Optional[str] = None
+    fall_to_spring_dependency: bool = False
+    linked_courses: Tuple[str, ...] = ()
+    category_priority: int = 1
+    is_graduation_requirement: bool = False
+    semester_restrictions: Optional[str] = None
+    alternate_ids: Tuple[str, ...] = ()
+    notes: str = ''
+    homework_hours_per_week: Optional[float] = None
+    uc_honors_weight: Optional[float] = None
+    prerequisites_required_ids: Tuple[str, ...] = ()
+    prerequisites_recommended_ids: Tuple[str, ...] = ()
+    # Any other keys, and which keys the record has, in order
+    extra: Optional[Dict[str, Any]] = None
+    keys_: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Course':
+        """Build a record from a catalog course dict"""
+        values = {}
+        extra = None
+        for key, value in data.items():
+            if key in FIELD_NAMES:
+                values[key] = _convert(key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        keys = tuple(data)
+        return cls(**values, extra=extra, keys_=_shared_keys.setdefault(keys, keys))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The course as a plain dict, keys in their original order"""
+        out = {}
+        for key in self.keys_:
+            if key in FIELD_NAMES:
+                value = getattr(self, key)
+                out[key] = list(value) if type(value) is tuple else value
+            else:
+                out[key] = self.extra[key]
+        return out
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys_:
+            raise KeyError(key)
+        return getattr(self, key) if key in FIELD_NAMES else self.extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in FIELD_NAMES:
+            setattr(self, key, _convert(key, value))
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        if key not in self.keys_:
+            keys = self.keys_ + (key,)
+            self.keys_ = _shared_keys.setdefault(keys, keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys_
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self.keys_ else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.keys_
+
+FIELD_NAMES = frozenset(f.name for f in fields(Course)) - {'extra', 'keys_'}
+
+def load_catalog(f) -> Dict[str, Any]:
+    """Read a catalog file object, with its courses as Course records"""
+    import json
+    data = json.load(f)
+    data['courses'] = [Course.from_dict(course) for course in data['courses']]
+    return data
+
+def courses_to_dicts(courses: List[Course]) -> List[Dict[str, Any]]:
+    return [course.to_dict() for course in courses]
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Course description store, split out of the core catalog.
+Course descriptions are most of the catalog's bytes but are only shown on
+course cards and in the explorer, so they are served separately and loaded
+on demand (src/utils/descriptionStore.js). Descriptions are taken in full
+from the PDF where the catalog's 500-character notes are a prefix of them,
+and from the notes otherwise (hand-edited or unmatched courses).
+
+The store is a few UTF-8 text shards plus an index from course_id to
+(shard, byte offset, byte length):
+
+    public/data/descriptions/index.json
+    public/data/descriptions/descriptions-000.txt
+    ...
+
+    python3 description_store.py
+    python3 description_store.py --no-pdf     # notes only, no PDF extraction
+"""
+
+import argparse
+import json
+import os
+import re
+from typing import List, Dict, Any, Optional
+
+from parser_diff import course_numbers
+
+CATALOG_PATH = "src/data/courses_complete.json"
+PDF_PATH = "Westview Course Catalog 2025-2026.pdf"
+STORE_DIR = "public/data/descriptions"
+STORE_FORMAT = 1
+
+# Shard size in bytes; a shard is fetched whole the first time one of its
+# descriptions is needed
+SHARD_SIZE = 32 * 1024
+
+# Catalog fields that move to the store
+DESCRIPTION_FIELDS = ['notes']
+
+# Notes markers App.isYearlongCourse reads, kept in the core catalog as a flag
+YEARLONG_NOTE_MARKERS = ('YEAR-LONG', 'LINKED W/')
+
+def extract_full_descriptions(pdf_path: str) -> Dict[str, str]:
+    """Untruncated description of every course in the PDF, by course number"""
+    import pdfplumber
+    from catalog_sections import find_sections, shard_sections
+    from final_parser import extract_page_lines, find_course_entries
+
+    descriptions = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        sections = shard_sections(find_sections(pdf)) or [
+            {'start_page': 1, 'end_page': len(pdf.pages)}
+        ]
+        for section in sections:
+            lines = []
+            sources = []
+            for page_no in range(section['start_page'], section['end_page'] + 1):
+                page_lines, page_sources = extract_page_lines(pdf.pages[page_no - 1], page_no)
+                lines.extend(page_lines)
+                sources.extend(page_sources)
+
+            for data in find_course_entries(lines, [source['header'] for source in sources]):
+                for number in re.findall(r'\d{6}', data['numbers']):
+                    descriptions.setdefault(number, data['description'])
+    return descriptions
+
+def squash(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+def full_description(course: Dict, pdf_descriptions: Dict[str, str]) -> str:
+    """The course's description, extended from the PDF when its notes are a cut-off prefix"""
+    notes = course.get('notes') or ''
+    prefix = squash(notes[:-3] if notes.endswith('...') else notes)
+    for number in course_numbers(course):
+        description = pdf_descriptions.get(number)
+        if description and prefix and squash(description).startswith(prefix):
+            return squash(description)
+    return notes
+
+def build_store(courses: List[Dict], pdf_descriptions: Dict[str, str],
+                shard_size: int = SHARD_SIZE) -> Dict[str, Any]:
+    """Shard contents and the index for a list of courses"""
+    shards = [bytearray()]
+    index = {}
+    for course in courses:
+        text = full_description(course, pdf_descriptions)
+        if not text:
+            continue
+        encoded = text.encode('utf-8')
+        if shards[-1] and len(shards[-1]) + len(encoded) > shard_size:
+            shards.append(bytearray())
+        index[course['course_id']] = [len(shards) - 1, len(shards[-1]), len(encoded)]
+        shards[-1].extend(encoded)
+
+    return {
+        'shards': [bytes(shard) for shard in shards if shard],
+        'index': index
+    }
+
+def save_store(store: Dict[str, Any], store_dir: str):
+    os.makedirs(store_dir, exist_ok=True)
+    for name in os.listdir(store_dir):
+        if name.startswith('descriptions-') and name.endswith('.txt'):
+            os.remove(os.path.join(store_dir, name))
+
+    shard_names = []
+    for i, shard in enumerate(store['shards']):
+        name = f"descriptions-{i:03d}.txt"
+        with open(os.path.join(store_dir, name), 'wb') as f:
+            f.write(shard)
+        shard_names.append(name)
+
+    with open(os.path.join(store_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'format': STORE_FORMAT,
+            'shards': shard_names,
+            'courses': store['index']
+        }, f, separators=(',', ':'))
+
+def read_description(store_dir: str, course_id: str) -> Optional[str]:
+    """One description, read through the index (mirrors loadDescription in JS)"""
+    with open(os.path.join(store_dir, 'index.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    entry = index['courses'].get(course_id)
+    if entry is None:
+        return None
+    shard, offset, length = entry
+    with open(os.path.join(store_dir, index['shards'][shard]), 'rb') as f:
+        f.seek(offset)
+        return f.read(length).decode('utf-8')
+
+def read_descriptions(store_dir: str) -> Dict[str, str]:
+    """Every description in a store, by course_id ({} when there is no store)"""
+    index_path = os.path.join(store_dir, 'index.json')
+    if not os.path.exists(index_path):
+        return {}
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    shards = []
+    for name in index['shards']:
+        with open(os.path.join(store_dir, name), 'rb') as f:
+            shards.append(f.read())
+    return {course_id: shards[shard][offset:offset + length].decode('utf-8')
+            for course_id, (shard, offset, length) in index['courses'].items()}
+
+def core_catalog(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The catalog without description fields, for scheduling
+
+    Courses whose notes mark them year-long get yearlong_in_notes, so the
+    app's yearlong check still works without the notes.
+    """
+    courses = []
+    for course in data['courses']:
+        core = {k: v for k, v in course.items() if k not in DESCRIPTION_FIELDS}
+        notes = (course.get('notes') or '').upper()
+        if any(marker in notes for marker in YEARLONG_NOTE_MARKERS):
+            core['yearlong_in_notes'] = True
+        courses.append(core)
+    return {**data, 'courses': courses}
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the lazily loaded course description store")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('--pdf', default=PDF_PATH)
+    parser.add_argument('--no-pdf', action='store_true', help="Use the catalog notes only")
+    parser.add_argument('-o', '--output-dir', default=STORE_DIR)
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE)
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    courses = data['courses']
+
+    pdf_descriptions = {}
+    if not args.no_pdf:
+        print(f"Extracting full descriptions from {args.pdf}...")
+        pdf_descriptions = extract_full_descriptions(args.pdf)
+        print(f"  {len(pdf_descriptions)} course numbers with descriptions")
+
+    store = build_store(courses, pdf_descriptions, args.shard_size)
+    save_store(store, args.output_dir)
+
+    extended = sum(1 for c in courses if full_description(c, pdf_descriptions) != (c.get('notes') or ''))
+    store_bytes = sum(len(shard) for shard in store['shards'])
+    notes_bytes = sum(len((c.get('notes') or '').encode('utf-8')) for c in courses)
+    print(f"\nStored {len(store['index'])} descriptions in {len(store['shards'])} shards "
+          f"({store_bytes / 1024:.1f} KB)")
+    print(f"  {extended} extended past the catalog notes ({notes_bytes / 1024:.1f} KB of notes)")
+    print(f"Saved to {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
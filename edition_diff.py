@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Course-level diff between two catalog editions.
+Courses are matched by course number through a hash index, falling back to
+a hash of the normalized name for courses whose numbers changed, and
+classified as added, removed, renamed or changed (with per-field deltas)
+in one pass over each edition. Removed and re-identified courses are
+written out as the deprecated-course map the app's SuggestionEngine takes.
+
+    python3 edition_diff.py old_catalog.json src/data/courses_complete.json
+    python3 edition_diff.py old.json new.json --deprecated src/data/deprecated_courses.json
+    python3 edition_diff.py courses_complete.backup2 courses_complete --db catalog.db
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import List, Dict, Optional
+
+from parser_diff import course_numbers
+
+DEFAULT_DEPRECATED_PATH = "src/data/deprecated_courses.json"
+
+# Fields never reported as changes
+IGNORED_FIELDS = {'notes'}
+
+def name_key(name: str) -> str:
+    """Name with case, punctuation and spacing removed"""
+    return re.sub(r'[^A-Z0-9]+', ' ', (name or '').upper()).strip()
+
+def field_deltas(old: Dict, new: Dict, ignored: set = IGNORED_FIELDS) -> Dict[str, Dict]:
+    """{field: {"old", "new"}} for every field whose value differs"""
+    deltas = {}
+    for key in list(old) + [k for k in new if k not in old]:
+        if key in ignored:
+            continue
+        before = old.get(key)
+        after = new.get(key)
+        if before != after:
+            deltas[key] = {'old': before, 'new': after}
+    return deltas
+
+def diff_editions(old: List[Dict], new: List[Dict]) -> Dict[str, List]:
+    """Classify every course of two editions
+
+    Returns lists of added and removed courses, and of renamed and changed
+    (old, new, deltas) matches. Matching is linear: one hash index per key
+    type over the new edition, then one lookup pass over the old one.
+    """
+    by_number = {}
+    by_name = {}
+    for i, course in enumerate(new):
+        for number in course_numbers(course):
+            by_number.setdefault(number, i)
+        by_name.setdefault(name_key(course.get('full_name')), []).append(i)
+
+    matched = [False] * len(new)
+    pairs = []
+    unmatched_old = []
+
+    # Number matches first, so a name match never steals a numbered course
+    for course in old:
+        match = None
+        for number in course_numbers(course):
+            j = by_number.get(number)
+            if j is not None and not matched[j]:
+                match = j
+                break
+        if match is None:
+            unmatched_old.append(course)
+        else:
+            matched[match] = True
+            pairs.append((course, new[match]))
+
+    removed = []
+    for course in unmatched_old:
+        candidates = by_name.get(name_key(course.get('full_name')), [])
+        match = next((j for j in candidates if not matched[j]), None)
+        if match is None:
+            removed.append(course)
+        else:
+            matched[match] = True
+            pairs.append((course, new[match]))
+
+    result = {'added': [c for c, m in zip(new, matched) if not m], 'removed': removed,
+              'renamed': [], 'changed': [], 'unchanged': 0}
+    for before, after in pairs:
+        deltas = field_deltas(before, after)
+        if name_key(before.get('full_name')) != name_key(after.get('full_name')):
+            result['renamed'].append((before, after, deltas))
+        elif deltas:
+            result['changed'].append((before, after, deltas))
+        else:
+            result['unchanged'] += 1
+    return result
+
+def deprecated_courses(result: Dict[str, List]) -> Dict[str, Dict]:
+    """Old course_id -> what happened to it, for every id the new edition drops
+
+    Removed courses map to no replacement; renamed or renumbered courses
+    whose course_id changed point at their new id.
+    """
+    deprecated = {}
+    for course in result['removed']:
+        deprecated[course['course_id']] = {
+            'full_name': course.get('full_name'),
+            'reason': 'removed',
+            'replaced_by': None
+        }
+    for kind in ('renamed', 'changed'):
+        for before, after, _ in result[kind]:
+            if before.get('course_id') != after.get('course_id'):
+                deprecated[before['course_id']] = {
+                    'full_name': before.get('full_name'),
+                    'reason': kind,
+                    'replaced_by': after.get('course_id')
+                }
+    return deprecated
+
+def load_edition(source: str, db_path: Optional[str] = None) -> List[Dict]:
+    """Courses from a catalog JSON file, or from a catalog_store edition"""
+    if os.path.exists(source) or not db_path:
+        with open(source, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['courses'] if isinstance(data, dict) else data
+
+    from catalog_store import CatalogStore
+    with CatalogStore(db_path) as store:
+        return store.export_catalog(source)['courses']
+
+def save_deprecated(deprecated: Dict[str, Dict], path: str, old_source: str, new_source: str):
+    output = {
+        "generated_from": {"old": old_source, "new": new_source},
+        "generated_at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "deprecatedCourses": deprecated
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+def print_diff(result: Dict[str, List], show: int):
+    print(f"  added:     {len(result['added'])}")
+    print(f"  removed:   {len(result['removed'])}")
+    print(f"  renamed:   {len(result['renamed'])}")
+    print(f"  changed:   {len(result['changed'])}")
+    print(f"  unchanged: {result['unchanged']}")
+
+    for course in result['added'][:show]:
+        print(f"\n+ {course.get('course_id')}: {course.get('full_name')}")
+    for course in result['removed'][:show]:
+        print(f"\n- {course.get('course_id')}: {course.get('full_name')}")
+    for kind in ('renamed', 'changed'):
+        for before, after, deltas in result[kind][:show]:
+            print(f"\n~ {before.get('course_id')}: {before.get('full_name')} ({kind})")
+            for key, delta in deltas.items():
+                print(f"    {key}: {json.dumps(delta['old'])[:60]} -> {json.dumps(delta['new'])[:60]}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two catalog editions course by course")
+    parser.add_argument('old', help="Previous edition (JSON file, or edition name with --db)")
+    parser.add_argument('new', help="New edition (JSON file, or edition name with --db)")
+    parser.add_argument('--db', help="catalog_store database to read edition names from")
+    parser.add_argument('--deprecated', nargs='?', const=DEFAULT_DEPRECATED_PATH,
+                        help=f"Write the deprecated-course map (default path {DEFAULT_DEPRECATED_PATH})")
+    parser.add_argument('--report', help="Write the full diff as JSON")
+    parser.add_argument('--show', type=int, default=5, help="Examples to print per category")
+    args = parser.parse_args()
+
+    try:
+        old = load_edition(args.old, args.db)
+        new = load_edition(args.new, args.db)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    result = diff_editions(old, new)
+    elapsed = time.perf_counter() - start
+
+    print(f"=== {args.old} -> {args.new} ({len(old)} -> {len(new)} courses, {elapsed * 1000:.1f}ms) ===")
+    print_diff(result, args.show)
+
+    deprecated = deprecated_courses(result)
+    print(f"\n{len(deprecated)} deprecated course ids")
+
+    if args.deprecated:
+        save_deprecated(deprecated, args.deprecated, args.old, args.new)
+        print(f"Saved deprecated-course map to {args.deprecated}")
+
+    if args.report:
+        report = {
+            'added': result['added'],
+            'removed': result['removed'],
+            'renamed': [{'old': b, 'new': a, 'deltas': d} for b, a, d in result['renamed']],
+            'changed': [{'old': b, 'new': a, 'deltas': d} for b, a, d in result['changed']],
+            'unchanged': result['unchanged']
+        }
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Saved diff to {args.report}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Precomputed grade x term eligibility matrix.
+SchedulingEngine.getCoursesForGrade and SuggestionEngine.buildCandidatePool
+filter the whole catalog on grades_allowed, offered_terms and
+semester_restrictions every time the UI asks. This build step does it once:
+for each grade (9-12) and term, a bitset over the catalog's course IDs of
+the courses a student in that grade can take then.
+
+    {
+      "format": 1,
+      "course_ids": [...],                  # bit i of every cell is course_ids[i]
+      "grades": [9, 10, 11, 12],
+      "terms": ["any", "fall", "spring"],   # "any": grades_allowed only
+      "quarters": {"Q1": "fall", ...},      # quarters share their semester's cell
+      "cells": {"9": {"any": "<hex>", "fall": "<hex>", "spring": "<hex>"}, ...}
+    }
+
+Cells are hex strings, four courses per digit, lowest bit first
+(src/utils/eligibilityMatrix.js decodes them). catalog_bundle.py adds the
+matrix to the app's catalog as "eligibility".
+
+The build also checks that term_length, offered_terms and
+semester_restrictions agree, since a course they disagree on lands in the
+wrong cells.
+
+    python3 eligibility_matrix.py              # matrix summary + consistency report
+    python3 eligibility_matrix.py --strict     # exit 1 if there are errors
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Dict, Any
+
+CATALOG_PATH = "src/data/courses_complete.json"
+MATRIX_FORMAT = 1
+
+GRADES = [9, 10, 11, 12]
+SEMESTERS = ['fall', 'spring']
+ANY_TERM = 'any'
+QUARTER_TERMS = {'Q1': 'fall', 'Q2': 'fall', 'Q3': 'spring', 'Q4': 'spring'}
+TERM_LENGTHS = ['yearlong', 'semester', 'quarter']
+
+def offered_in_term(course: Dict, term: str) -> bool:
+    """courseUtils.getCoursesForTerm's test for one course"""
+    restriction = course.get('semester_restrictions')
+    return (term in (course.get('offered_terms') or [])
+            and (restriction is None or restriction == f"{term} only"))
+
+def eligible(course: Dict, grade: int, term: str) -> bool:
+    if grade not in (course.get('grades_allowed') or []):
+        return False
+    return term == ANY_TERM or offered_in_term(course, term)
+
+def encode_bits(bits: List[bool]) -> str:
+    """Hex bitset, four flags per digit, lowest bit first"""
+    digits = []
+    for i in range(0, len(bits), 4):
+        value = sum(1 << j for j, bit in enumerate(bits[i:i + 4]) if bit)
+        digits.append(format(value, 'x'))
+    return ''.join(digits)
+
+def decode_bits(hex_bits: str, count: int) -> List[bool]:
+    return [bool(int(hex_bits[i >> 2], 16) >> (i & 3) & 1) for i in range(count)]
+
+def catalog_by_id(courses: List[Dict]) -> Dict[str, Dict]:
+    """Courses by course_id; the last of a repeated ID wins, as in the app's lookup"""
+    return {course['course_id']: course for course in courses}
+
+def build_matrix(courses: List[Dict]) -> Dict[str, Any]:
+    by_id = catalog_by_id(courses)
+    course_ids = list(by_id)
+    cells = {}
+    for grade in GRADES:
+        cells[str(grade)] = {
+            term: encode_bits([eligible(by_id[cid], grade, term) for cid in course_ids])
+            for term in [ANY_TERM] + SEMESTERS
+        }
+    return {
+        'format': MATRIX_FORMAT,
+        'course_ids': course_ids,
+        'grades': GRADES,
+        'terms': [ANY_TERM] + SEMESTERS,
+        'quarters': QUARTER_TERMS,
+        'cells': cells
+    }
+
+def eligible_ids(matrix: Dict[str, Any], grade: int, term: str = ANY_TERM) -> List[str]:
+    """Course IDs in one cell (mirrors eligibleCourses in JS); term may be a quarter"""
+    term = matrix['quarters'].get(term, term)
+    cell = matrix['cells'].get(str(grade), {}).get(term)
+    if cell is None:
+        return []
+    course_ids = matrix['course_ids']
+    return [cid for cid, bit in zip(course_ids, decode_bits(cell, len(course_ids))) if bit]
+
+def check_consistency(courses: List[Dict]) -> List[Dict[str, str]]:
+    """Disagreements between term_length, offered_terms, semester_restrictions and grades
+
+    Each issue is {"course_id", "full_name", "level", "issue"}; errors put
+    a course in the wrong cells, warnings are worth a look.
+    """
+    issues = []
+
+    def report(course, level, issue):
+        issues.append({'course_id': course.get('course_id'), 'full_name': course.get('full_name'),
+                       'level': level, 'issue': issue})
+
+    for course in courses:
+        term_length = course.get('term_length')
+        offered = course.get('offered_terms') or []
+        restriction = course.get('semester_restrictions')
+        grades = course.get('grades_allowed') or []
+
+        if term_length not in TERM_LENGTHS:
+            report(course, 'error', f"unknown term_length {term_length!r}")
+        if not offered:
+            report(course, 'error', "no offered_terms (never eligible)")
+        unknown = [t for t in offered if t not in SEMESTERS]
+        if unknown:
+            report(course, 'error', f"unknown offered_terms {unknown}")
+        if len(set(offered)) != len(offered):
+            report(course, 'warning', f"repeated offered_terms {offered}")
+
+        if term_length == 'yearlong' and not all(t in offered for t in SEMESTERS):
+            report(course, 'error', f"yearlong but offered_terms is {offered}")
+
+        if restriction is not None:
+            term = restriction[:-len(' only')] if restriction.endswith(' only') else None
+            if term not in SEMESTERS:
+                report(course, 'error', f"unknown semester_restrictions {restriction!r}")
+            elif term not in offered:
+                report(course, 'error', f"semester_restrictions {restriction!r} but offered_terms is {offered}")
+            elif term_length == 'yearlong':
+                report(course, 'error', f"yearlong but restricted to {restriction!r}")
+            elif len(offered) > 1:
+                report(course, 'warning', f"semester_restrictions {restriction!r} narrows offered_terms {offered}")
+
+        if not grades:
+            report(course, 'error', "no grades_allowed (never eligible)")
+        elif any(g not in GRADES for g in grades):
+            report(course, 'error', f"grades_allowed outside 9-12: {grades}")
+
+        notes = (course.get('notes') or '').upper()
+        if term_length != 'yearlong' and (course.get('yearlong_in_notes') or 'YEAR-LONG' in notes):
+            report(course, 'warning', f"notes say year-long but term_length is {term_length!r}")
+
+    # Repeated IDs resolve to one record in the app; flag when that changes eligibility
+    by_id = catalog_by_id(courses)
+    for course in courses:
+        kept = by_id[course['course_id']]
+        if course is not kept and any(eligible(course, g, t) != eligible(kept, g, t)
+                                      for g in GRADES for t in SEMESTERS):
+            report(course, 'warning', "shares its course_id with a record of different eligibility")
+
+    return issues
+
+def add_eligibility(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The catalog with its eligibility matrix"""
+    return {**data, 'eligibility': build_matrix(data['courses'])}
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and check the grade x term eligibility matrix")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('--strict', action='store_true', help="Exit with status 1 on consistency errors")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        courses = json.load(f)['courses']
+
+    matrix = build_matrix(courses)
+    print(f"Eligibility matrix over {len(matrix['course_ids'])} course IDs "
+          f"({len(json.dumps(matrix['cells'], separators=(',', ':')))} bytes of cells)\n")
+    print(f"  {'grade':<6} " + ' '.join(f"{t:>7}" for t in matrix['terms']))
+    for grade in GRADES:
+        print(f"  {grade:<6} " + ' '.join(f"{len(eligible_ids(matrix, grade, t)):>7}" for t in matrix['terms']))
+
+    issues = check_consistency(courses)
+    errors = [i for i in issues if i['level'] == 'error']
+    print(f"\nConsistency: {len(errors)} errors, {len(issues) - len(errors)} warnings")
+    for issue in issues:
+        print(f"  {issue['level'].upper():<8} {issue['course_id']:<14} {issue['full_name'][:40]:<40} {issue['issue']}")
+
+    if args.strict and errors:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
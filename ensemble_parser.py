@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Multi-strategy Westview catalog parser.
+Extracts every page once (in parallel batches), then runs the existing
+parsers over the shared text in parallel threads:
+
+    final      final_parser.py   positioned lines, split by TOC section
+    westview   westview_pdf_parser.py   one regex over the full text
+    chunks     pdf_to_json.py    bold-header chunks
+    model      convert.py        optional, with --model (stub-able)
+
+Courses are joined when they share a course number and a normalized name
+(courses that share a number but not a name, like the Studio Art variants,
+stay apart), and every field but the pathway is decided by vote; ties go
+to the strategy listed first. Values are normalized before they are
+compared (prerequisites cut where the next field's text spills in, grade
+ranges filled in, text agreeing when one strategy's is a prefix of
+another's), and empty values, which mostly mean a strategy doesn't
+extract the field, abstain. The pathway comes from final_parser's table
+of contents sections. Courses found by a single strategy other than final
+(the chunker's "GRADE 10:" headings, ...) are dropped.
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import pdfplumber
+
+import convert
+import pdf_to_json
+import westview_pdf_parser
+from catalog_sections import find_sections, shard_sections
+from column_extraction import PAGE_BATCH_SIZE
+from final_parser import extract_page_lines, parse_lines, save_to_json
+from llm_cache import DEFAULT_CACHE_DIR, ResponseCache
+
+# Strategy order doubles as the tie-break order when votes are split
+STRATEGIES = ['final', 'westview', 'chunks', 'model']
+
+# The strategy that reads the table of contents; courses only it found are
+# kept, and its section pathway is used as is
+PRIMARY_STRATEGY = 'final'
+
+# Fields decided by vote; course_id and course_numbers come from the
+# highest-priority strategy that found the course, pathway from the primary
+VOTED_FIELDS = [
+    'full_name', 'grades_allowed', 'credits', 'credit_type', 'uc_csu_category',
+    'term_length', 'offered_terms', 'prerequisites_required',
+    'prerequisites_recommended', 'is_ap_or_honors_pair', 'is_graduation_requirement',
+    'semester_restrictions', 'notes',
+]
+
+def extract_page_batch(pdf_path: str, page_numbers: List[int]) -> List[Tuple[List[str], List[Dict]]]:
+    """Positioned lines for a batch of pages (1-based numbers) in one worker"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [extract_page_lines(pdf.pages[n - 1], n) for n in page_numbers]
+
+def extract_shared(pdf_path: str, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Extract the catalog once into what every strategy needs
+
+    Returns the positioned lines and their sources for the whole document,
+    the column-aware text of each page, and the TOC sections.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        sections = shard_sections(find_sections(pdf))
+
+    page_numbers = list(range(1, total_pages + 1))
+    batches = [page_numbers[i:i + PAGE_BATCH_SIZE] for i in range(0, total_pages, PAGE_BATCH_SIZE)]
+
+    lines = []
+    sources = []
+    page_texts = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in executor.map(extract_page_batch, [pdf_path] * len(batches), batches):
+            for page_lines, page_sources in batch:
+                lines.extend(page_lines)
+                sources.extend(page_sources)
+                page_texts.append('\n'.join(page_lines))
+            print(f"  Extracted {len(page_texts)}/{total_pages} pages...")
+
+    if not sections:
+        sections = [{'title': 'Catalog', 'pathway': None, 'start_page': 1, 'end_page': total_pages}]
+
+    return {'lines': lines, 'sources': sources, 'page_texts': page_texts, 'sections': sections}
+
+def run_final(shared: Dict) -> List[Dict]:
+    """final_parser over each TOC section's lines"""
+    courses = []
+    for section in shared['sections']:
+        indexes = [i for i, source in enumerate(shared['sources'])
+                   if section['start_page'] <= source['page'] <= section['end_page']]
+        section_courses, _ = parse_lines([shared['lines'][i] for i in indexes],
+                                         [shared['sources'][i] for i in indexes], section, {})
+        courses.extend(section_courses)
+    return courses
+
+def run_westview(shared: Dict) -> List[Dict]:
+    """westview_pdf_parser's regex over the full text"""
+    full_text = ''.join(text + '\n' for text in shared['page_texts'] if text)
+    return westview_pdf_parser.parse_courses_from_text(full_text)
+
+def run_chunks(shared: Dict) -> List[Dict]:
+    """pdf_to_json's parser over chunks split at bold header runs"""
+    chunks = pdf_to_json.chunks_from_lines(shared['lines'],
+                                           [source['bold'] for source in shared['sources']])
+    courses = []
+    existing_ids = set()
+    for chunk in chunks:
+        course = pdf_to_json.parse_course_from_text(chunk, existing_ids)
+        if course:
+            courses.append(course)
+    return courses
+
+def run_model(shared: Dict, base_url: Optional[str] = None,
+              cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> List[Dict]:
+    """convert.py's model path over token-budgeted batches of the full text"""
+    chunks = convert.chunk_text_by_courses('\n'.join(shared['page_texts']))
+    cache = ResponseCache(cache_dir) if cache_dir else None
+    return convert.parse_chunks_with_model(chunks, cache, base_url=base_url)
+
+# Field labels that start the next part of a course entry; prerequisite
+# text that runs into one of them is cut there before voting
+SPILL_LABELS = re.compile(r'\b(?:for students interested in|length of course|alternate course id numbers?|'
+                          r'recommended prerequisites?|required prerequisites?)\s*:.*', re.IGNORECASE)
+
+def text_key(text: Any) -> str:
+    return ' '.join(str(text or '').lower().split())
+
+def prerequisite_key(prerequisites: Any) -> List[str]:
+    """Prerequisite list as compared in votes: spilled field text cut, case and spacing ignored"""
+    items = set()
+    for item in prerequisites or []:
+        item = text_key(SPILL_LABELS.sub('', str(item))).rstrip(' .;,')
+        if item and item != 'none':
+            items.add(item)
+    return sorted(items)
+
+def grade_key(grades: Any) -> List[int]:
+    """Grades as compared in votes: every grade from the lowest to the highest
+    (the parsers read "GRADES: 9-12" as [9, 12])"""
+    grades = [int(g) for g in grades or []]
+    return list(range(min(grades), max(grades) + 1)) if grades else []
+
+# How each voted field is compared; values that compare as empty abstain,
+# since most strategies leave fields they don't extract empty
+VOTE_KEYS = {
+    'full_name': lambda name: name_key(name),
+    'grades_allowed': grade_key,
+    'credits': lambda credits: None if credits is None else float(credits),
+    'prerequisites_required': prerequisite_key,
+    'prerequisites_recommended': prerequisite_key,
+    'notes': text_key,
+}
+
+# Text fields where one strategy's value can stop early (westview cuts
+# notes short) or run on into the description: values agree when one is a
+# prefix of the other
+PREFIX_FIELDS = {'prerequisites_required', 'prerequisites_recommended', 'notes'}
+
+def same_value(a: Any, b: Any, prefix: bool = False) -> bool:
+    if prefix and isinstance(a, str) and isinstance(b, str):
+        return a.startswith(b) or b.startswith(a)
+    if prefix and isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(same_value(x, y, True) for x, y in zip(a, b))
+    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+
+def vote_value(values: List[Tuple[str, Any]], key=None, prefix: bool = False) -> Tuple[Any, int, int, bool]:
+    """Most common value among (strategy, value) pairs
+
+    Values are compared by key(value) (the value itself without a key), by
+    prefix with prefix=True (same_value). Values that compare as empty don't
+    vote unless no strategy has anything else. Returns the value, how many
+    voted for it, how many voted, and whether another value had as many
+    votes (ties go to the value from the earliest strategy).
+    """
+    keyed = [(value, key(value) if key else value) for _, value in values]
+    voters = [(value, k) for value, k in keyed if k not in (None, '', [], {})] or keyed
+    # [value from the earliest strategy, its key, votes]
+    groups: List[List[Any]] = []
+    for value, k in voters:
+        group = next((g for g in groups if same_value(g[1], k, prefix)), None)
+        if group is None:
+            groups.append([value, k, 1])
+        else:
+            group[2] += 1
+    best = max(group[2] for group in groups)
+    tied = sum(1 for group in groups if group[2] == best) > 1
+    winner = next(group for group in groups if group[2] == best)
+    return winner[0], best, len(voters), tied
+
+def name_key(name: str) -> str:
+    """Course name reduced for joining: no course numbers, punctuation or case"""
+    name = re.sub(r'\d{6}', ' ', (name or '').upper())
+    return ' '.join(re.sub(r'[^A-Z0-9]+', ' ', name).split())
+
+def join_courses(results: Dict[str, List[Dict]]) -> List[Dict[str, Dict]]:
+    """Group the strategies' courses: {strategy: course} per course, in priority order
+
+    A course joins a group that shares one of its course numbers and its
+    name key and has nothing yet from its strategy.
+    """
+    groups = []
+    by_number: Dict[str, List[int]] = {}
+    for strategy in STRATEGIES:
+        for course in results.get(strategy, []):
+            numbers = [str(n) for n in course.get('course_numbers') or []]
+            if not numbers:
+                continue
+            key = name_key(course.get('full_name'))
+            candidates = sorted({g for n in numbers for g in by_number.get(n, [])})
+            target = next((g for g in candidates
+                           if groups[g]['name'] == key and strategy not in groups[g]['found']), None)
+            if target is None:
+                target = len(groups)
+                groups.append({'name': key, 'found': {}})
+            groups[target]['found'][strategy] = course
+            for n in numbers:
+                if target not in by_number.setdefault(n, []):
+                    by_number[n].append(target)
+    return [group['found'] for group in groups]
+
+def reconcile(results: Dict[str, List[Dict]]) -> Tuple[List[Dict], Dict[str, Counter], List[Dict]]:
+    """Join strategy outputs (join_courses) and vote field by field
+
+    Returns the merged courses, in the order the highest-priority strategy
+    listed them, counts per field of contested votes ({"decided": ...,
+    "tied": ...}: won by a majority, or tied and given to the earliest
+    strategy), and the courses dropped because only one strategy other than
+    the primary found them.
+    """
+    merged = []
+    dropped = []
+    contested = {'decided': Counter(), 'tied': Counter()}
+    for found in join_courses(results):
+        base = found[next(s for s in STRATEGIES if s in found)]
+        if len(found) == 1 and PRIMARY_STRATEGY not in found:
+            dropped.append(base)
+            continue
+
+        course = dict(base)
+        for field in VOTED_FIELDS:
+            values = [(s, found[s][field]) for s in STRATEGIES if s in found and field in found[s]]
+            if not values:
+                continue
+            course[field], agreed, voters, tied = vote_value(values, VOTE_KEYS.get(field),
+                                                               field in PREFIX_FIELDS)
+            if tied:
+                contested['tied'][field] += 1
+            elif agreed < voters:
+                contested['decided'][field] += 1
+        if PRIMARY_STRATEGY in found:
+            course['pathway'] = found[PRIMARY_STRATEGY].get('pathway')
+        else:
+            course['pathway'] = vote_value([(s, found[s].get('pathway')) for s in STRATEGIES if s in found])[0]
+        course['found_by'] = [s for s in STRATEGIES if s in found]
+        merged.append(course)
+
+    return merged, contested, dropped
+
+def ensemble_parse(pdf_path: str, strategies: List[str], workers: Optional[int] = None,
+                   base_url: Optional[str] = None,
+                   cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> Tuple[List[Dict], Dict[str, Counter], List[Dict]]:
+    """Extract once, run the chosen strategies in parallel, and reconcile"""
+    print("Extracting pages once for all strategies...")
+    start = time.perf_counter()
+    shared = extract_shared(pdf_path, workers)
+    print(f"Extraction: {time.perf_counter() - start:.1f}s\n")
+
+    runners = {
+        'final': run_final,
+        'westview': run_westview,
+        'chunks': run_chunks,
+        'model': lambda s: run_model(s, base_url, cache_dir),
+    }
+
+    def timed(strategy: str) -> Tuple[List[Dict], float]:
+        started = time.perf_counter()
+        courses = runners[strategy](shared)
+        return courses, time.perf_counter() - started
+
+    # The regex strategies are light next to extraction, and the model
+    # strategy waits on the network, so threads are enough here
+    with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+        futures = {strategy: executor.submit(timed, strategy) for strategy in strategies}
+        results = {}
+        for strategy, future in futures.items():
+            results[strategy], elapsed = future.result()
+            print(f"  {strategy}: {len(results[strategy])} courses in {elapsed:.2f}s")
+
+    return reconcile(results)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every parser over one extraction and vote per field")
+    parser.add_argument('pdf_path', nargs='?', default="Westview Course Catalog 2025-2026.pdf")
+    parser.add_argument('--output', default="westview_courses_ensemble.json")
+    parser.add_argument('--workers', type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument('--model', action='store_true', help="Include convert.py's model path as a strategy")
+    parser.add_argument('--base-url', default=None, help="Messages API base URL (e.g. a local stub)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Response cache directory")
+    args = parser.parse_args()
+
+    print("=== Westview Course Catalog (ensemble) ===\n")
+
+    strategies = [s for s in STRATEGIES if s != 'model' or args.model]
+    courses, contested, dropped = ensemble_parse(args.pdf_path, strategies, args.workers,
+                                                 args.base_url, args.cache_dir)
+    if not courses:
+        print("ERROR: No courses found")
+        sys.exit(1)
+
+    save_to_json(courses, args.output)
+
+    print(f"\nReconciled {len(courses)} courses")
+    coverage = Counter(len(course['found_by']) for course in courses)
+    for count in sorted(coverage, reverse=True):
+        print(f"  found by {count} strategies: {coverage[count]}")
+    if dropped:
+        print(f"\nDropped {len(dropped)} found by one secondary strategy only:")
+        for course in dropped:
+            print(f"  {course['full_name'][:50]:<50} {', '.join(course['course_numbers'])}")
+    for outcome, heading in (('decided', "decided by majority"),
+                             ('tied', "tied, given to the earliest strategy")):
+        if contested[outcome]:
+            print(f"\nContested fields, {heading}:")
+            for field, count in contested[outcome].most_common():
+                print(f"  {field}: {count}")
+
+if __name__ == "__main__":
+    main()
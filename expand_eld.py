@@ -5,6 +5,8 @@ Expand ELD to English Language Development (ELD) in course names.
 
 import json
 
+from course_record import Course, load_catalog
+
 def expand_eld(courses):
     """Expand ELD abbreviation in course names"""
     fixes = 0
@@ -29,7 +31,7 @@ def main():
     print('\nLoading courses_complete.json...\n')
 
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
 
@@ -40,7 +42,7 @@ def main():
     # Save
     print('Saving updated data...')
     with open('src/data/courses_complete.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=Course.to_dict)
 
     print('✓ Done!\n')
 
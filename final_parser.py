@@ -7,33 +7,202 @@ Uses a two-pass approach: find course headers first, then extract details.
 import pdfplumber
 import json
 import re
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import argparse
 import sys
 
-def extract_courses_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
+from catalog_sections import find_sections, find_section, shard_sections
+from column_extraction import page_columns
+from header_detection import detect_header_runs, is_header_line
+from word_index import PageWordIndex, extract_label_fields
+
+# The catalog prints categories in curly quotes: UC/CSU: “C”
+UC_CSU_QUOTES = '"\'“”‘’'
+UC_CSU_PATTERN = r'UC/CSU:\s*([' + UC_CSU_QUOTES + r']?[A-G][' + UC_CSU_QUOTES + r']?|None|N/A|Pending)'
+
+# Entries keep the full description; field heuristics read only its start,
+# and the schema's notes are cut shorter still
+FIELD_TEXT_LIMIT = 800
+NOTES_LIMIT = 500
+
+def extract_courses_from_pdf(pdf_path: str, section_title: Optional[str] = None,
+                             workers: Optional[int] = None, field_mode: str = 'regex') -> List[Dict[str, Any]]:
     """Extract all courses from the Westview catalog PDF"""
+    courses = []
+    for _, section_courses, _ in extract_sections_from_pdf(pdf_path, section_title,
+                                                           workers, field_mode):
+        courses.extend(section_courses)
+    return courses
+
+def extract_sections_from_pdf(pdf_path: str, section_title: Optional[str] = None,
+                              workers: Optional[int] = None,
+                              field_mode: str = 'regex') -> List[Tuple[Dict, List[Dict[str, Any]], List[Dict]]]:
+    """Extract courses department by department, one worker per section
+
+    Sections come from the catalog's table of contents, so each department's
+    pages are extracted and parsed independently and pathway is taken from
+    the section. Pass section_title to reprocess a single department.
+    field_mode 'words' reads labelled fields from a word-level spatial index
+    instead of regexes over the flattened description.
+    """
 
-    print("Extracting text from PDF...")
+    print("Reading table of contents...")
 
     with pdfplumber.open(pdf_path) as pdf:
-        all_text = ""
-        for i, page in enumerate(pdf.pages, 1):
-            text = page.extract_text()
-            if text:
-                all_text += text + "\n"
-            if i % 10 == 0:
-                print(f"  Processed {i}/{len(pdf.pages)} pages...")
+        total_pages = len(pdf.pages)
+        shards = shard_sections(find_sections(pdf))
+
+    if not shards:
+        print("  No department sections found, parsing the whole document")
+        shards = [{
+            'title': 'Catalog',
+            'pathway': None,
+            'start_page': 1,
+            'end_page': total_pages
+        }]
+
+    if section_title:
+        section = find_section(shards, section_title)
+        if not section:
+            available = ', '.join(s['title'] for s in shards)
+            raise ValueError(f"Unknown section '{section_title}'. Available: {available}")
+        shards = [section]
+
+    print(f"Parsing {len(shards)} sections...\n")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(parse_section, [pdf_path] * len(shards), shards,
+                                    [field_mode] * len(shards)))
+
+    for section, (section_courses, provenance) in zip(shards, results):
+        print(f"  {section['title']} (pages {section['start_page']}-{section['end_page']}): "
+              f"{len(section_courses)} courses")
+
+    print(f"\nSuccessfully parsed {sum(len(r[0]) for r in results)} courses")
+    return [(section, section_courses, provenance)
+            for section, (section_courses, provenance) in zip(shards, results)]
+
+def parse_section(pdf_path: str, section: Dict, field_mode: str = 'regex') -> Tuple[List[Dict[str, Any]], List[Dict]]:
+    """Extract and parse the pages of one department section
+
+    Returns the courses and, for each course, where it came from in the PDF.
+    """
+
+    word_indexes = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        lines = []
+        sources = []
+        for page_no in range(section['start_page'], section['end_page'] + 1):
+            page = pdf.pages[page_no - 1]
+            page_lines, page_sources = extract_page_lines(page, page_no)
+            lines.extend(page_lines)
+            sources.extend(page_sources)
+            if field_mode == 'words':
+                word_indexes[page_no] = PageWordIndex.from_page(page, page_no)
+
+    return parse_lines(lines, sources, section, word_indexes)
+
+def parse_lines(lines: List[str], sources: List[Dict], section: Dict,
+                word_indexes: Dict[int, PageWordIndex]) -> Tuple[List[Dict[str, Any]], List[Dict]]:
+    """Parse positioned lines into courses and their provenance entries"""
+    courses = []
+    provenance = []
+    for data in find_course_entries(lines, [source['header'] for source in sources]):
+        entry = build_provenance_regions(sources[data['line_start']:data['line_end'] + 1])
+        if word_indexes:
+            data['fields'] = extract_label_fields([
+                (word_indexes[region['page']], region['bbox']) for region in entry
+            ])
+
+        course = parse_course(data, section['pathway'])
+        if course:
+            courses.append(course)
+            provenance.append({
+                'course_id': course['course_id'],
+                'course_numbers': course['course_numbers'],
+                'section': section['title'],
+                'regions': entry
+            })
+
+    return courses, provenance
+
+def extract_page_lines(page, page_no: int, header_mode: str = 'font') -> Tuple[List[str], List[Dict]]:
+    """Text lines of a page (same lines as extract_text) with their positions
+
+    With header_mode 'font', each line is flagged if it is a bold header run.
+    Pages without any bold runs flag every line, so the header regex still
+    sees them; 'bold' records only the lines that really are header runs.
+    """
+    lines = []
+    sources = []
+
+    # Multi-column pages are read one column at a time, so line numbers
+    # run down the first column and then on through the next
+    for column in page_columns(page):
+        runs = detect_header_runs(column.chars) if header_mode == 'font' else []
+
+        for line in column.extract_text_lines():
+            bold = bool(runs) and is_header_line(line['bottom'], runs)
+            lines.append(line['text'])
+            sources.append({
+                'page': page_no,
+                'line': len(sources),
+                'bbox': (line['x0'], line['top'], line['x1'], line['bottom']),
+                'header': bold if runs else True,
+                'bold': bold
+            })
 
-    print(f"Total characters: {len(all_text)}")
-    print("\nFinding course entries...")
+    return lines, sources
+
+def build_provenance_regions(sources: List[Dict]) -> List[Dict]:
+    """The page regions a course was parsed from
+
+    A course that runs onto the next page gets one region per page, each with
+    its page-local line span and the bounding box of those lines.
+    """
+    regions = []
+    for source in sources:
+        if not regions or regions[-1]['page'] != source['page']:
+            regions.append({
+                'page': source['page'],
+                'lines': [source['line'], source['line']],
+                'bbox': list(source['bbox'])
+            })
+            continue
+
+        region = regions[-1]
+        region['lines'][1] = source['line']
+        x0, top, x1, bottom = source['bbox']
+        region['bbox'] = [
+            min(region['bbox'][0], x0),
+            min(region['bbox'][1], top),
+            max(region['bbox'][2], x1),
+            max(region['bbox'][3], bottom)
+        ]
+
+    for region in regions:
+        region['bbox'] = [round(v, 2) for v in region['bbox']]
+
+    return regions
+
+def find_course_entries(lines: List[str], header_flags: Optional[List[bool]] = None) -> List[Dict]:
+    """Find course headers in a block of lines and collect their details
+
+    header_flags marks the lines set in the header font (see
+    header_detection.py). When given, only those lines are tried against
+    the header pattern.
+    """
 
     # Find all lines that match the course header pattern
     # Pattern: course code numbers followed by GRADES: and UC/CSU:
-    lines = all_text.split('\n')
     courses_data = []
-
     i = 0
     while i < len(lines):
+        if header_flags is not None and not header_flags[i]:
+            i += 1
+            continue
+
         line = lines[i].strip()
 
         # Look for course number pattern followed by GRADES:
@@ -47,29 +216,32 @@ def extract_courses_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
 
             # Look for UC/CSU on same line or next line
             uc_csu_str = 'N/A'
-            uc_match = re.search(r'UC/CSU:\s*(["\']?[A-G]["\']?|None|N/A|Pending)', line[match.end():])
+            uc_match = re.search(UC_CSU_PATTERN, line[match.end():])
             if uc_match:
-                uc_csu_str = uc_match.group(1).strip('"\'')
+                uc_csu_str = uc_match.group(1).strip(UC_CSU_QUOTES)
             elif i + 1 < len(lines):
-                uc_match = re.search(r'UC/CSU:\s*(["\']?[A-G]["\']?|None|N/A|Pending)', lines[i+1])
+                uc_match = re.search(UC_CSU_PATTERN, lines[i+1])
                 if uc_match:
-                    uc_csu_str = uc_match.group(1).strip('"\'')
+                    uc_csu_str = uc_match.group(1).strip(UC_CSU_QUOTES)
 
             # The course name should be before the numbers
             name_part = line[:match.start()].strip()
+            line_start = i
 
             # If name is empty, check previous line(s)
-            if not name_part and i > 0:
+            if not name_part and i > 0 and (header_flags is None or header_flags[i-1]):
                 name_part = lines[i-1].strip()
+                line_start = i - 1
 
-            # Get the course description (next few lines until we hit another course or special marker)
+            # Get the course description (every line until the next course header or the end of the section)
             description_lines = []
             j = i + 1
-            while j < len(lines) and j < i + 20:  # Look ahead max 20 lines
+            while j < len(lines):
                 next_line = lines[j].strip()
 
                 # Stop if we hit another course header
-                if re.search(r'\d{6}(?:\s*-\s*\d{6})?\s+GRADES?:', next_line):
+                if (header_flags is None or header_flags[j]) and \
+                        re.search(r'\d{6}(?:\s*-\s*\d{6})?\s+GRADES?:', next_line):
                     break
 
                 # Stop if we hit section headers or page markers
@@ -89,28 +261,21 @@ def extract_courses_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
                 'numbers': course_numbers,
                 'grades': grades_str,
                 'uc_csu': uc_csu_str,
-                'description': description[:800]  # Limit description length
+                'description': description,
+                'line_start': line_start,
+                'line_end': j - 1
             })
 
         i += 1
 
-    print(f"Found {len(courses_data)} courses\n")
+    return courses_data
 
-    # Parse each course
-    courses = []
-    for i, data in enumerate(courses_data, 1):
-        course = parse_course(data)
-        if course:
-            courses.append(course)
-
-        if i % 20 == 0:
-            print(f"  Parsed {i}/{len(courses_data)} courses...")
-
-    print(f"\nSuccessfully parsed {len(courses)} courses")
-    return courses
+def parse_course(data: Dict, section_pathway: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Parse course data into JSON schema
 
-def parse_course(data: Dict) -> Optional[Dict[str, Any]]:
-    """Parse course data into JSON schema"""
+    section_pathway comes from the catalog's table of contents; keyword
+    guessing is only used for departments that mix subjects.
+    """
 
     # Extract course numbers
     course_numbers = re.findall(r'\d{6}', data['numbers'])
@@ -126,16 +291,20 @@ def parse_course(data: Dict) -> Optional[Dict[str, Any]]:
 
     # Generate course ID
     course_id = generate_course_id(data['name'], course_numbers[0] if course_numbers else '')
+    description = data['description'][:FIELD_TEXT_LIMIT]
 
     # Determine pathway/subject
-    pathway = determine_pathway(data['name'], data['description'])
+    pathway = section_pathway or determine_pathway(data['name'], description)
 
     # Extract prerequisites
-    prereq_req, prereq_rec = extract_prerequisites(data['description'])
+    if 'fields' in data:
+        prereq_req, prereq_rec = prerequisites_from_fields(data['fields'])
+    else:
+        prereq_req, prereq_rec = extract_prerequisites(description)
 
     # Determine term info
     term_length, offered_terms, semester_restrictions = determine_term_info(
-        data['description'], data['name']
+        description, data['name']
     )
 
     # Calculate credits
@@ -178,7 +347,7 @@ def parse_course(data: Dict) -> Optional[Dict[str, Any]]:
         "is_graduation_requirement": is_grad_req,
         "semester_restrictions": semester_restrictions,
         "alternate_ids": [],
-        "notes": data['description'][:500]
+        "notes": description[:NOTES_LIMIT]
     }
 
     return course
@@ -258,6 +427,21 @@ def extract_prerequisites(text: str) -> tuple:
 
     return prereq_required, prereq_recommended
 
+def prerequisites_from_fields(fields: Dict[str, str]) -> tuple:
+    """Prerequisites from label fields read off the word index"""
+    prereq_required = []
+    prereq_recommended = []
+
+    required = fields.get('Required Prerequisites')
+    if required and required.lower() != 'none':
+        prereq_required.append(required[:200])
+
+    recommended = fields.get('Recommended Prerequisites')
+    if recommended and recommended.lower() != 'none':
+        prereq_recommended.append(recommended[:200])
+
+    return prereq_required, prereq_recommended
+
 def determine_term_info(text: str, name: str) -> tuple:
     """Determine term length and offerings"""
     text_lower = text.lower()
@@ -303,7 +487,7 @@ def is_graduation_requirement(pathway: str, name: str) -> bool:
 
     return False
 
-def save_to_json(courses: List[Dict], output_path: str):
+def save_to_json(courses: List[Dict], output_path: str, sections: Optional[List[Dict]] = None):
     """Save to JSON"""
     output = {
         "generated_for": "Westview HS Course Catalog 2025-2026",
@@ -312,25 +496,203 @@ def save_to_json(courses: List[Dict], output_path: str):
         "courses": courses
     }
 
+    # Section index: courses are stored in section order, so each
+    # department can be swapped out on its own later
+    if sections is not None:
+        output["sections"] = sections
+
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(output, f, indent=2, ensure_ascii=False)
 
     print(f"Saved to {output_path}")
 
+def provenance_path(output_path: str) -> str:
+    """Sidecar provenance index path for an output file"""
+    base = output_path[:-5] if output_path.endswith('.json') else output_path
+    return f"{base}.provenance.json"
+
+def save_provenance(provenance: List[Dict], output_path: str, pdf_path: str):
+    """Save the provenance index next to the output file
+
+    Entries are in the same order as the output's courses.
+    """
+    path = provenance_path(output_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"source_pdf": pdf_path, "courses": provenance}, f, indent=2, ensure_ascii=False)
+
+    print(f"Saved provenance to {path}")
+
+def load_output(output_path: str) -> Tuple[Dict, List[Dict]]:
+    """Load an existing output file and its provenance index"""
+    with open(output_path, 'r', encoding='utf-8') as f:
+        existing = json.load(f)
+
+    if 'sections' not in existing:
+        raise ValueError(f"{output_path} has no section index; run a full parse first")
+
+    with open(provenance_path(output_path), 'r', encoding='utf-8') as f:
+        provenance = json.load(f)['courses']
+
+    return existing, provenance
+
+def section_summary(section: Dict, section_courses: List[Dict]) -> Dict:
+    """Section entry for the output index"""
+    return {
+        "title": section['title'],
+        "pathway": section['pathway'],
+        "start_page": section['start_page'],
+        "end_page": section['end_page'],
+        "course_count": len(section_courses)
+    }
+
+def merge_section(output_path: str, section: Dict, section_courses: List[Dict],
+                  section_provenance: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Replace one section's courses in an existing output file"""
+    existing, existing_provenance = load_output(output_path)
+
+    courses = []
+    sections = []
+    provenance = []
+    offset = 0
+    replaced = False
+    for entry in existing['sections']:
+        old_courses = existing['courses'][offset:offset + entry['course_count']]
+        old_provenance = existing_provenance[offset:offset + entry['course_count']]
+        offset += entry['course_count']
+
+        if entry['title'] == section['title']:
+            old_courses = section_courses
+            old_provenance = section_provenance
+            entry = section_summary(section, section_courses)
+            replaced = True
+
+        courses.extend(old_courses)
+        provenance.extend(old_provenance)
+        sections.append(entry)
+
+    if not replaced:
+        courses.extend(section_courses)
+        provenance.extend(section_provenance)
+        sections.append(section_summary(section, section_courses))
+
+    return courses, sections, provenance
+
+def find_provenance(existing: Dict, provenance: List[Dict], course_ref: str,
+                    page: Optional[int] = None) -> int:
+    """Index of the one course a course number or course_id refers to
+
+    generate_course_id can give different courses the same ID, and some
+    course numbers are shared (the Studio Art variants), so a reference
+    matching several courses is an error listing them; page (a page the
+    course was extracted from) tells them apart.
+    """
+    matches = [i for i, entry in enumerate(provenance)
+               if course_ref == entry['course_id'] or course_ref in entry['course_numbers']]
+    if page is not None:
+        matches = [i for i in matches if any(r['page'] == page for r in provenance[i]['regions'])]
+    if not matches:
+        where = f" on page {page}" if page is not None else ""
+        raise ValueError(f"No provenance recorded for course '{course_ref}'{where}")
+    if len(matches) > 1:
+        candidates = '\n'.join(
+            f"  {provenance[i]['course_id']:<32} {', '.join(provenance[i]['course_numbers']):<16} "
+            f"page {provenance[i]['regions'][0]['page']:<4} {existing['courses'][i].get('full_name', '')}"
+            for i in matches)
+        raise ValueError(f"'{course_ref}' matches {len(matches)} courses; use a course number "
+                         f"or --page to pick one:\n{candidates}")
+    return matches[0]
+
+def reextract_course(pdf_path: str, output_path: str, course_ref: str,
+                     field_mode: str = 'regex', page: Optional[int] = None) -> Dict[str, Any]:
+    """Re-extract and re-parse a single course from its recorded regions
+
+    course_ref is a course number or course_id, narrowed by page when it
+    matches several courses. Only the course's own page regions are
+    cropped and parsed, and the result replaces the course in the output
+    file and provenance index.
+    """
+    existing, provenance = load_output(output_path)
+    index = find_provenance(existing, provenance, course_ref, page)
+
+    entry = provenance[index]
+    section = next((s for s in existing['sections'] if s['title'] == entry['section']),
+                   {'title': entry['section'], 'pathway': None})
+
+    lines = []
+    sources = []
+    word_indexes = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        for region in entry['regions']:
+            pdf_page = pdf.pages[region['page'] - 1]
+            x0, top, x1, bottom = region['bbox']
+            bbox = (max(x0 - 1, 0), max(top - 1, 0),
+                    min(x1 + 1, pdf_page.width), min(bottom + 1, pdf_page.height))
+            cropped = pdf_page.crop(bbox)
+            region_lines, region_sources = extract_page_lines(cropped, region['page'])
+            if field_mode == 'words':
+                word_indexes[region['page']] = PageWordIndex.from_page(cropped, region['page'])
+            # Keep page-local line numbers from the original extraction
+            for source in region_sources:
+                source['line'] += region['lines'][0]
+            lines.extend(region_lines)
+            sources.extend(region_sources)
+
+    courses, course_provenance = parse_lines(lines, sources, section, word_indexes)
+    if not courses:
+        raise ValueError(f"No course header found in the recorded region for '{course_ref}'")
+
+    course = courses[0]
+    existing['courses'][index] = course
+    provenance[index] = course_provenance[0]
+
+    save_to_json(existing['courses'], output_path, existing['sections'])
+    save_provenance(provenance, output_path, pdf_path)
+    return course
+
 def main():
-    pdf_path = "Westview Course Catalog 2025-2026.pdf"
-    output_path = "westview_courses_final.json"
+    parser = argparse.ArgumentParser(description="Westview Course Catalog to JSON")
+    parser.add_argument('pdf_path', nargs='?', default="Westview Course Catalog 2025-2026.pdf")
+    parser.add_argument('--output', default="westview_courses_final.json")
+    parser.add_argument('--section', help="Reprocess one department and merge it into --output")
+    parser.add_argument('--course', help="Re-extract one course (number or course_id) from its recorded region")
+    parser.add_argument('--page', type=int, help="With --course: the page of the course, when the reference is ambiguous")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--fields', choices=['regex', 'words'], default='regex',
+                        help="Read labelled fields with regexes or a word-level spatial index")
+    args = parser.parse_args()
+
+    pdf_path = args.pdf_path
+    output_path = args.output
 
     print("=== Westview Course Catalog to JSON ===\n")
 
+    if args.course:
+        try:
+            course = reextract_course(pdf_path, output_path, args.course, args.fields, args.page)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        print("\nRe-extracted course:")
+        print(json.dumps(course, indent=2))
+        return
+
     try:
-        courses = extract_courses_from_pdf(pdf_path)
+        parsed = extract_sections_from_pdf(pdf_path, args.section, args.workers, args.fields)
+
+        if args.section:
+            section, section_courses, section_provenance = parsed[0]
+            courses, sections, provenance = merge_section(output_path, section, section_courses, section_provenance)
+        else:
+            courses = [c for _, section_courses, _ in parsed for c in section_courses]
+            sections = [section_summary(s, section_courses) for s, section_courses, _ in parsed]
+            provenance = [p for _, _, section_provenance in parsed for p in section_provenance]
 
         if not courses:
             print("ERROR: No courses found")
             sys.exit(1)
 
-        save_to_json(courses, output_path)
+        save_to_json(courses, output_path, sections)
+        save_provenance(provenance, output_path, pdf_path)
 
         print(f"\n=== SUCCESS ===")
         print(f"Extracted {len(courses)} courses")
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
-import json
+
+from course_record import load_catalog
 
 with open('src/data/courses_complete.json', 'r') as f:
-    data = json.load(f)
+    data = load_catalog(f)
 courses = data['courses']
 
 print('SEARCHING FOR PAIRING PATTERNS IN COURSE NAMES:\n')
@@ -28,7 +29,7 @@ print('\n\nLANGUAGE COURSE PROGRESSIONS:')
 spanish = [c for c in courses if 'SPANISH' in c['full_name']]
 for c in sorted(spanish, key=lambda x: x['full_name'])[:6]:
     print(f"  - {c['full_name']}")
-    print(f"    grades: {c['grades_allowed']}, term_length: {c['term_length']}")
+    print(f"    grades: {list(c['grades_allowed'])}, term_length: {c['term_length']}")
     prereqs = c.get('prerequisites_required', [''])[0][:80]
     if prereqs and prereqs != 'None':
         print(f"    prereq: {prereqs}...")
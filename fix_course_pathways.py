@@ -5,6 +5,8 @@ Fix incorrectly categorized course pathways in courses_complete.json
 
 import json
 
+from course_record import Course, load_catalog
+
 def fix_pathways(courses):
     """Fix pathway assignments for miscategorized courses"""
     fixes = 0
@@ -46,7 +48,7 @@ def fix_pathways(courses):
 def main():
     print('Loading courses_complete.json...')
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
 
@@ -58,7 +60,7 @@ def main():
     # Save fixed data
     print('Saving fixed data to courses_complete.json...')
     with open('src/data/courses_complete.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=Course.to_dict)
 
     print('✓ Done!\n')
 
@@ -7,6 +7,8 @@ Each course must have a unique course_id.
 import json
 import re
 
+from course_record import Course, load_catalog
+
 def generate_course_id(full_name, existing_ids):
     """Generate a unique course ID from course name"""
     # Remove special characters and convert to uppercase
@@ -81,7 +83,7 @@ def main():
     print('\nLoading courses_complete.json...\n')
 
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
 
@@ -94,7 +96,7 @@ def main():
     if fixes > 0:
         print('\nSaving updated data...')
         with open('src/data/courses_complete.json', 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, indent=2, default=Course.to_dict)
         print('✓ Done!')
     else:
         print('\nNo changes needed.')
@@ -6,6 +6,8 @@ All foreign language level courses (X-X) should be semester, not yearlong.
 
 import json
 
+from course_record import Course, load_catalog
+
 def fix_foreign_language_terms(courses):
     """Fix foreign language courses to be semester-based"""
     fixes = 0
@@ -35,7 +37,7 @@ def main():
     print('\nLoading courses_complete.json...\n')
 
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
     print('Converting foreign language courses to semester-based...\n')
@@ -47,7 +49,7 @@ def main():
     # Save
     print('Saving updated data...')
     with open('src/data/courses_complete.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=Course.to_dict)
 
     print('✓ Done!\n')
 
@@ -6,6 +6,8 @@ Move tutor/aide courses to Electives instead.
 
 import json
 
+from course_record import Course, load_catalog
+
 def fix_offroll(courses):
     """Move tutor/aide courses back to their original pathways"""
     fixes = 0
@@ -74,7 +76,7 @@ def main():
     print('\nLoading courses_complete.json...\n')
 
     with open('src/data/courses_complete.json', 'r') as f:
-        data = json.load(f)
+        data = load_catalog(f)
 
     print(f'Total courses: {len(data["courses"])}\n')
     print('Moving current Off-Roll courses to Electives...\n')
@@ -88,7 +90,7 @@ def main():
     # Save
     print('\nSaving updated data...')
     with open('src/data/courses_complete.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=Course.to_dict)
 
     print('✓ Done!\n')
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Font-aware course header detection.
+Course headers in the Westview catalog are set entirely in bold at body
+text size. Field labels ("Recommended Prerequisites:") are bold too, but are
+followed by regular text on the same line; department headings and the
+title page use much larger sizes. One pass over page.chars is enough to
+tell them apart.
+"""
+
+from collections import Counter
+from typing import List, Dict
+
+# Chars whose bottoms differ by less than this are on the same line
+LINE_TOLERANCE = 1.5
+
+# Header text must be within this many points of the body text size
+SIZE_TOLERANCE = 0.5
+
+def is_bold_font(fontname: str) -> bool:
+    """Check if a PDF font name is a bold face"""
+    name = fontname.split('+', 1)[-1].lower()
+    return any(weight in name for weight in ('bold', 'black', 'heavy', 'semibold'))
+
+def detect_header_runs(chars: List[Dict]) -> List[Dict]:
+    """Find course header runs on a page
+
+    A run is a line whose visible chars are all bold and at body text size.
+    Returns runs in reading order with their text and bounding box.
+    """
+    sizes = Counter()
+    lines = {}
+
+    for char in chars:
+        if not char['text'].strip():
+            continue
+
+        size = round(char['size'], 1)
+        sizes[size] += 1
+
+        key = round(char['bottom'] / LINE_TOLERANCE)
+        line = lines.get(key)
+        if line is None:
+            line = lines[key] = {'chars': [], 'bold': True, 'sizes': set()}
+        line['chars'].append(char)
+        line['bold'] = line['bold'] and is_bold_font(char['fontname'])
+        line['sizes'].add(size)
+
+    if not sizes:
+        return []
+
+    body_size = sizes.most_common(1)[0][0]
+    runs = []
+    for key in sorted(lines):
+        line = lines[key]
+        if not line['bold']:
+            continue
+        if any(abs(size - body_size) > SIZE_TOLERANCE for size in line['sizes']):
+            continue
+
+        line_chars = sorted(line['chars'], key=lambda c: c['x0'])
+        runs.append({
+            'text': ''.join(c['text'] for c in line_chars),
+            'x0': min(c['x0'] for c in line_chars),
+            'x1': max(c['x1'] for c in line_chars),
+            'top': min(c['top'] for c in line_chars),
+            'bottom': max(c['bottom'] for c in line_chars),
+            'size': body_size
+        })
+
+    return runs
+
+def is_header_line(line_bottom: float, runs: List[Dict]) -> bool:
+    """Check if a text line (by its bottom) is one of the header runs"""
+    return any(abs(run['bottom'] - line_bottom) <= LINE_TOLERANCE for run in runs)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Hybrid Westview catalog parser.
+Every course is parsed with final_parser's regexes and given a confidence
+score; only courses below the threshold are sent to the model path in
+convert.py (batched, cached, and pointable at llm_stub_server.py), and the
+model's answers are merged back in by course number and name.
+"""
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import pdfplumber
+
+import convert
+from catalog_sections import find_sections, shard_sections
+from ensemble_parser import name_key
+from final_parser import (extract_page_lines, find_course_entries, parse_course,
+                          save_to_json)
+from llm_cache import DEFAULT_CACHE_DIR, ResponseCache
+
+# Courses scoring below this go to the model
+CONFIDENCE_THRESHOLD = 0.7
+
+# How much each warning sign lowers a course's confidence (from 1.0)
+PENALTIES = {
+    'empty_name': 0.5,
+    'no_course_numbers': 0.5,
+    'missing_uc_csu': 0.35,
+    'unparsed_prerequisites': 0.35,
+    'implausible_credits': 0.35,
+    'short_description': 0.2,
+}
+
+# Credits the catalog actually uses for each term length
+EXPECTED_CREDITS = {'yearlong': 10.0, 'semester': 5.0, 'quarter': 2.5}
+
+# Fields taken from the model's answer; course_id, course_numbers and the
+# section pathway stay as the regex parser found them
+MODEL_FIELDS = [
+    'full_name', 'grades_allowed', 'credits', 'credit_type', 'uc_csu_category',
+    'term_length', 'offered_terms', 'prerequisites_required',
+    'prerequisites_recommended', 'semester_restrictions',
+]
+
+def score_course(data: Dict, course: Dict) -> Tuple[float, List[str]]:
+    """Confidence in a regex-parsed course (0-1) and the reasons it was lowered"""
+    reasons = []
+    text = data.get('text', data['description'])
+
+    if not re.search(r'[A-Za-z]', course['full_name']):
+        reasons.append('empty_name')
+
+    if not course['course_numbers']:
+        reasons.append('no_course_numbers')
+
+    # find_course_entries also reports 'N/A' when it read no value at all
+    if data['uc_csu'] == 'N/A' and not re.search(r'UC(?:/CSU)?:\s*N/A', text):
+        reasons.append('missing_uc_csu')
+
+    stated = re.search(r'Prerequisites?:\s*(\S+)', text)
+    if stated and stated.group(1).lower() != 'none' and \
+            not course['prerequisites_required'] and not course['prerequisites_recommended']:
+        reasons.append('unparsed_prerequisites')
+
+    expected = EXPECTED_CREDITS.get(course['term_length'])
+    if course['credits'] not in EXPECTED_CREDITS.values() or \
+            (expected and course['credits'] not in (expected, 2.5)) or \
+            (re.search(r'\b\d-\d\b', course['full_name']) and course['term_length'] != 'yearlong'):
+        reasons.append('implausible_credits')
+
+    if len(data['description']) < 80:
+        reasons.append('short_description')
+
+    confidence = max(0.0, 1.0 - sum(PENALTIES[r] for r in reasons))
+    return round(confidence, 2), reasons
+
+def score_section(pdf_path: str, section: Dict) -> List[Dict[str, Any]]:
+    """Regex-parse one department section, scoring each course
+
+    Each entry also carries the course's raw text, ready to send to the model.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        lines = []
+        sources = []
+        for page_no in range(section['start_page'], section['end_page'] + 1):
+            page_lines, page_sources = extract_page_lines(pdf.pages[page_no - 1], page_no)
+            lines.extend(page_lines)
+            sources.extend(page_sources)
+
+    scored = []
+    for data in find_course_entries(lines, [source['header'] for source in sources]):
+        data['text'] = '\n'.join(lines[data['line_start']:data['line_end'] + 1])
+        course = parse_course(data, section['pathway'])
+        if not course:
+            continue
+        confidence, reasons = score_course(data, course)
+        scored.append({
+            'course': course,
+            'confidence': confidence,
+            'reasons': reasons,
+            'text': data['text']
+        })
+    return scored
+
+def merge_model_courses(entries: List[Dict], model_courses: List[Dict]) -> int:
+    """Fill low-confidence courses from the model's answers, matched by course number and name
+
+    Courses sharing a number (the Studio Art variants on 000150) take the
+    answer whose name matches theirs (name_key); a course whose numbers
+    lead to a single answer takes it even if the names differ.
+    Returns how many courses were updated.
+    """
+    by_number: Dict[str, List[Dict]] = {}
+    for model_course in model_courses:
+        for number in model_course.get('course_numbers') or []:
+            by_number.setdefault(str(number), []).append(model_course)
+
+    merged = 0
+    for entry in entries:
+        course = entry['course']
+        candidates = []
+        for number in course['course_numbers']:
+            for model_course in by_number.get(number, []):
+                if not any(model_course is c for c in candidates):
+                    candidates.append(model_course)
+        key = name_key(course['full_name'])
+        match = next((c for c in candidates if name_key(c.get('full_name')) == key), None)
+        if match is None and len(candidates) == 1:
+            match = candidates[0]
+        if match is None:
+            continue
+        for field in MODEL_FIELDS:
+            value = match.get(field)
+            if value not in (None, '', []):
+                course[field] = value
+        merged += 1
+    return merged
+
+def hybrid_parse(pdf_path: str, threshold: float = CONFIDENCE_THRESHOLD,
+                 workers: Optional[int] = None, base_url: Optional[str] = None,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, concurrency: int = 8,
+                 requests_per_second: float = 4.0, dry_run: bool = False) -> Tuple[List[Dict], List[Dict]]:
+    """Parse the catalog, sending only low-confidence courses to the model
+
+    Returns the courses and the scored entries that went (or, with dry_run,
+    would have gone) to the model.
+    """
+    print("Reading table of contents...")
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        shards = shard_sections(find_sections(pdf))
+    if not shards:
+        shards = [{'title': 'Catalog', 'pathway': None, 'start_page': 1, 'end_page': total_pages}]
+
+    print(f"Regex-parsing {len(shards)} sections...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        entries = [e for section_entries in executor.map(score_section, [pdf_path] * len(shards), shards)
+                   for e in section_entries]
+
+    low = [e for e in entries if e['confidence'] < threshold]
+    print(f"{len(low)}/{len(entries)} courses below confidence {threshold}")
+
+    if low and not dry_run:
+        cache = ResponseCache(cache_dir) if cache_dir else None
+        print(f"Sending {len(low)} courses to the model...")
+        model_courses = convert.parse_chunks_with_model(
+            [e['text'] for e in low], cache, concurrency=concurrency,
+            requests_per_second=requests_per_second, base_url=base_url)
+        merged = merge_model_courses(low, model_courses)
+        print(f"Merged model answers into {merged}/{len(low)} courses")
+
+    return [e['course'] for e in entries], low
+
+def main():
+    parser = argparse.ArgumentParser(description="Regex parse with model fallback for low-confidence courses")
+    parser.add_argument('pdf_path', nargs='?', default="Westview Course Catalog 2025-2026.pdf")
+    parser.add_argument('--output', default="westview_courses_hybrid.json")
+    parser.add_argument('--threshold', type=float, default=CONFIDENCE_THRESHOLD)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--base-url', default=None, help="Messages API base URL (e.g. a local stub)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Response cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="Send every batch, ignoring the cache")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--rps', type=float, default=4.0, help="Max requests per second")
+    parser.add_argument('--dry-run', action='store_true', help="Only score courses; don't call the model")
+    args = parser.parse_args()
+
+    print("=== Westview Course Catalog (hybrid) ===\n")
+
+    courses, low = hybrid_parse(args.pdf_path, args.threshold, args.workers, args.base_url,
+                                None if args.no_cache else args.cache_dir,
+                                args.concurrency, args.rps, args.dry_run)
+    if not courses:
+        print("ERROR: No courses found")
+        sys.exit(1)
+
+    print("\nLow-confidence courses:")
+    for entry in low:
+        print(f"  {entry['confidence']:.2f}  {entry['course']['full_name'][:50]:<50} "
+              f"{', '.join(entry['reasons'])}")
+
+    if args.dry_run:
+        return
+
+    save_to_json(courses, args.output)
+    print(f"\nExtracted {len(courses)} courses, {len(low)} via the model")
+
+if __name__ == "__main__":
+    main()
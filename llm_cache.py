@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of model responses for convert.py.
+Entries are keyed by a hash of the model name, prompt version and the
+prompt for a single course chunk (convert.parse_chunks_with_model stores
+each batch reply split back into its chunks), so a rerun only sends
+chunks that were never answered or previously failed, re-tuning how
+chunks are packed into requests keeps every entry, and editing the
+prompt template invalidates old entries on its own.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+# Bump to invalidate every cached response (e.g. after changing how
+# responses are interpreted) without touching the prompt text
+PROMPT_VERSION = "2025-11-17.v1"
+
+DEFAULT_CACHE_DIR = ".llm_cache"
+
+class ResponseCache:
+    """One JSON file per response, named by its key, sharded by key prefix"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, prompt_version: str = PROMPT_VERSION):
+        self.cache_dir = cache_dir
+        self.prompt_version = prompt_version
+
+    def key(self, model: str, prompt: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model, self.prompt_version, prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Cached response text, or None"""
+        try:
+            with open(self.path(self.key(model, prompt)), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry['response_text']
+
+    def put(self, model: str, prompt: str, response_text: str):
+        """Store a response (written atomically, so a crash never leaves half a file)"""
+        path = self.path(self.key(model, prompt))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        entry = {
+            "model": model,
+            "prompt_version": self.prompt_version,
+            "created": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "response_text": response_text
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Local stub of the Anthropic Messages endpoint for exercising convert.py
+without network access or API spend.
+
+Replies to POST /v1/messages after a configurable latency, fails a
+configurable share of requests with 429/529/500 errors, and otherwise
+returns one minimal course per "---COURSE SEPARATOR---" block of the
+prompt, named after the block's first line so ordering can be checked.
+
+    python3 llm_stub_server.py --port 8765 --latency 0.5 --error-rate 0.2
+    python3 convert.py catalog.pdf --concurrent --base-url http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict
+
+ERROR_RESPONSES = [
+    (429, 'rate_limit_error', 'Number of requests has exceeded your rate limit'),
+    (529, 'overloaded_error', 'Overloaded'),
+    (500, 'api_error', 'Internal server error'),
+]
+
+def courses_for_prompt(prompt: str) -> List[Dict]:
+    """One stub course per course block in the prompt, numbered from its header"""
+    if 'Course text:' in prompt:
+        prompt = prompt.split('Course text:', 1)[1]
+    prompt = prompt.split('Return ONLY a JSON array', 1)[0]
+
+    courses = []
+    for block in prompt.split('---COURSE SEPARATOR---'):
+        lines = [line.strip() for line in block.strip().split('\n') if line.strip()]
+        if not lines:
+            continue
+        courses.append({
+            "course_id": f"STUB_{len(courses):04d}",
+            "full_name": lines[0],
+            "course_numbers": re.findall(r'\b\d{6}\b', lines[0]),
+            "notes": ' '.join(lines[1:])[:200]
+        })
+    return courses
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Messages endpoint with injected latency and errors"""
+
+    latency = 0.2
+    jitter = 0.1
+    error_rate = 0.0
+    stats = {'requests': 0, 'errors': 0}
+    stats_lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        with self.stats_lock:
+            self.stats['requests'] += 1
+
+        if not self.path.rstrip('/').endswith('/v1/messages'):
+            self.send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        if random.random() < self.error_rate:
+            with self.stats_lock:
+                self.stats['errors'] += 1
+            status, error_type, message = random.choice(ERROR_RESPONSES)
+            self.send_json(status, {"type": "error", "error": {"type": error_type, "message": message}},
+                           {'retry-after': '0'} if status == 429 else None)
+            return
+
+        request = json.loads(body or b'{}')
+        prompt = ''.join(
+            message['content'] if isinstance(message['content'], str)
+            else ''.join(part.get('text', '') for part in message['content'])
+            for message in request.get('messages', [])
+        )
+        text = json.dumps(courses_for_prompt(prompt))
+
+        self.send_json(200, {
+            "id": f"msg_stub_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get('model', 'stub'),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4}
+        })
+
+    def send_json(self, status: int, payload: Dict, headers: Dict = None):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+def make_server(port: int = 0, latency: float = 0.2, jitter: float = 0.1,
+                error_rate: float = 0.0) -> ThreadingHTTPServer:
+    """Build a stub server (port 0 picks a free port); call serve_forever() to run"""
+    handler = type('ConfiguredStubHandler', (StubHandler,), {
+        'latency': latency,
+        'jitter': jitter,
+        'error_rate': error_rate,
+        'stats': {'requests': 0, 'errors': 0},
+    })
+    return ThreadingHTTPServer(('127.0.0.1', port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Anthropic Messages endpoint")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.2, help="Seconds per response")
+    parser.add_argument('--jitter', type=float, default=0.1, help="+/- seconds added to latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests that fail (0-1)")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    server = make_server(args.port, args.latency, args.jitter, args.error_rate)
+    print(f"Stub messages endpoint on http://127.0.0.1:{server.server_address[1]}/v1/messages")
+    print(f"  latency {args.latency}s ±{args.jitter}s, error rate {args.error_rate:.0%}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = server.RequestHandlerClass.stats
+        print(f"\nServed {stats['requests']} requests, {stats['errors']} injected errors")
+
+if __name__ == "__main__":
+    main()
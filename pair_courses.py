@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Pair regular, Honors and AP variants of the same course.
+Every course's name is reduced to a join key (course_enrichment.base_name:
+no AP/HONORS markers, no level) and the catalog is hash-joined on it in
+one pass, then split by level within each key, so "ENGLISH 1-2" pairs with
+"HONORS ENGLISH 1-2" but not with "ENGLISH 3-4", and "HONORS BIOLOGY 1-2"
+is not taken for a variant of "AP BIOLOGY 3-4" (that is a sequence).
+Courses without a level join the base's only leveled group ("STATISTICS"
+with "AP STATISTICS 1-2").
+
+Within a group holding one course of each variant, pair_course_id is
+written both ways: regular <-> Honors, regular <-> AP, or with all three
+Honors <-> AP and the regular course pointing at the Honors one.
+Groups with two courses of one variant, or whose partner's course_id is
+shared by several records, are reported as ambiguous and left unpaired.
+pair_course_id of every other course is cleared (earlier parsers stored
+"linked w/" courses there; those are in linked_courses).
+is_ap_or_honors_pair is left alone: it marks weighted courses for the GPA,
+not whether a counterpart exists.
+
+    python3 pair_courses.py            # report only
+    python3 pair_courses.py --write    # update courses_complete.json
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from typing import List, Dict, Any, Optional
+
+from course_enrichment import base_name, level_range
+from course_record import Course, load_catalog
+
+CATALOG_PATH = "src/data/courses_complete.json"
+
+# Lowest to highest
+VARIANT_TIERS = ['regular', 'honors', 'ap']
+
+def variant_tier(course) -> str:
+    name = (course.get('full_name') or '').upper()
+    if name.startswith('AP ') or 'ADVANCED PLACEMENT' in name:
+        return 'ap'
+    if 'HONORS' in name.split() or '(H)' in name:
+        return 'honors'
+    return 'regular'
+
+def join_groups(courses: List) -> Dict[str, Dict[Optional[int], List[int]]]:
+    """Indexes of the courses under each join key, split by level"""
+    groups: Dict[str, Dict[Optional[int], List[int]]] = {}
+    for i, course in enumerate(courses):
+        name = course.get('full_name') or ''
+        level, _ = level_range(name)
+        groups.setdefault(base_name(name), {}).setdefault(level, []).append(i)
+
+    # Unleveled courses belong to the base's only leveled group, if it has one
+    for levels in groups.values():
+        leveled = [level for level in levels if level is not None]
+        if None in levels and len(leveled) == 1:
+            levels[leveled[0]].extend(levels.pop(None))
+    return groups
+
+def find_pairs(courses: List) -> Dict[str, Any]:
+    """pair_course_id for each course index, and the groups that could not be paired
+
+    Returns {"pairs": {index: partner course_id}, "ambiguous": [{"key", "courses", "reason"}],
+    "groups": number of groups with more than one variant}.
+    """
+    id_counts = Counter(course['course_id'] for course in courses)
+    pairs: Dict[int, str] = {}
+    ambiguous = []
+    multi_variant = 0
+
+    for key, levels in join_groups(courses).items():
+        for members in levels.values():
+            by_tier: Dict[str, List[int]] = {}
+            for i in members:
+                by_tier.setdefault(variant_tier(courses[i]), []).append(i)
+            if len(by_tier) < 2:
+                continue
+            multi_variant += 1
+
+            names = [courses[i]['full_name'] for i in members]
+            if any(len(indexes) > 1 for indexes in by_tier.values()):
+                ambiguous.append({'key': key, 'courses': names,
+                                  'reason': "more than one course of the same variant"})
+                continue
+            shared = [courses[i]['course_id'] for i in members if id_counts[courses[i]['course_id']] > 1]
+            if shared:
+                ambiguous.append({'key': key, 'courses': names,
+                                  'reason': f"course_id shared by several records: {', '.join(shared)}"})
+                continue
+
+            tiers = [by_tier[t][0] for t in VARIANT_TIERS if t in by_tier]
+            low, high = tiers[-2], tiers[-1]
+            pairs[low] = courses[high]['course_id']
+            pairs[high] = courses[low]['course_id']
+            if len(tiers) == 3:
+                pairs[tiers[0]] = courses[low]['course_id']
+
+    return {'pairs': pairs, 'ambiguous': ambiguous, 'groups': multi_variant}
+
+def apply_pairs(courses: List, pairs: Dict[int, str]) -> List[Dict[str, Any]]:
+    """Write pair_course_id on every course; returns the changes"""
+    changes = []
+    for i, course in enumerate(courses):
+        partner = pairs.get(i)
+        if course.get('pair_course_id') != partner:
+            changes.append({'course': course['full_name'], 'old': course.get('pair_course_id'), 'new': partner})
+            course['pair_course_id'] = partner
+    return changes
+
+def main():
+    parser = argparse.ArgumentParser(description="Pair regular, Honors and AP variants of each course")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('--write', action='store_true', help="Save pair_course_id to the catalog")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        data = load_catalog(f)
+    courses = data['courses']
+
+    start = time.perf_counter()
+    result = find_pairs(courses)
+    elapsed = (time.perf_counter() - start) * 1000
+    names = {course['course_id']: course['full_name'] for course in courses}
+
+    print(f"{len(courses)} courses, {result['groups']} groups with more than one variant "
+          f"({elapsed:.1f} ms)\n")
+    print("PAIRS:")
+    for i, partner in sorted(result['pairs'].items(), key=lambda item: courses[item[0]]['full_name']):
+        print(f"  {courses[i]['full_name']:<44} -> {names[partner]} ({partner})")
+
+    if result['ambiguous']:
+        print(f"\nAMBIGUOUS ({len(result['ambiguous'])}, left unpaired):")
+        for group in result['ambiguous']:
+            print(f"  {group['key']}: {group['reason']}")
+            for name in group['courses']:
+                print(f"    {name}")
+
+    changes = apply_pairs(courses, result['pairs'])
+    print(f"\n{len(changes)} pair_course_id values {'updated' if args.write else 'would change'}")
+    for change in changes:
+        print(f"  {change['course'][:44]:<44} {change['old']} -> {change['new']}")
+
+    if args.write:
+        with open(args.catalog, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=Course.to_dict)
+        print(f"\nSaved to {args.catalog}")
+
+if __name__ == "__main__":
+    main()
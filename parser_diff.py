@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Differential test harness for the catalog parsers.
+Joins each parser's output with the hand-fixed src/data/courses_complete.json
+on course number and reports course- and field-level precision/recall with
+example mismatches. With --run the parsers are re-run first (in a scratch
+directory, so committed outputs are left alone) and their wall time and
+peak memory recorded. --baseline compares against a saved report and exits
+non-zero if any parser got less accurate.
+
+    python3 parser_diff.py --run --save-report diff_report.json
+    python3 parser_diff.py --run --baseline diff_report.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from course_record import Course
+
+REFERENCE_PATH = "src/data/courses_complete.json"
+PDF_PATH = "Westview Course Catalog 2025-2026.pdf"
+
+# Output file -> script that writes it
+PARSERS = {
+    'westview_courses.json': 'westview_pdf_parser.py',
+    'westview_courses_final.json': 'final_parser.py',
+    'courses_output.json': 'pdf_to_json.py',
+}
+
+COMPARED_FIELDS = [
+    'full_name', 'grades_allowed', 'credits', 'credit_type', 'uc_csu_category',
+    'pathway', 'term_length', 'offered_terms', 'prerequisites_required',
+    'prerequisites_recommended', 'semester_restrictions', 'is_graduation_requirement',
+]
+
+# Parser pathway names -> the consolidated names used in courses_complete.json
+# (same mapping as consolidate_pathways.py)
+PATHWAY_ALIASES = {
+    'Mathematics': 'Math',
+    'Visual & Performing Arts': 'Fine Arts',
+    'World Language': 'Foreign Language',
+    'Career Technical Education': 'CTE',
+    'Computer Science & Engineering': 'CTE',
+    'Science - General': 'Science - Physical',
+    'Science': 'Science - Physical',
+    'Elective': 'Electives',
+}
+
+# Name rewrites applied by consolidate_pathways.fix_course_names
+NAME_ALIASES = [
+    ('SPECIAL ED ', 'L/'),
+    ('ENGLISH LANGUAGE LEARNER (ELL) ', 'ELL '),
+]
+
+# Mismatches kept per field in the report
+MAX_MISMATCHES = 20
+
+def load_courses(path: str) -> List[Course]:
+    """Courses from a catalog file (either {"courses": [...]} or a bare list)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    courses = data['courses'] if isinstance(data, dict) else data
+    return [Course.from_dict(course) for course in courses]
+
+def course_numbers(course: Dict) -> List[str]:
+    """A course's 6-digit numbers, falling back to those in its course_id"""
+    numbers = [str(n) for n in course.get('course_numbers') or []]
+    return numbers or re.findall(r'\d{6}', course.get('course_id', ''))
+
+def build_index(courses: List[Dict]) -> Dict[str, int]:
+    """Hash index from every course number to the position of its course"""
+    index = {}
+    for i, course in enumerate(courses):
+        for number in course_numbers(course):
+            index.setdefault(number, i)
+    return index
+
+def join_courses(candidate: List[Dict], reference: List[Dict]) -> List[Tuple[int, int]]:
+    """(candidate, reference) position pairs sharing a course number
+
+    Each reference course is matched at most once, by the first candidate
+    course that names one of its numbers.
+    """
+    index = build_index(reference)
+    pairs = []
+    taken = set()
+    for i, course in enumerate(candidate):
+        for number in course_numbers(course):
+            j = index.get(number)
+            if j is not None and j not in taken:
+                pairs.append((i, j))
+                taken.add(j)
+                break
+    return pairs
+
+def normalize(field: str, value: Any) -> Any:
+    """Comparable form of a field value; None means "no value\""""
+    if value is None or value == '' or value == [] or value == ():
+        return None
+
+    if field == 'full_name':
+        name = re.sub(r'\s+', ' ', str(value)).strip().upper()
+        for alias, original in NAME_ALIASES:
+            if name.startswith(alias):
+                name = original + name[len(alias):]
+        return name
+    if field == 'pathway':
+        return PATHWAY_ALIASES.get(value, value)
+    if field == 'credits':
+        return float(value)
+    if field == 'uc_csu_category':
+        return str(value).strip('"\'“”‘’ ').upper() or None
+    if field in ('grades_allowed', 'offered_terms'):
+        return sorted(set(value))
+    if field.startswith('prerequisites_'):
+        return sorted({re.sub(r'\s+', ' ', str(v)).strip().lower() for v in value})
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+def ratio(part: int, whole: int) -> Optional[float]:
+    return round(part / whole, 4) if whole else None
+
+def compare_catalogs(candidate: List[Dict], reference: List[Dict],
+                     fields: List[str] = COMPARED_FIELDS) -> Dict[str, Any]:
+    """Course- and field-level precision/recall of a candidate catalog
+
+    A field value is a prediction when it is non-empty; it is correct when
+    the course joins to a reference course with the same normalized value.
+    Precision counts every prediction (unmatched courses included), recall
+    every non-empty reference value.
+    """
+    pairs = join_courses(candidate, reference)
+    report = {
+        'courses': {
+            'candidate': len(candidate),
+            'reference': len(reference),
+            'matched': len(pairs),
+            'precision': ratio(len(pairs), len(candidate)),
+            'recall': ratio(len(pairs), len(reference)),
+        },
+        'fields': {}
+    }
+
+    for field in fields:
+        predicted = sum(1 for c in candidate if normalize(field, c.get(field)) is not None)
+        expected = sum(1 for r in reference if normalize(field, r.get(field)) is not None)
+        correct = 0
+        mismatches = []
+        for i, j in pairs:
+            got = normalize(field, candidate[i].get(field))
+            want = normalize(field, reference[j].get(field))
+            if want is None and got is None:
+                continue
+            if got == want:
+                correct += 1
+            elif len(mismatches) < MAX_MISMATCHES:
+                mismatches.append({
+                    'course_number': course_numbers(candidate[i])[0],
+                    'expected': reference[j].get(field),
+                    'got': candidate[i].get(field)
+                })
+
+        report['fields'][field] = {
+            'predicted': predicted,
+            'expected': expected,
+            'correct': correct,
+            'precision': ratio(correct, predicted),
+            'recall': ratio(correct, expected),
+            'mismatches': mismatches
+        }
+
+    return report
+
+def run_parser(script: str, output_name: str, pdf_path: str) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Run a parser script in a scratch directory, timing it
+
+    Returns the path of the output it wrote (None if it failed) and its
+    wall time and peak resident memory.
+    """
+    repo = os.path.dirname(os.path.abspath(__file__))
+    workdir = tempfile.mkdtemp(prefix='parser_diff_')
+    os.symlink(os.path.abspath(pdf_path), os.path.join(workdir, os.path.basename(PDF_PATH)))
+
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(repo, script)], cwd=workdir,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # wait4 gives this child's own rusage, not the total of all children
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    stats = {
+        'seconds': round(elapsed, 2),
+        'peak_rss_mb': round(usage.ru_maxrss / 1024, 1),
+        'exit_code': process.returncode
+    }
+
+    output_path = os.path.join(workdir, output_name)
+    if process.returncode != 0 or not os.path.exists(output_path):
+        return None, stats
+    return output_path, stats
+
+def find_regressions(report: Dict, baseline: Dict) -> List[str]:
+    """Every course or field precision/recall that dropped since the baseline"""
+    regressions = []
+    for name, result in report['parsers'].items():
+        previous = baseline.get('parsers', {}).get(name)
+        if not previous:
+            continue
+        checks = [('courses', result['courses'], previous['courses'])]
+        checks += [(field, result['fields'][field], previous['fields'][field])
+                   for field in result['fields'] if field in previous['fields']]
+        for label, now, before in checks:
+            for metric in ('precision', 'recall'):
+                if before[metric] is not None and (now[metric] or 0) < before[metric]:
+                    regressions.append(f"{name} {label} {metric}: {before[metric]} -> {now[metric]}")
+    return regressions
+
+def print_report(name: str, result: Dict, show: int):
+    courses = result['courses']
+    print(f"\n{name}")
+    if 'runtime' in result:
+        runtime = result['runtime']
+        print(f"  runtime {runtime['seconds']}s, peak RSS {runtime['peak_rss_mb']} MB")
+    print(f"  courses: {courses['matched']}/{courses['candidate']} matched "
+          f"(precision {courses['precision']}, recall {courses['recall']})")
+    print(f"  {'field':<28} {'precision':>9} {'recall':>9}")
+    for field, stats in result['fields'].items():
+        print(f"  {field:<28} {str(stats['precision']):>9} {str(stats['recall']):>9}")
+        for mismatch in stats['mismatches'][:show]:
+            print(f"      {mismatch['course_number']}: expected {json.dumps(mismatch['expected'])[:60]}"
+                  f" got {json.dumps(mismatch['got'])[:60]}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare parser outputs against the hand-fixed catalog")
+    parser.add_argument('candidates', nargs='*', help="Catalog files to compare (default: every parser output)")
+    parser.add_argument('--reference', default=REFERENCE_PATH)
+    parser.add_argument('--run', action='store_true', help="Re-run the parsers and time them first")
+    parser.add_argument('--pdf', default=PDF_PATH)
+    parser.add_argument('--show', type=int, default=0, help="Mismatches to print per field")
+    parser.add_argument('--save-report', help="Write the full report as JSON")
+    parser.add_argument('--baseline', help="Fail if any precision/recall dropped below this saved report")
+    args = parser.parse_args()
+
+    reference = load_courses(args.reference)
+    names = args.candidates or list(PARSERS)
+    report = {'reference': args.reference, 'parsers': {}}
+
+    for name in names:
+        path = name
+        runtime = None
+        if args.run and name in PARSERS:
+            print(f"Running {PARSERS[name]}...")
+            path, runtime = run_parser(PARSERS[name], name, args.pdf)
+            if path is None:
+                print(f"  ERROR: {PARSERS[name]} exited with {runtime['exit_code']}")
+                continue
+
+        if not os.path.exists(path):
+            print(f"Skipping {name}: not found")
+            continue
+
+        result = compare_catalogs(load_courses(path), reference)
+        if runtime:
+            result['runtime'] = runtime
+        report['parsers'][name] = result
+        print_report(name, result, args.show)
+
+    if args.save_report:
+        with open(args.save_report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nSaved report to {args.save_report}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = find_regressions(report, json.load(f))
+        if regressions:
+            print("\nREGRESSIONS:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline")
+
+if __name__ == "__main__":
+    main()
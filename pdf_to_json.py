@@ -10,24 +10,75 @@ import re
 from typing import List, Dict, Any, Optional
 import sys
 
+from column_extraction import extract_pdf_pages, page_columns
+from header_detection import detect_header_runs, is_header_line
+
 def extract_pdf_text(pdf_path: str) -> str:
     """Extract all text from PDF"""
     try:
         text = ""
         with pdfplumber.open(pdf_path) as pdf:
             print(f"Reading {len(pdf.pages)} pages from PDF...")
-            for i, page in enumerate(pdf.pages, 1):
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n\n"
-                if i % 10 == 0:
-                    print(f"  Processed {i}/{len(pdf.pages)} pages...")
+        for page_text in extract_pdf_pages(pdf_path):
+            if page_text:
+                text += page_text + "\n\n"
         print(f"Extracted {len(text)} characters total")
         return text
     except Exception as e:
         print(f"Error reading PDF: {e}")
         sys.exit(1)
 
+def extract_course_chunks(pdf_path: str) -> List[str]:
+    """Split the PDF into course chunks at bold course header runs
+
+    Only lines set in the header font are checked for a course number, so
+    title pages and body text can no longer start a course.
+    """
+    lines = []
+    header_flags = []
+
+    with pdfplumber.open(pdf_path) as pdf:
+        print(f"Reading {len(pdf.pages)} pages from PDF...")
+        for i, page in enumerate(pdf.pages, 1):
+            for column in page_columns(page):
+                runs = detect_header_runs(column.chars)
+
+                for line in column.extract_text_lines():
+                    lines.append(line['text'])
+                    header_flags.append(bool(runs) and is_header_line(line['bottom'], runs))
+
+            if i % 10 == 0:
+                print(f"  Processed {i}/{len(pdf.pages)} pages...")
+
+    return chunks_from_lines(lines, header_flags)
+
+def chunks_from_lines(lines: List[str], header_flags: List[bool]) -> List[str]:
+    """Group text lines into course chunks, starting one at each header line
+
+    A header line must contain a course number after the name. The name part
+    goes on its own first line for parse_course_from_text.
+    """
+    chunks = []
+    current = None
+
+    for text, is_header in zip(lines, header_flags):
+        if is_header:
+            match = re.search(r'\b\d{6}\b', text)
+            if match and match.start() > 0:
+                if current:
+                    chunks.append('\n'.join(current))
+                current = [text[:match.start()].strip(), text[match.start():]]
+                continue
+
+        if current is not None:
+            current.append(text)
+
+    if current:
+        chunks.append('\n'.join(current))
+
+    print(f"Found {len(chunks)} course headers")
+    return chunks
+
 def parse_course_id(full_name: str, course_number: str) -> str:
     """Generate a course ID from the course name and number"""
     # Remove common words and get key identifiers
@@ -279,15 +330,19 @@ def convert_pdf_to_json(pdf_path: str, output_path: str):
     print(f"Input: {pdf_path}")
     print(f"Output: {output_path}\n")
 
-    # Extract text
-    full_text = extract_pdf_text(pdf_path)
+    # Split into courses at bold header runs
+    course_chunks = extract_course_chunks(pdf_path)
 
-    if not full_text.strip():
-        print("ERROR: PDF appears to be empty or unreadable")
-        sys.exit(1)
+    # No header fonts to go on (e.g. a scanned or re-typeset catalog):
+    # fall back to splitting the plain text
+    if not course_chunks:
+        full_text = extract_pdf_text(pdf_path)
+
+        if not full_text.strip():
+            print("ERROR: PDF appears to be empty or unreadable")
+            sys.exit(1)
 
-    # Split into courses
-    course_chunks = split_into_courses(full_text)
+        course_chunks = split_into_courses(full_text)
 
     # Parse each chunk
     courses = []
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Publish catalog editions as content-hashed artifacts.
+Each published version of an edition's catalog is written as a bundle
+(see catalog_bundle.py) named after the sha256 of its bytes, so it can be
+served with an immutable cache policy, plus a course-level JSON patch from
+the edition's previous version. manifest.json, the only file that
+changes in place, maps editions to their current hash and lists every
+version in order; src/utils/catalogClient.js uses it to fetch either the
+patches it is missing or the whole bundle.
+
+    python3 publish_catalog.py                               # courses_complete.json
+    python3 publish_catalog.py new_catalog.json --edition 2026-2027
+    python3 publish_catalog.py --db catalog.db courses_complete.json.backup2 courses_complete
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from typing import List, Dict, Any
+
+from catalog_bundle import build_bundle, decode_bundle, compress, frontend_catalog
+
+CATALOG_PATH = "src/data/courses_complete.json"
+PUBLISH_DIR = "public/data/catalog"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+PATCH_FORMAT = 1
+
+# Hex digits of the sha256 kept in artifact filenames
+HASH_LENGTH = 16
+
+def artifact_bytes(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+def course_keys(courses: List[Dict]) -> List[str]:
+    """Patch key of each course: its course_id, with #n on the nth repeat
+
+    (The Studio Art variants share one course_id.)
+    """
+    seen = {}
+    keys = []
+    for course in courses:
+        n = seen.get(course['course_id'], 0)
+        seen[course['course_id']] = n + 1
+        keys.append(course['course_id'] if n == 0 else f"{course['course_id']}#{n}")
+    return keys
+
+def make_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Course-level patch turning one catalog into another
+
+    The patch lists removed course keys, [key, course] for every added or
+    changed course, and the key order only when applying the rest would
+    not reproduce it.
+    """
+    old_courses = dict(zip(course_keys(old['courses']), old['courses']))
+    new_courses = dict(zip(course_keys(new['courses']), new['courses']))
+
+    patch = {
+        'format': PATCH_FORMAT,
+        'meta': {k: v for k, v in new.items() if k != 'courses'},
+        'remove': [key for key in old_courses if key not in new_courses],
+        'upsert': [[key, c] for key, c in new_courses.items() if old_courses.get(key) != c],
+        'order': None
+    }
+    if apply_patch(old, patch) != new:
+        patch['order'] = list(new_courses)
+    return patch
+
+def apply_patch(catalog: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """A catalog with a patch applied (mirrors applyCatalogPatch in JS)"""
+    courses = dict(zip(course_keys(catalog['courses']), catalog['courses']))
+    for key in patch['remove']:
+        courses.pop(key, None)
+    for key, course in patch['upsert']:
+        courses[key] = course
+
+    order = patch['order'] or list(courses)
+    data = dict(patch['meta'])
+    data['courses'] = [courses[key] for key in order]
+    return data
+
+def default_edition(data: Dict[str, Any], path: str) -> str:
+    """School-year edition name from the catalog's title, else the file name"""
+    match = re.search(r'\d{4}-\d{4}', data.get('generated_for', ''))
+    if match:
+        return match.group(0)
+    return os.path.basename(path).split('.')[0]
+
+def load_manifest(publish_dir: str) -> Dict[str, Any]:
+    path = os.path.join(publish_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {'format': MANIFEST_FORMAT, 'latest': None, 'editions': {}, 'versions': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_artifact(publish_dir: str, name: str, content: bytes):
+    """Write an artifact and its .gz; hashed names never need rewriting"""
+    path = os.path.join(publish_dir, name)
+    if os.path.exists(path):
+        return
+    with open(path, 'wb') as f:
+        f.write(content)
+    for encoding, compressed in compress(content).items():
+        if compressed is not None:
+            with open(f"{path}.{encoding}", 'wb') as f:
+                f.write(compressed)
+
+def read_catalog(publish_dir: str, version: Dict[str, Any]) -> Dict[str, Any]:
+    """The decoded catalog of a published version"""
+    with open(os.path.join(publish_dir, version['catalog']), 'rb') as f:
+        return decode_bundle(json.loads(f.read()))
+
+def publish(data: Dict[str, Any], edition: str, publish_dir: str = PUBLISH_DIR) -> Dict[str, Any]:
+    """Publish one catalog as the latest version of an edition
+
+    Returns the manifest entry for the version (the existing one if this
+    exact catalog is already the edition's current version).
+    """
+    os.makedirs(publish_dir, exist_ok=True)
+    manifest = load_manifest(publish_dir)
+
+    catalog = frontend_catalog(data)
+    content = artifact_bytes(build_bundle(catalog))
+    digest = content_hash(content)
+    if manifest['editions'].get(edition) == digest:
+        return next(v for v in manifest['versions'] if v['sha256'] == digest)
+
+    catalog_name = f"catalog.{digest[:HASH_LENGTH]}.json"
+    write_artifact(publish_dir, catalog_name, content)
+
+    version = {
+        'edition': edition,
+        'sha256': digest,
+        'catalog': catalog_name,
+        'bytes': len(content),
+        'courses': len(catalog['courses']),
+        'published_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'previous': None,
+        'patch': None
+    }
+
+    # Patch from the edition's own current version, never another edition's
+    current = manifest['editions'].get(edition)
+    if current is not None:
+        previous = next(v for v in reversed(manifest['versions'])
+                        if v['edition'] == edition and v['sha256'] == current)
+        version['previous'] = previous['sha256']
+        patch = make_patch(read_catalog(publish_dir, previous), catalog)
+        patch['from'] = previous['sha256']
+        patch['to'] = digest
+        patch_content = artifact_bytes(patch)
+        # Only worth serving when smaller than the catalog itself
+        if len(patch_content) < len(content):
+            version['patch'] = f"patch.{previous['sha256'][:HASH_LENGTH]}.{digest[:HASH_LENGTH]}.json"
+            version['patch_bytes'] = len(patch_content)
+            write_artifact(publish_dir, version['patch'], patch_content)
+
+    manifest['versions'].append(version)
+    manifest['editions'][edition] = digest
+    manifest['latest'] = edition
+    with open(os.path.join(publish_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return version
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish catalog editions as content-hashed artifacts")
+    parser.add_argument('catalogs', nargs='*', default=[CATALOG_PATH],
+                        help="Catalog JSON files (or edition names with --db), oldest first")
+    parser.add_argument('--edition', help="Edition name (default: school year from the catalog title)")
+    parser.add_argument('--db', help="catalog_store database to read editions from")
+    parser.add_argument('-o', '--output-dir', default=PUBLISH_DIR)
+    args = parser.parse_args()
+
+    for source in args.catalogs:
+        if args.db and not os.path.exists(source):
+            from catalog_store import CatalogStore
+            with CatalogStore(args.db) as store:
+                data = store.export_catalog(source)
+            edition = args.edition or source
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            edition = args.edition or default_edition(data, source)
+
+        version = publish(data, edition, args.output_dir)
+        print(f"{source} -> {edition}: {version['catalog']} ({version['bytes'] / 1024:.1f} KB)")
+        if version['patch']:
+            print(f"  patch from previous version: {version['patch']} "
+                  f"({version['patch_bytes'] / 1024:.1f} KB)")
+
+    print(f"Manifest: {os.path.join(args.output_dir, MANIFEST_NAME)}")
+
+if __name__ == "__main__":
+    main()
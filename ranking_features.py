@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Course-static ranking features for the frontend's CandidateRanker.
+CandidateRanker.scoreCourse re-derives a handful of properties from each
+course's name on every suggestion request (grade-appropriateness bonuses,
+AP/Honors, foundational, low-credit/ASB, PE and science preferences,
+language and level). None of them depend on the student, so the catalog
+build computes them once per course into a small integer vector,
+rank_features (laid out as RANK_FEATURES). The ranker reads the vector
+when present and falls back to parsing names when it is not. (Language
+and level fields come from course_enrichment.py.)
+
+The rules mirror src/utils/CandidateRanker.js and are applied to the
+pathway as CatalogNormalizer.normalizePathway rewrites it, since that is
+what the ranker sees. Keep the three in step.
+
+    python3 ranking_features.py            # print the feature table
+"""
+
+import argparse
+import json
+import re
+from typing import List, Dict, Any, Optional
+
+CATALOG_PATH = "src/data/courses_complete.json"
+
+# Layout of rank_features (RANK_FEATURES in CandidateRanker.js)
+RANK_FEATURES = [
+    'grade_bonus_9', 'grade_bonus_10', 'grade_bonus_11', 'grade_bonus_12',
+    'has_ap', 'has_honors', 'is_foundational', 'low_credit_kind',
+    'science_bonus_9', 'ens_level', 'name_level',
+]
+
+# low_credit_kind values
+LOW_CREDIT_NONE = 0
+LOW_CREDIT_HUMAN_GEOGRAPHY = 1
+LOW_CREDIT_ASB = 2
+
+VOCATIONAL_KEYWORDS = ['BIOTECH', 'ENGINEERING', 'MEDICAL', 'PLTW', 'ROBOTICS',
+                       'HEALTH SCIENCE', 'BUSINESS', 'MARKETING']
+
+UC_CSU_PATHWAYS = {
+    'A': 'History/Social Science',
+    'B': 'English',
+    'C': 'Math',
+    'E': 'Foreign Language',
+    'F': 'Fine Arts',
+    'G': 'Electives',
+}
+
+LEVEL_PATTERN = re.compile(r'(\d+)-(\d+)')
+
+def normalize_pathway(pathway: str, name: str, uc_csu_category: Optional[str]) -> str:
+    """CatalogNormalizer.normalizePathway"""
+    if not pathway:
+        return ''
+    pathway_lower = pathway.lower().strip()
+    name_upper = (name or '').upper()
+
+    if uc_csu_category in UC_CSU_PATHWAYS:
+        return UC_CSU_PATHWAYS[uc_csu_category]
+    if uc_csu_category == 'D':
+        if 'BIOLOGY' in name_upper or 'LIVING' in name_upper:
+            return 'Science - Biological'
+        return 'Science - Physical'
+
+    if any(keyword in name_upper for keyword in VOCATIONAL_KEYWORDS):
+        return 'Electives'
+    if 'physical education' in pathway_lower or 'ENS ' in name_upper or 'PE ' in name_upper:
+        return 'Physical Education'
+    if 'off-roll' in pathway_lower or 'off roll' in pathway_lower:
+        return 'Off-Roll'
+    return re.sub(r'\s+', ' ', pathway.strip())
+
+def name_level(name: str) -> int:
+    """First number of the name's level range ("SPANISH 3-4" -> 3), 0 if none"""
+    match = LEVEL_PATTERN.search(name.upper())
+    return int(match.group(1)) if match else 0
+
+def grade_bonus(name_upper: str, pathway: str, term_length: str, year: int) -> int:
+    """CandidateRanker.gradeAppropriatenessBonus for one grade"""
+    if year == 9:
+        if 'ENGLISH 1-2' in name_upper:
+            return 50
+        if 'INTEGRATED MATHEMATICS I' in name_upper:
+            return 50
+        if 'BIOLOGY' in name_upper and 'AP' not in name_upper:
+            return 40
+        if pathway == 'Foreign Language':
+            if '1-2' in name_upper:
+                return 40
+            if '3-4' in name_upper or '5-6' in name_upper:
+                return 10
+        if 'BUSINESS PRINCIPLES' in name_upper:
+            return 30
+        if 'COMPUTER INFO' in name_upper or 'WEB DESIGN' in name_upper:
+            return 30
+        if 'INTRO TO ENGINEERING' in name_upper or 'PRINCIPLES OF ENGINEERING' in name_upper:
+            return 30
+        if pathway == 'Fine Arts':
+            if any(s in name_upper for s in ('1-2', 'BAND', 'ORCHESTRA', 'DRAMA 1-2', 'CERAMICS 1-2')):
+                return 30
+
+    if year == 10:
+        if 'ENGLISH 3-4' in name_upper:
+            return 40
+        if 'INTEGRATED MATHEMATICS II' in name_upper:
+            return 50
+        if 'WORLD HISTORY' in name_upper:
+            return 40
+        if 'CHEMISTRY' in name_upper and 'AP' not in name_upper:
+            return 30
+        if any(s in name_upper for s in ('SPANISH 3-4', 'CHINESE 3-4', 'FRENCH 3-4', 'FILIPINO 3-4')):
+            return 25
+
+    if year == 11:
+        if 'INTEGRATED MATHEMATICS III' in name_upper:
+            return 50
+        if 'UNITED STATES HISTORY' in name_upper:
+            return 40
+        if 'ENGLISH 5-6' in name_upper:
+            return 40
+
+    if year == 12:
+        if term_length == 'semester':
+            return 30
+        if 'CIVICS' in name_upper:
+            return 40
+
+    return 0
+
+def rank_features(course: Dict[str, Any]) -> List[int]:
+    """A course's feature vector, laid out as RANK_FEATURES"""
+    name = course.get('full_name') or ''
+    name_upper = name.upper()
+    pathway = normalize_pathway(course.get('pathway'), name, course.get('uc_csu_category'))
+
+    if 'HUMAN GEOGRAPHY' in name_upper:
+        low_credit_kind = LOW_CREDIT_HUMAN_GEOGRAPHY
+    elif 'ASB' in name_upper:
+        low_credit_kind = LOW_CREDIT_ASB
+    else:
+        low_credit_kind = LOW_CREDIT_NONE
+
+    if 'BIOLOGY' in name_upper and 'AP' not in name_upper:
+        science_bonus_9 = 50
+    elif 'CHEMISTRY' in name_upper and 'AP' not in name_upper:
+        science_bonus_9 = 30
+    else:
+        science_bonus_9 = 0
+
+    if 'ENS 3-4' in name_upper:
+        ens_level = 3
+    elif 'ENS 1-2' in name_upper:
+        ens_level = 1
+    else:
+        ens_level = 0
+
+    # Substring checks, as in the ranker ("AP" also matches e.g. GRAPHIC)
+    is_foundational = any(s in name_upper for s in
+                          ('1-2', 'INTEGRATED MATHEMATICS I', 'BIOLOGY', 'ENGLISH 1'))
+
+    features = [grade_bonus(name_upper, pathway, course.get('term_length'), year)
+                for year in (9, 10, 11, 12)]
+    features += [
+        int('AP' in name_upper),
+        int('HONORS' in name_upper),
+        int(is_foundational),
+        low_credit_kind,
+        science_bonus_9,
+        ens_level,
+        name_level(name),
+    ]
+    return features
+
+def add_rank_features(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The catalog with rank_features on every course"""
+    courses = [{**course, 'rank_features': rank_features(course)} for course in data['courses']]
+    return {**data, 'courses': courses}
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the course-static ranking features")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        data = add_rank_features(json.load(f))
+
+    short = [name.replace('grade_bonus_', 'g').replace('_', '')[:9] for name in RANK_FEATURES]
+    print(f"{'course':<44} " + ' '.join(f"{s:>9}" for s in short))
+    for course in data['courses']:
+        print(f"{course['full_name'][:44]:<44} " + ' '.join(f"{v:>9}" for v in course['rank_features']))
+
+if __name__ == "__main__":
+    main()
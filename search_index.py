@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+BM25 course search index, built with the catalog.
+CourseExplorer filtered the catalog on every keystroke by substring
+matching each course's name. This build step tokenizes each course's name
+and course numbers, its full description (from the description store,
+or the catalog notes) and its "For students interested in" text, stems
+the words, and stores per term the courses it occurs in with their BM25
+weight precomputed, so a query is a few postings lookups and a sum:
+
+    {
+      "format": 1,
+      "course_ids": [...],          # document i is course_ids[i]
+      "terms": [...],               # sorted
+      "postings": [[...], ...],     # per term: doc, weight, doc, weight, ...
+      "prefix_length": 2,
+      "prefix_top": 20,
+      "prefixes": {"bi": [...], ...}  # best prefix_top docs only
+    }
+
+Weights are BM25 scores times WEIGHT_SCALE, rounded to integers, and
+each postings list is stored best weight first, so a one-word query's
+top results are the head of its list. The last word of a query is
+matched as a prefix (the user is still typing it), answered from a range
+of the sorted terms. One- and two-character prefixes span too many terms
+to merge on every keystroke, so for those that start two or more terms
+the best prefix_top docs (by their best weight among the terms) are
+precomputed; they answer a one-word query's top results. Longer lists
+and queries with more words use the term range. All query words must
+match.
+
+The index is written to public/data/search-index.json and queried by
+src/utils/courseSearch.js (search() here mirrors it).
+
+    python3 search_index.py                      # build the index
+    python3 search_index.py --query "marine bio"
+    python3 search_index.py --benchmark 10000    # query timings on a synthetic catalog
+"""
+
+import argparse
+import bisect
+import heapq
+import itertools
+import json
+import math
+import random
+import re
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from description_store import STORE_DIR, read_descriptions
+from parser_diff import course_numbers
+
+CATALOG_PATH = "src/data/courses_complete.json"
+INDEX_PATH = "public/data/search-index.json"
+INDEX_FORMAT = 2
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+WEIGHT_SCALE = 10
+
+# Term frequency multiplier of each field (BM25F-style: a name match counts three description matches)
+FIELD_WEIGHTS = {'name': 3.0, 'interest': 2.0, 'description': 1.0}
+
+# Prefixes up to this length get precomputed postings, cut to their best
+# PREFIX_TOP docs (a page of results); longer prefixes cover few terms
+PREFIX_LENGTH = 2
+PREFIX_TOP = 20
+
+TOKEN = re.compile(r'[a-z0-9]+')
+STOP_WORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or that the their this to '
+    'will with who which students student course courses'.split()
+)
+
+INTEREST = re.compile(r'For students interested in:?\s*(.*)', re.I | re.S)
+# What follows the interest phrase in the PDF text
+INTEREST_END = re.compile(r'Length of Course|Alternate Course ID|Recommended Prerequisite|Prerequisite'
+                          r'|Grade Level|\.\s', re.I)
+INTEREST_WORDS = 20
+
+# (suffix, replacement) tried in order; the first that leaves a stem of
+# at least MIN_STEM characters applies. Mirrored in courseSearch.js.
+SUFFIX_RULES = [('ational', 'ate'), ('ization', 'ize'), ('ies', 'y'), ('sses', 'ss'),
+                ('ing', ''), ('ed', ''), ('ly', ''), ('s', '')]
+MIN_STEM = 3
+# Final consonant pairs kept after stripping -ing/-ed ("spelling" -> "spell")
+KEPT_DOUBLES = frozenset('lsz')
+
+def stem(word: str) -> str:
+    """Light suffix-stripping stemmer ("programming" -> "program", "studies" -> "study")"""
+    if word.isdigit():
+        return word
+    for suffix, replacement in SUFFIX_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            if suffix == 's' and word[-2] in 'sui':
+                return word
+            base = word[:-len(suffix)] + replacement
+            if suffix in ('ing', 'ed') and base[-1] == base[-2] and base[-1] not in KEPT_DOUBLES \
+                    and base[-1] not in 'aeiou':
+                base = base[:-1]
+            return base
+    return word
+
+def words(text: str) -> List[str]:
+    """Lowercase words of a text, stop words removed"""
+    return [w for w in TOKEN.findall((text or '').lower()) if w not in STOP_WORDS]
+
+def tokenize(text: str) -> List[str]:
+    return [stem(w) for w in words(text)]
+
+def interest_text(description: str) -> str:
+    """The "For students interested in" phrase of a description, '' if it has none"""
+    match = INTEREST.search(description or '')
+    if not match:
+        return ''
+    text = match.group(1)
+    end = INTEREST_END.search(text)
+    if end:
+        text = text[:end.start()]
+    return ' '.join(text.split()[:INTEREST_WORDS])
+
+def course_fields(course: Dict, description: Optional[str] = None) -> Dict[str, str]:
+    """Text of each indexed field of a course"""
+    description = description or course.get('notes') or ''
+    return {
+        'name': ' '.join([course.get('full_name') or ''] + course_numbers(course)),
+        'interest': interest_text(description),
+        'description': description,
+    }
+
+def build_index(courses: List[Dict], descriptions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Serialized index over a catalog's courses
+
+    Records sharing a course_id (the Studio Art variants) are one document.
+    """
+    descriptions = descriptions or {}
+    doc_ids: List[str] = []
+    doc_fields: Dict[str, List[Dict[str, str]]] = {}
+    for course in courses:
+        if course['course_id'] not in doc_fields:
+            doc_ids.append(course['course_id'])
+            doc_fields[course['course_id']] = []
+        doc_fields[course['course_id']].append(course_fields(course, descriptions.get(course['course_id'])))
+
+    # Weighted term frequencies and lengths
+    frequencies: List[Dict[str, float]] = []
+    lengths: List[float] = []
+    for course_id in doc_ids:
+        tf: Dict[str, float] = {}
+        length = 0.0
+        for fields in doc_fields[course_id]:
+            for field, text in fields.items():
+                for term in tokenize(text):
+                    tf[term] = tf.get(term, 0.0) + FIELD_WEIGHTS[field]
+                    length += FIELD_WEIGHTS[field]
+        frequencies.append(tf)
+        lengths.append(length)
+
+    n = len(doc_ids)
+    average_length = sum(lengths) / n if n else 1.0
+    term_docs: Dict[str, List[Tuple[int, int]]] = {}
+    document_frequency: Dict[str, int] = {}
+    for tf in frequencies:
+        for term in tf:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+    for doc, tf in enumerate(frequencies):
+        norm = K1 * (1 - B + B * lengths[doc] / average_length)
+        for term, f in tf.items():
+            df = document_frequency[term]
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            weight = idf * f * (K1 + 1) / (f + norm)
+            term_docs.setdefault(term, []).append((doc, max(1, round(weight * WEIGHT_SCALE))))
+
+    terms = sorted(term_docs)
+    prefix_terms: Dict[str, List[str]] = {}
+    for term in terms:
+        for length in range(1, min(PREFIX_LENGTH, len(term)) + 1):
+            prefix_terms.setdefault(term[:length], []).append(term)
+    # A prefix of a single term is answered by that term's postings
+    prefix_docs: Dict[str, Dict[int, int]] = {}
+    for prefix, matching in prefix_terms.items():
+        if len(matching) < 2:
+            continue
+        best = prefix_docs[prefix] = {}
+        for term in matching:
+            for doc, weight in term_docs[term]:
+                if weight > best.get(doc, 0):
+                    best[doc] = weight
+
+    return {
+        'format': INDEX_FORMAT,
+        'course_ids': doc_ids,
+        'terms': terms,
+        'postings': [encode_postings(term_docs[term]) for term in terms],
+        'prefix_length': PREFIX_LENGTH,
+        'prefix_top': PREFIX_TOP,
+        'prefixes': {prefix: encode_postings(list(docs.items()))[:2 * PREFIX_TOP]
+                     for prefix, docs in sorted(prefix_docs.items())}
+    }
+
+def encode_postings(postings: List[Tuple[int, int]]) -> List[int]:
+    """(doc, weight) pairs -> flat [doc, weight, ...], best weight first"""
+    flat = []
+    for doc, weight in sorted(postings, key=lambda posting: (-posting[1], posting[0])):
+        flat.extend((doc, weight))
+    return flat
+
+def decode_postings(flat: List[int]) -> Dict[int, int]:
+    """doc -> weight, in the serialized (best first) order"""
+    return dict(zip(flat[::2], flat[1::2]))
+
+def load_index(serialized: Dict[str, Any]) -> Dict[str, Any]:
+    """Queryable form of a serialized index (postings decoded once)"""
+    if serialized['format'] != INDEX_FORMAT:
+        raise ValueError(f"Unsupported search index format: {serialized['format']}")
+    return {
+        'course_ids': serialized['course_ids'],
+        'terms': serialized['terms'],
+        'term_index': {term: i for i, term in enumerate(serialized['terms'])},
+        'postings': [decode_postings(flat) for flat in serialized['postings']],
+        'prefix_length': serialized['prefix_length'],
+        'prefix_top': serialized['prefix_top'],
+        'prefixes': {prefix: decode_postings(flat) for prefix, flat in serialized['prefixes'].items()},
+    }
+
+def merge_best(lists: List[Dict[int, int]]) -> Dict[int, int]:
+    """Each doc's best weight over several postings (unordered unless there is only one)"""
+    if len(lists) == 1:
+        return lists[0]
+    lists = sorted(lists, key=len, reverse=True)
+    best = dict(lists[0])
+    for postings in lists[1:]:
+        for doc, weight in postings.items():
+            if weight > best.get(doc, 0):
+                best[doc] = weight
+    return best
+
+def prefix_postings(index: Dict[str, Any], prefix: str,
+                    top: Optional[int] = None) -> Tuple[Dict[int, int], bool]:
+    """Each doc's best weight among the terms starting with prefix, and whether that is best first
+
+    With top (at most prefix_top), only the best top docs are needed, and
+    a precomputed prefix list is enough.
+    """
+    if top is not None and top <= index['prefix_top'] and prefix in index['prefixes']:
+        return index['prefixes'][prefix], True
+    terms = index['terms']
+    first = bisect.bisect_left(terms, prefix)
+    last = bisect.bisect_left(terms, prefix + '\uffff', first)
+    return merge_best(index['postings'][first:last] or [{}]), last - first <= 1
+
+def query_postings(index: Dict[str, Any], query: str,
+                   limit: Optional[int] = None) -> List[Tuple[Dict[int, int], bool]]:
+    """Postings of each query word, and whether they are best first
+
+    The last word is also matched as a prefix. Stored postings are best
+    first; postings merged on the fly from several terms are not. A
+    one-word query wanting only its top `limit` results may get a cut
+    precomputed prefix list.
+    """
+    query_words = words(query)
+    # A trailing space means the last word is finished
+    typing = bool(query_words) and not query[-1:].isspace()
+    lists = []
+    for i, word in enumerate(query_words):
+        term = stem(word)
+        position = index['term_index'].get(term)
+        postings = index['postings'][position] if position is not None else {}
+        ordered = True
+        if typing and i == len(query_words) - 1:
+            top = limit if len(query_words) == 1 else None
+            prefixed, ordered = prefix_postings(index, word, top)
+            # The prefix postings already include the word's own term unless stemming shortened it
+            if term.startswith(word):
+                postings = prefixed
+            elif prefixed:
+                postings, ordered = merge_best([postings, prefixed]), False
+        lists.append((postings, ordered))
+    return lists
+
+def search(index: Dict[str, Any], query: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """(course_id, score) of the courses matching every query word, best first"""
+    word_postings = query_postings(index, query, limit)
+    if not word_postings:
+        return []
+    course_ids = index['course_ids']
+    if len(word_postings) == 1 and word_postings[0][1]:
+        ranked = list(itertools.islice(word_postings[0][0].items(), limit))
+        return [(course_ids[doc], score) for doc, score in ranked]
+
+    lists = sorted((postings for postings, _ in word_postings), key=len)
+    smallest, rest = lists[0], lists[1:]
+    scores = {}
+    for doc, weight in smallest.items():
+        score = weight
+        for postings in rest:
+            other = postings.get(doc)
+            if other is None:
+                break
+            score += other
+        else:
+            scores[doc] = score
+
+    if limit is None:
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    else:
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+    return [(course_ids[doc], score) for doc, score in ranked]
+
+def synthetic_catalog(courses: List[Dict], descriptions: Dict[str, str], size: int,
+                      seed: int = 0) -> Tuple[List[Dict], Dict[str, str]]:
+    """A catalog of `size` courses made from the real ones' text
+
+    Each synthetic course reuses a real name and description with some of
+    their words swapped for made-up ones, so the term count grows with the
+    catalog as it would for a bigger district.
+    """
+    rng = random.Random(seed)
+    vocabulary = sorted({w for c in courses for w in TOKEN.findall(
+        (descriptions.get(c['course_id']) or c.get('notes') or '').lower())})
+    syllables = [c + v for c in 'bcdfghjklmnprstvwz' for v in 'aeiou']
+    vocabulary += [''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(size)]
+
+    synthetic = []
+    synthetic_descriptions = {}
+    for i in range(size):
+        source = courses[i % len(courses)]
+        text = (descriptions.get(source['course_id']) or source.get('notes') or '').split()
+        for _ in range(len(text) // 10):
+            text[rng.randrange(len(text))] = rng.choice(vocabulary)
+        course_id = f"{i:06d}"
+        synthetic.append({'course_id': course_id, 'course_numbers': [course_id],
+                          'full_name': f"{source['full_name']} {rng.choice(vocabulary).upper()}"})
+        synthetic_descriptions[course_id] = ' '.join(text)
+    return synthetic, synthetic_descriptions
+
+def run_benchmark(courses: List[Dict], descriptions: Dict[str, str], size: int):
+    courses, descriptions = synthetic_catalog(courses, descriptions, size)
+    start = time.perf_counter()
+    serialized = build_index(courses, descriptions)
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    index = load_index(json.loads(json.dumps(serialized, separators=(',', ':'))))
+    load_ms = (time.perf_counter() - start) * 1000
+    size_kb = len(json.dumps(serialized, separators=(',', ':'))) / 1024
+
+    print(f"Synthetic catalog: {len(courses)} courses, {len(serialized['terms'])} terms, {size_kb:.0f} KB index")
+    print(f"  build {build_ms:.0f} ms, parse + decode {load_ms:.0f} ms\n")
+
+    queries = ['biology', 'ap calc', 'computer science', 'spanish 3', 'history', 'marine bio',
+               'art', 'engineering design', 'chem', 'world literature', 'p', 'music perf']
+    print(f"  {'query':<20} {'hits':>6} {'top 20':>10} {'all':>10}")
+    totals = []
+    for query in queries:
+        hits = len(search(index, query))
+        timings = {}
+        for name, limit in (('top', 20), ('all', None)):
+            best = float('inf')
+            for _ in range(50):
+                start = time.perf_counter()
+                search(index, query, limit)
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best * 1000
+        totals.append(timings['top'])
+        print(f"  {query:<20} {hits:>6} {timings['top']:>8.3f}ms {timings['all']:>8.3f}ms")
+    print(f"\n  median top-20 query: {sorted(totals)[len(totals) // 2]:.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the BM25 course search index")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('-o', '--output', default=INDEX_PATH)
+    parser.add_argument('--store-dir', default=STORE_DIR, help="Description store to index full descriptions from")
+    parser.add_argument('--query', help="Search the built index instead of writing it")
+    parser.add_argument('--benchmark', type=int, metavar='COURSES',
+                        help="Time queries on a synthetic catalog of this many courses")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        courses = json.load(f)['courses']
+    descriptions = read_descriptions(args.store_dir)
+
+    if args.benchmark:
+        run_benchmark(courses, descriptions, args.benchmark)
+        return
+
+    serialized = build_index(courses, descriptions)
+    if args.query:
+        names = {course['course_id']: course['full_name'] for course in courses}
+        for course_id, score in search(load_index(serialized), args.query, 20):
+            print(f"  {score:>6} {course_id:<16} {names[course_id]}")
+        return
+
+    raw = json.dumps(serialized, ensure_ascii=False, separators=(',', ':'))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(raw)
+    postings = sum(len(p) // 2 for p in serialized['postings'])
+    print(f"Indexed {len(serialized['course_ids'])} courses ({len(descriptions)} full descriptions): "
+          f"{len(serialized['terms'])} terms, {postings} postings, {len(serialized['prefixes'])} prefixes")
+    print(f"Saved to {args.output} ({len(raw) / 1024:.1f} KB)")
+
+if __name__ == "__main__":
+    main()
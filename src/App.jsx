@@ -1,7 +1,8 @@
 import React, { useState, useMemo, useRef } from 'react';
 // lucide-react icons now in EmptySlot component
 import { useLocalStorage, useLocalStorageNullable } from './hooks/useLocalStorage';
-import courseCatalogData from './data/courses_complete.json';
+import catalogBundle from './data/courses_bundle.json';
+import { decodeCatalog } from './utils/catalogBundle.js';
 import { SchedulingEngine } from './scheduling/SchedulingEngine.js';
 import { SettingsDropdown } from './components/SettingsDropdown.jsx';
 import { EarlyGradButton } from './components/EarlyGradButton.jsx';
@@ -47,7 +48,8 @@ import { useCourseProgress } from './hooks/useCourseProgress.js';
 import { useCourseSchedule } from './hooks/useCourseSchedule.js';
 import { useDragAndDrop } from './hooks/useDragAndDrop.js';
 
-// Load course catalog from JSON
+// Load course catalog from the compact bundle (see catalog_bundle.py)
+const courseCatalogData = decodeCatalog(catalogBundle);
 const COURSE_CATALOG = courseCatalogData.courses.reduce((acc, course) => {
   acc[course.course_id] = course;
   return acc;
@@ -57,7 +59,7 @@ const COURSE_CATALOG = courseCatalogData.courses.reduce((acc, course) => {
 const NORMALIZED_CATALOG = getNormalizedCatalog(COURSE_CATALOG);
 
 // Initialize scheduling engine
-const schedulingEngine = new SchedulingEngine(courseCatalogData.courses);
+const schedulingEngine = new SchedulingEngine(courseCatalogData.courses, courseCatalogData.eligibility);
 
 // WESTVIEW_REQUIREMENTS and AG_REQUIREMENTS imported from domain modules
 // Config constants (GRADE_OPTIONS, PATHWAY_COLORS, etc.) imported from ./config
@@ -72,7 +74,7 @@ function App() {
     undo: handleUndo,
     clearAll: clearAllCourses,
     getCoursesForQuarter
-  } = useCourseSchedule();
+  } = useCourseSchedule(courseCatalogData.alternate_index);
   const [showAddCourse, setShowAddCourse] = useState(null); // null or { year, quarter, slot }
   const [selectedCategory, setSelectedCategory] = useState(''); // Track selected category
   const [newCourse, setNewCourse] = useState({ courseId: '' });
@@ -114,7 +116,7 @@ function App() {
 
   // Initialize suggestion engine (ONE-TIME setup with normalized catalog)
   const [suggestionEngine] = useState(() => {
-    return new SuggestionEngine(NORMALIZED_CATALOG, DEPRECATED_COURSES);
+    return new SuggestionEngine(NORMALIZED_CATALOG, DEPRECATED_COURSES, courseCatalogData.eligibility);
   });
 
   // Track if student met Foreign Language requirement in grades 7/8
@@ -392,8 +394,10 @@ function App() {
 
   // Helper function to determine if a course is truly yearlong
   // Checks both term_length field and notes for "Year-Long" or "linked w/"
+  // (the bundled catalog carries that notes check as yearlong_in_notes)
   const isYearlongCourse = (course) => {
     if (course.term_length === 'yearlong') return true;
+    if (course.yearlong_in_notes) return true;
     if (course.notes) {
       const notesUpper = course.notes.toUpperCase();
       return notesUpper.includes('YEAR-LONG') || notesUpper.includes('LINKED W/');
@@ -1,6 +1,7 @@
 import React from 'react';
 import { Award, Link2 } from 'lucide-react';
 import { LINKED_COURSE_RULES } from '../config';
+import { useCourseDescription } from '../hooks/useCourseDescription.js';
 
 // Function to abbreviate course names for display
 function abbreviateCourseName(fullName) {
@@ -82,6 +83,7 @@ export function CourseCard({
 
   // Find linked course if exists
   const linkedCourse = findLinkedCourse(course.courseId, courseCatalog);
+  const description = useCourseDescription(courseInfo);
 
   return (
     <div
@@ -110,9 +112,9 @@ export function CourseCard({
             {courseNumber && <span>{courseNumber} | </span>}
             <span>{courseInfo.pathway}</span>
           </div>
-          {courseInfo.notes && (
+          {description && (
             <div className="text-xs text-gray-600 mt-1 line-clamp-3 leading-relaxed">
-              {courseInfo.notes}
+              {description}
             </div>
           )}
           <div className="text-xs text-gray-400 mt-0.5 flex items-center gap-2">
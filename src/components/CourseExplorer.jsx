@@ -10,6 +10,9 @@ import {
   isYearLong,
   isAPorHonors,
 } from '../utils/courseUtils';
+import { rankCourses } from '../utils/courseSearch.js';
+import { useCourseDescription } from '../hooks/useCourseDescription.js';
+import { useSearchIndex } from '../hooks/useSearchIndex.js';
 
 /**
  * Course Explorer Component
@@ -25,6 +28,8 @@ export default function CourseExplorer() {
   const [selectedPathway, setSelectedPathway] = useState('all');
   const [searchQuery, setSearchQuery] = useState('');
   const [selectedCourse, setSelectedCourse] = useState(null);
+  const selectedDescription = useCourseDescription(selectedCourse);
+  const searchIndex = useSearchIndex();
 
   // Filter courses based on pathway and search query
   const filteredCourses = useMemo(() => {
@@ -35,13 +40,22 @@ export default function CourseExplorer() {
       courses = getCoursesByPathway(courses, selectedPathway);
     }
 
-    // Filter by search query
+    // Filter by search query: courses the search index ranks come first,
+    // then name and number matches it has no entry for (the only results
+    // until the index has loaded)
     if (searchQuery.trim()) {
-      courses = searchCourses(courses, searchQuery);
+      const matched = searchCourses(courses, searchQuery);
+      if (searchIndex) {
+        const ranked = rankCourses(searchIndex, courses, searchQuery);
+        const rankedSet = new Set(ranked);
+        courses = [...ranked, ...matched.filter(course => !rankedSet.has(course))];
+      } else {
+        courses = matched;
+      }
     }
 
     return courses;
-  }, [catalog.courses, selectedPathway, searchQuery]);
+  }, [catalog.courses, selectedPathway, searchQuery, searchIndex]);
 
   // Get course sequence if a course is selected
   const courseSequence = useMemo(() => {
@@ -268,10 +282,10 @@ export default function CourseExplorer() {
                   </div>
                 )}
 
-                {selectedCourse.notes && (
+                {selectedDescription && (
                   <div className="mb-4">
                     <h3 className="text-sm font-semibold text-gray-600 mb-2">Notes</h3>
-                    <p className="text-gray-700 text-sm">{selectedCourse.notes}</p>
+                    <p className="text-gray-700 text-sm">{selectedDescription}</p>
                   </div>
                 )}
 
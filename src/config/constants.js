@@ -4,6 +4,8 @@
  * Centralized constants for pathways, colors, CTE requirements, test subjects, etc.
  */
 
+import deprecatedCourseData from '../data/deprecated_courses.json';
+
 /**
  * Grade options for GPA mode
  */
@@ -188,12 +190,14 @@ export const RECOMMENDED_9TH_GRADE = {
 
 /**
  * Courses no longer offered (do not delete from catalog, just prevent selection/suggestion)
+ * Hand-listed ids plus the map edition_diff.py generates between catalog editions
  */
-export const DEPRECATED_COURSES = [
+export const DEPRECATED_COURSES = [...new Set([
   '000234-000235',  // Mobile App Development 1-2
   '000363-000364',  // Writing Seminar 1-2
-  '000482-000483'   // Spanish 9-10
-];
+  '000482-000483',  // Spanish 9-10
+  ...Object.keys(deprecatedCourseData.deprecatedCourses)
+])];
 
 /**
  * Complex linked course relationships for auto-suggest
@@ -260,6 +264,8 @@ export const MAX_SEMESTER_CREDITS = 45;
  * Exclusive course pairs - only ONE can be taken (not both)
  * These are courses where one is the plain version and the other is AVID-linked.
  * Student cannot take both "English 1-2" AND "English 1-2 (w/AVID)" - must choose one.
+ * (alternate_ids.py folds the AVID-linked sections into the plain course's
+ * alternate_ids; this only applies to catalogs that still list them.)
  */
 export const EXCLUSIVE_COURSE_PAIRS = [
   // English 1-2 vs English 1-2 (linked w/AVID 1-2)
@@ -0,0 +1,37 @@
+/**
+ * useCourseDescription Hook
+ *
+ * Loads a course's description from the description store when a
+ * component showing it mounts.
+ */
+import { useState, useEffect } from 'react';
+import { loadDescription } from '../utils/descriptionStore.js';
+
+/**
+ * Description for a course, loaded on demand
+ *
+ * @param {Object|null} course - Catalog course (notes, if present, are shown until the store answers)
+ * @returns {string} - Description text ('' while loading or if there is none)
+ */
+export function useCourseDescription(course) {
+  const courseId = course?.course_id;
+  const [description, setDescription] = useState(null);
+
+  useEffect(() => {
+    if (!courseId) return undefined;
+    let cancelled = false;
+    setDescription(null);
+    loadDescription(courseId)
+      .then(text => {
+        if (!cancelled) setDescription(text);
+      })
+      .catch(error => {
+        console.error(`Error loading description for "${courseId}":`, error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [courseId]);
+
+  return description ?? course?.notes ?? '';
+}
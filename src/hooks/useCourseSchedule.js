@@ -8,15 +8,17 @@
  * API for course mutations.
  */
 import { useState, useEffect, useCallback } from 'react';
+import { resolveScheduledCourses } from '../utils/alternateIds.js';
 
 const STORAGE_KEY = 'westview-courses';
 const MAX_HISTORY = 5;
 
 /**
  * Load courses from localStorage with migration handling
+ * @param {Object} alternateIndex - Optional: catalog alternate ID index
  * @returns {Array} - Initial courses array
  */
-function loadInitialCourses() {
+function loadInitialCourses(alternateIndex) {
   try {
     const saved = localStorage.getItem(STORAGE_KEY);
     if (!saved) return [];
@@ -33,7 +35,9 @@ function loadInitialCourses() {
       return [];
     }
 
-    return parsed;
+    // Migration: sections saved under an alternate ID (e.g. English 1-2
+    // linked w/AVID) are now part of their canonical course
+    return resolveScheduledCourses(parsed, alternateIndex);
   } catch (error) {
     console.error('Error loading courses from localStorage:', error);
     return [];
@@ -43,11 +47,12 @@ function loadInitialCourses() {
 /**
  * Course schedule state management hook
  *
+ * @param {Object} alternateIndex - Optional: catalog alternate ID index
  * @returns {Object} - Schedule state and actions
  */
-export function useCourseSchedule() {
+export function useCourseSchedule(alternateIndex = null) {
   // Core state
-  const [courses, setCourses] = useState(loadInitialCourses);
+  const [courses, setCourses] = useState(() => loadInitialCourses(alternateIndex));
   const [courseHistory, setCourseHistory] = useState([]);
 
   // Persist courses to localStorage
@@ -0,0 +1,33 @@
+/**
+ * useSearchIndex Hook
+ *
+ * Loads the course search index (search_index.py) when a component that
+ * searches courses mounts.
+ */
+import { useState, useEffect } from 'react';
+import { loadSearchIndex, createSearchIndex } from '../utils/courseSearch.js';
+
+/**
+ * The search index, once loaded
+ *
+ * @returns {Object|null} - Index for searchIndex/rankCourses (null while loading or if it failed to load)
+ */
+export function useSearchIndex() {
+  const [index, setIndex] = useState(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    loadSearchIndex()
+      .then(serialized => {
+        if (!cancelled) setIndex(createSearchIndex(serialized));
+      })
+      .catch(error => {
+        console.error('Error loading the course search index:', error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, []);
+
+  return index;
+}
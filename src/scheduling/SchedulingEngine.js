@@ -7,10 +7,18 @@
  * - Semester-only offerings
  */
 
+import { createEligibilityLookup } from '../utils/eligibilityMatrix.js';
+
 export class SchedulingEngine {
-  constructor(coursesData) {
+  /**
+   * @param {Array} coursesData - Catalog courses
+   * @param {Object} eligibilityMatrix - Optional: the catalog's precomputed
+   *   eligibility matrix (see eligibility_matrix.py)
+   */
+  constructor(coursesData, eligibilityMatrix = null) {
     this.courses = coursesData;
     this.coursesById = this.indexCoursesById();
+    this.eligibility = createEligibilityLookup(eligibilityMatrix);
   }
 
   /**
@@ -143,8 +151,8 @@ export class SchedulingEngine {
    * PATTERN 3: AP/Honors Course Detection
    *
    * Identifies if a course is an AP or Honors level course.
-   * While pair_course_id is not populated in current data,
-   * we detect these courses for future pairing logic.
+   * pair_course_id, when set, is its regular/Honors/AP counterpart
+   * (see pair_courses.py).
    *
    * Examples:
    * - AP CALCULUS AB 1-2: is_ap_or_honors_pair = true
@@ -319,6 +327,10 @@ export class SchedulingEngine {
    * Checks if a student's grade level can take this course.
    */
   canTakeCourse(courseId, studentGrade) {
+    if (this.eligibility) {
+      return this.eligibility.isEligible(courseId, studentGrade);
+    }
+
     const course = this.coursesById[courseId];
     if (!course) return false;
 
@@ -330,11 +342,14 @@ export class SchedulingEngine {
    * Get all courses available to a student based on grade level
    */
   getCoursesForGrade(gradeLevel) {
-    return this.courses
-      .filter(course => {
-        const allowedGrades = course.grades_allowed || [];
-        return allowedGrades.includes(gradeLevel);
-      })
+    const courses = this.eligibility
+      ? this.eligibility.eligibleCourses(gradeLevel).map(id => this.coursesById[id])
+      : this.courses.filter(course => {
+          const allowedGrades = course.grades_allowed || [];
+          return allowedGrades.includes(gradeLevel);
+        });
+
+    return courses
       .map(course => ({
         id: course.course_id,
         name: course.full_name,
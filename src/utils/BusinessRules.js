@@ -9,6 +9,8 @@
  * - No duplicates
  */
 
+import { getLanguage, getLevelNumber } from './courseAttributes.js';
+
 export class BusinessRules {
   constructor(courses, suggestions, catalog, term, year, preferredLanguage = null) {
     this.courses = courses;
@@ -429,12 +431,10 @@ export class BusinessRules {
     if (allLanguageCourses.length === 0) return true; // No constraint yet
 
     // Extract language from first existing/suggested course
-    const existingLanguage = this.extractLanguage(
-      this.catalog[allLanguageCourses[0].courseId].full_name
-    );
+    const existingLanguage = getLanguage(this.catalog[allLanguageCourses[0].courseId]);
 
     // Extract language from proposed course
-    const proposedLanguage = this.extractLanguage(course.full_name);
+    const proposedLanguage = getLanguage(course);
 
     return existingLanguage === proposedLanguage;
   }
@@ -456,13 +456,13 @@ export class BusinessRules {
       c.year === this.year && this.termQuarters.includes(c.quarter)
     );
 
-    const proposedLanguage = this.extractLanguage(course.full_name);
+    const proposedLanguage = getLanguage(course);
 
     const hasLanguageInTerm = termCourses.some(c => {
       const info = this.catalog[c.courseId];
       if (!info || info.pathway !== 'Foreign Language') return false;
       if (info.full_name.toUpperCase().includes('LITERATURE')) return false; // Exclude literature
-      return this.extractLanguage(info.full_name) === proposedLanguage;
+      return getLanguage(info) === proposedLanguage;
     });
 
     // Check already suggested courses for this term
@@ -470,7 +470,7 @@ export class BusinessRules {
       const info = this.catalog[s.courseId];
       if (!info || info.pathway !== 'Foreign Language') return false;
       if (info.full_name.toUpperCase().includes('LITERATURE')) return false;
-      return this.extractLanguage(info.full_name) === proposedLanguage;
+      return getLanguage(info) === proposedLanguage;
     });
 
     return !hasLanguageInTerm && !hasLanguageInSuggestions;
@@ -499,26 +499,6 @@ export class BusinessRules {
     return !yearCourses.some(c => c.courseId === course.course_id);
   }
 
-  /**
-   * Extract language name from course title
-   * @param {string} courseName - e.g., "SPANISH 3-4" or "CHINESE MANDARIN 1-2"
-   * @returns {string} - e.g., "SPANISH" or "CHINESE MANDARIN"
-   */
-  extractLanguage(courseName) {
-    const words = courseName.toUpperCase().split(' ');
-
-    // Multi-word languages (e.g., "CHINESE MANDARIN")
-    if (words.length > 1 && words[1].match(/^[A-Z]+$/)) {
-      // Check if second word is also language (not level like "1-2")
-      if (!words[1].match(/\d/)) {
-        return `${words[0]} ${words[1]}`;
-      }
-    }
-
-    // Single-word languages (e.g., "SPANISH")
-    return words[0];
-  }
-
   /**
    * RULE: Foreign language courses must be taken in sequence
    * Cannot suggest level 3-4 without having 1-2 completed, etc.
@@ -529,31 +509,25 @@ export class BusinessRules {
     if (course.pathway !== 'Foreign Language') return true;
 
     // Extract level from course name (e.g., "3-4" from "SPANISH 3-4")
-    const levelMatch = course.full_name.toUpperCase().match(/(\d+)-(\d+)/);
-    if (!levelMatch) return true; // No level pattern, allow (e.g., AP courses)
-
-    const courseLevel = parseInt(levelMatch[1]);
+    const courseLevel = getLevelNumber(course);
+    if (!courseLevel) return true; // No level pattern, allow (e.g., AP courses)
 
     // Level 1-2 has no prerequisite
     if (courseLevel === 1) return true;
 
     // For higher levels, check if prerequisite level is completed
     const prerequisiteLevel = courseLevel - 2; // 3-4 needs 1-2, 5-6 needs 3-4, etc.
-    const language = this.extractLanguage(course.full_name);
+    const language = getLanguage(course);
 
     // Check all scheduled courses for prerequisite completion
     const hasPrerequisite = this.courses.some(c => {
       const info = this.catalog[c.courseId];
       if (!info || info.pathway !== 'Foreign Language') return false;
 
-      const cLanguage = this.extractLanguage(info.full_name);
+      const cLanguage = getLanguage(info);
       if (cLanguage !== language) return false;
 
-      const cLevelMatch = info.full_name.toUpperCase().match(/(\d+)-(\d+)/);
-      if (!cLevelMatch) return false;
-
-      const cLevel = parseInt(cLevelMatch[1]);
-      return cLevel === prerequisiteLevel;
+      return getLevelNumber(info) === prerequisiteLevel;
     });
 
     // Also check suggestions for prerequisite
@@ -561,14 +535,10 @@ export class BusinessRules {
       const info = this.catalog[s.courseId];
       if (!info || info.pathway !== 'Foreign Language') return false;
 
-      const sLanguage = this.extractLanguage(info.full_name);
+      const sLanguage = getLanguage(info);
       if (sLanguage !== language) return false;
 
-      const sLevelMatch = info.full_name.toUpperCase().match(/(\d+)-(\d+)/);
-      if (!sLevelMatch) return false;
-
-      const sLevel = parseInt(sLevelMatch[1]);
-      return sLevel === prerequisiteLevel;
+      return getLevelNumber(info) === prerequisiteLevel;
     });
 
     return hasPrerequisite || hasPrerequisiteInSuggestions;
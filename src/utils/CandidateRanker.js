@@ -6,8 +6,29 @@
  * courses by how well they satisfy unmet requirements.
  *
  * Higher score = higher priority for suggestion.
+ *
+ * Course-only properties (the name checks below) are precomputed by the
+ * catalog build into course.rank_features (see ranking_features.py); the
+ * name-parsing fallbacks are used for courses without it.
  */
 
+import { getLanguage, getLevelNumber } from './courseAttributes.js';
+
+// Layout of course.rank_features (RANK_FEATURES in ranking_features.py)
+const RANK_FEATURES = {
+  GRADE_BONUS_9: 0, // grade bonuses for grades 9-12 at 0-3
+  HAS_AP: 4,
+  HAS_HONORS: 5,
+  IS_FOUNDATIONAL: 6,
+  LOW_CREDIT_KIND: 7,
+  SCIENCE_BONUS_9: 8,
+  ENS_LEVEL: 9,
+  NAME_LEVEL: 10
+};
+
+const LOW_CREDIT_HUMAN_GEOGRAPHY = 1;
+const LOW_CREDIT_ASB = 2;
+
 export class CandidateRanker {
   constructor(unmetRequirements, year, term, courses = [], catalog = {}) {
     this.unmet = unmetRequirements;
@@ -42,14 +63,13 @@ export class CandidateRanker {
 
     if (this.unmet.needsPE && course.pathway === 'Physical Education') {
       // PE is REQUIRED for Westview graduation (20 credits total)
-      const nameUpper = course.full_name.toUpperCase();
-
       if (this.year === 9) {
         // Grade 9: ENS 3-4 in Fall, ENS 1-2 in Spring
-        if (this.term === 'fall' && nameUpper.includes('ENS 3-4')) {
+        const ensLevel = this.getEnsLevel(course);
+        if (this.term === 'fall' && ensLevel === 3) {
           return 950; // Highest priority for Grade 9 Fall
         }
-        if (this.term === 'spring' && nameUpper.includes('ENS 1-2')) {
+        if (this.term === 'spring' && ensLevel === 1) {
           return 950; // Highest priority for Grade 9 Spring
         }
         // Other PE courses for Grade 9 get lower priority
@@ -78,12 +98,7 @@ export class CandidateRanker {
 
       // Grade 9: Biology is preferred, but Chemistry is also acceptable
       if (this.year === 9) {
-        const nameUpper = course.full_name.toUpperCase();
-        if (nameUpper.includes('BIOLOGY') && !nameUpper.includes('AP')) {
-          score += 50; // Prefer Biology for Grade 9
-        } else if (nameUpper.includes('CHEMISTRY') && !nameUpper.includes('AP')) {
-          score += 30; // Chemistry is also acceptable
-        }
+        score += this.getGrade9ScienceBonus(course);
       }
 
       score += this.gradeAppropriatenessBonus(course);
@@ -162,6 +177,10 @@ export class CandidateRanker {
    * @returns {number} - Bonus points (0-50)
    */
   gradeAppropriatenessBonus(course) {
+    if (course.rank_features && this.year >= 9 && this.year <= 12) {
+      return course.rank_features[RANK_FEATURES.GRADE_BONUS_9 + this.year - 9];
+    }
+
     const nameUpper = course.full_name.toUpperCase();
 
     // Grade 9: prefer foundational courses and recommended electives
@@ -225,7 +244,9 @@ export class CandidateRanker {
    * @returns {number} - Penalty points (0-300)
    */
   penalizeAP(course) {
-    const isAP = course.full_name.toUpperCase().includes('AP');
+    const isAP = course.rank_features
+      ? course.rank_features[RANK_FEATURES.HAS_AP] === 1
+      : course.full_name.toUpperCase().includes('AP');
     if (!isAP) return 0;
 
     // Grade 9: heavily discourage AP (too early)
@@ -263,7 +284,9 @@ export class CandidateRanker {
    * @returns {number} - Penalty points (0-100)
    */
   penalizeHonors(course) {
-    const isHonors = course.full_name.toUpperCase().includes('HONORS');
+    const isHonors = course.rank_features
+      ? course.rank_features[RANK_FEATURES.HAS_HONORS] === 1
+      : course.full_name.toUpperCase().includes('HONORS');
     if (!isHonors) return 0;
 
     // Grade 9: discourage Honors (let students acclimate)
@@ -281,11 +304,11 @@ export class CandidateRanker {
    * @returns {number} - Penalty points (0-1000)
    */
   penalizeLowCreditCourses(course) {
-    const nameUpper = course.full_name.toUpperCase();
+    const kind = this.getLowCreditKind(course);
 
     // AP Human Geography: only 5 credits (semester course)
     // Deprioritize in Years 1-3 so students take full-credit history courses
-    if (nameUpper.includes('HUMAN GEOGRAPHY')) {
+    if (kind === LOW_CREDIT_HUMAN_GEOGRAPHY) {
       if (this.year <= 11) {
         return 200; // Strong penalty in Grades 9-11
       }
@@ -295,7 +318,7 @@ export class CandidateRanker {
 
     // ASB: Only suggest if student already has ASB in their schedule
     // (ASB is a special leadership course, not a general elective)
-    if (nameUpper.includes('ASB')) {
+    if (kind === LOW_CREDIT_ASB) {
       const hasASB = this.courses.some(c => {
         const info = this.catalog[c.courseId];
         return info && info.full_name.toUpperCase().includes('ASB');
@@ -314,6 +337,10 @@ export class CandidateRanker {
    * @returns {boolean}
    */
   isFoundational(course) {
+    if (course.rank_features) {
+      return course.rank_features[RANK_FEATURES.IS_FOUNDATIONAL] === 1;
+    }
+
     const nameUpper = course.full_name.toUpperCase();
     return (
       nameUpper.includes('1-2') ||
@@ -333,11 +360,10 @@ export class CandidateRanker {
     if (course.pathway !== 'Foreign Language') return 0;
 
     // Extract level from course name
-    const levelMatch = course.full_name.toUpperCase().match(/(\d+)-(\d+)/);
-    if (!levelMatch) return 0;
+    const courseLevel = this.getNameLevel(course);
+    if (!courseLevel) return 0;
 
-    const courseLevel = parseInt(levelMatch[1]);
-    const language = this.extractLanguage(course.full_name);
+    const language = getLanguage(course);
 
     // Find user's highest level in this language
     const userHighestLevel = this.getUserHighestLanguageLevel(language);
@@ -369,15 +395,12 @@ export class CandidateRanker {
       const info = this.catalog[c.courseId];
       if (!info || info.pathway !== 'Foreign Language') return;
 
-      const cLanguage = this.extractLanguage(info.full_name);
+      const cLanguage = getLanguage(info);
       if (cLanguage !== language) return;
 
-      const levelMatch = info.full_name.toUpperCase().match(/(\d+)-(\d+)/);
-      if (levelMatch) {
-        const level = parseInt(levelMatch[1]);
-        if (level > highestLevel) {
-          highestLevel = level;
-        }
+      const level = this.getNameLevel(info);
+      if (level > highestLevel) {
+        highestLevel = level;
       }
     });
 
@@ -385,21 +408,62 @@ export class CandidateRanker {
   }
 
   /**
-   * Extract language name from course title
-   * @param {string} courseName - e.g., "SPANISH 3-4" or "CHINESE MANDARIN 1-2"
-   * @returns {string} - e.g., "SPANISH" or "CHINESE"
+   * Grade 9 science preference: Biology, then Chemistry (non-AP)
+   * @param {Object} course
+   * @returns {number} - Bonus (0, 30 or 50)
    */
-  extractLanguage(courseName) {
-    const words = courseName.toUpperCase().split(' ');
+  getGrade9ScienceBonus(course) {
+    if (course.rank_features) {
+      return course.rank_features[RANK_FEATURES.SCIENCE_BONUS_9];
+    }
 
-    // Multi-word languages (e.g., "CHINESE MANDARIN")
-    if (words.length > 1 && words[1].match(/^[A-Z]+$/)) {
-      if (!words[1].match(/\d/)) {
-        return `${words[0]} ${words[1]}`;
-      }
+    const nameUpper = course.full_name.toUpperCase();
+    if (nameUpper.includes('BIOLOGY') && !nameUpper.includes('AP')) return 50;
+    if (nameUpper.includes('CHEMISTRY') && !nameUpper.includes('AP')) return 30;
+    return 0;
+  }
+
+  /**
+   * Which ENS course this is (1 for ENS 1-2, 3 for ENS 3-4, else 0)
+   * @param {Object} course
+   * @returns {number}
+   */
+  getEnsLevel(course) {
+    if (course.rank_features) {
+      return course.rank_features[RANK_FEATURES.ENS_LEVEL];
     }
 
-    // Single-word languages (e.g., "SPANISH")
-    return words[0];
+    const nameUpper = course.full_name.toUpperCase();
+    if (nameUpper.includes('ENS 3-4')) return 3;
+    if (nameUpper.includes('ENS 1-2')) return 1;
+    return 0;
+  }
+
+  /**
+   * Low-credit/special course kind (Human Geography, ASB, or none)
+   * @param {Object} course
+   * @returns {number}
+   */
+  getLowCreditKind(course) {
+    if (course.rank_features) {
+      return course.rank_features[RANK_FEATURES.LOW_CREDIT_KIND];
+    }
+
+    const nameUpper = course.full_name.toUpperCase();
+    if (nameUpper.includes('HUMAN GEOGRAPHY')) return LOW_CREDIT_HUMAN_GEOGRAPHY;
+    if (nameUpper.includes('ASB')) return LOW_CREDIT_ASB;
+    return 0;
+  }
+
+  /**
+   * First number of the level range in a course name ("SPANISH 3-4" -> 3)
+   * @param {Object} course
+   * @returns {number} - Level, or 0 if the name has none
+   */
+  getNameLevel(course) {
+    if (course.rank_features) {
+      return course.rank_features[RANK_FEATURES.NAME_LEVEL];
+    }
+    return getLevelNumber(course);
   }
 }
@@ -8,6 +8,8 @@
  * with a unified calculator that matches the sidebar progress display.
  */
 
+import { getLanguage, getLevelNumber } from './courseAttributes.js';
+
 export class RequirementCalculator {
   constructor(courses, courseCatalog, westviewReqs, agReqs) {
     this.courses = courses;
@@ -218,45 +220,18 @@ export class RequirementCalculator {
 
     // Extract language from first course
     const firstCourse = this.catalog[languageCourses[0].courseId];
-    const language = this.extractLanguage(firstCourse.full_name);
+    const language = getLanguage(firstCourse);
 
     // Find highest level taken
     let highestLevel = 0;
     for (const c of languageCourses) {
       const info = this.catalog[c.courseId];
-      if (this.extractLanguage(info.full_name) === language) {
-        const level = this.getLevelNumber(info.full_name);
+      if (getLanguage(info) === language) {
+        const level = getLevelNumber(info);
         if (level > highestLevel) highestLevel = level;
       }
     }
 
     return { hasAnyLanguage: true, language, highestLevel };
   }
-
-  /**
-   * Extract language name from course title
-   * @param {string} courseName - e.g., "SPANISH 3-4" or "CHINESE MANDARIN 1-2"
-   * @returns {string} - e.g., "SPANISH" or "CHINESE MANDARIN"
-   */
-  extractLanguage(courseName) {
-    const words = courseName.toUpperCase().split(' ');
-
-    // Multi-word languages (e.g., "CHINESE MANDARIN")
-    if (words.length > 1 && words[1].match(/^[A-Z]+$/)) {
-      return `${words[0]} ${words[1]}`;
-    }
-
-    // Single-word languages (e.g., "SPANISH")
-    return words[0];
-  }
-
-  /**
-   * Extract level number from course name
-   * @param {string} name - e.g., "SPANISH 3-4"
-   * @returns {number} - e.g., 3
-   */
-  getLevelNumber(name) {
-    const match = name.match(/(\d+)-(\d+)/);
-    return match ? parseInt(match[1]) : 0;
-  }
 }
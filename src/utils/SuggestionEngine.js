@@ -6,7 +6,7 @@
  * a clean, modular, requirement-driven architecture.
  *
  * Usage:
- *   const engine = new SuggestionEngine(normalizedCatalog, deprecatedCourses);
+ *   const engine = new SuggestionEngine(normalizedCatalog, deprecatedCourses, catalogData.eligibility);
  *   const suggestions = engine.generateSuggestions({
  *     courses,
  *     year: '10',
@@ -19,11 +19,14 @@
 import { RequirementCalculator } from './RequirementCalculator.js';
 import { CandidateRanker } from './CandidateRanker.js';
 import { BusinessRules } from './BusinessRules.js';
+import { getLanguage, getLevelNumber } from './courseAttributes.js';
+import { createEligibilityLookup, isOfferedInTerm } from './eligibilityMatrix.js';
 
 export class SuggestionEngine {
-  constructor(normalizedCatalog, deprecatedCourses) {
+  constructor(normalizedCatalog, deprecatedCourses, eligibilityMatrix = null) {
     this.catalog = normalizedCatalog;
     this.deprecated = deprecatedCourses;
+    this.eligibility = createEligibilityLookup(eligibilityMatrix);
   }
 
   /**
@@ -74,7 +77,7 @@ export class SuggestionEngine {
     }
 
     // Step 2: Build candidate pool (all eligible courses)
-    const candidates = this.buildCandidatePool(year, courses);
+    const candidates = this.buildCandidatePool(year, courses, term);
 
     // Step 3: Rank candidates by priority
     const ranker = new CandidateRanker(unmetRequirements, year, term, courses, this.catalog);
@@ -205,24 +208,33 @@ export class SuggestionEngine {
   }
 
   /**
-   * Build pool of all courses eligible for this year
+   * Build pool of all courses eligible for this year and term
    * (Does NOT apply scoring or business rules - just basic eligibility)
    * @param {string} year
    * @param {Array} courses
+   * @param {string} term - Optional: 'fall' or 'spring'
    * @returns {Array}
    */
-  buildCandidatePool(year, courses) {
+  buildCandidatePool(year, courses, term = null) {
     const yearInt = parseInt(year);
 
     // Exclude courses already scheduled in ANY year (not just current year)
     const allScheduledCourseIds = new Set(courses.map(c => c.courseId));
 
-    return Object.entries(this.catalog)
+    // Grade/term eligibility: a lookup in the precomputed matrix when the
+    // catalog has one, otherwise a scan of the catalog
+    const eligible = this.eligibility
+      ? this.eligibility.eligibleCourses(yearInt, term || undefined).map(id => [id, this.catalog[id]])
+      : Object.entries(this.catalog).filter(([, course]) =>
+          course.grades_allowed?.includes(yearInt) && (!term || isOfferedInTerm(course, term))
+        );
+
+    return eligible
       .filter(([id, course]) => {
         // Basic eligibility only - no pathway/AP/yearlong filtering here
+        if (!course) return false;
         if (this.deprecated.includes(id)) return false;
         if (allScheduledCourseIds.has(id)) return false; // Already taken in any year
-        if (!course.grades_allowed?.includes(yearInt)) return false;
 
         // Never suggest Special Ed courses
         if (course.full_name.toUpperCase().includes('SPECIAL ED')) return false;
@@ -394,21 +406,19 @@ export class SuggestionEngine {
 
     // Foreign Language sequence detection (1-2 → 3-4 → 5-6 → 7-8 → 9-10)
     if (course.pathway === 'Foreign Language') {
-      const levelMatch = courseName.match(/(\d+)-(\d+)/);
-      if (levelMatch) {
-        const courseLevel = parseInt(levelMatch[1]);
+      const courseLevel = getLevelNumber(course);
+      if (courseLevel) {
 
         // Find if lower level of same language is in later quarter
-        const language = this.extractLanguage(course.full_name);
+        const language = getLanguage(course);
         const lowerLevelInYear = yearCourses.find(c => {
           const cInfo = this.catalog[c.courseId];
           if (!cInfo || cInfo.pathway !== 'Foreign Language') return false;
 
-          const cLanguage = this.extractLanguage(cInfo.full_name);
-          const cLevelMatch = cInfo.full_name.toUpperCase().match(/(\d+)-(\d+)/);
-          if (!cLevelMatch) return false;
+          const cLanguage = getLanguage(cInfo);
+          const cLevel = getLevelNumber(cInfo);
+          if (!cLevel) return false;
 
-          const cLevel = parseInt(cLevelMatch[1]);
           return cLanguage === language && cLevel < courseLevel;
         });
 
@@ -555,24 +565,4 @@ export class SuggestionEngine {
 
     return false; // Prereq not satisfied
   }
-
-  /**
-   * Extract language name from course title
-   * @param {string} courseName - e.g., "SPANISH 3-4" or "CHINESE MANDARIN 1-2"
-   * @returns {string} - e.g., "SPANISH" or "CHINESE MANDARIN"
-   */
-  extractLanguage(courseName) {
-    const words = courseName.toUpperCase().split(' ');
-
-    // Multi-word languages (e.g., "CHINESE MANDARIN")
-    if (words.length > 1 && words[1].match(/^[A-Z]+$/)) {
-      // Check if second word is also language (not level like "1-2")
-      if (!words[1].match(/\d/)) {
-        return `${words[0]} ${words[1]}`;
-      }
-    }
-
-    // Single-word languages (e.g., "SPANISH")
-    return words[0];
-  }
 }
@@ -0,0 +1,36 @@
+/**
+ * alternateIds.js
+ *
+ * Lookups through the alternate course ID index alternate_ids.py adds to
+ * the catalog (courseCatalogData.alternate_index). It maps every alternate
+ * number a course is scheduled under ("801376", "091376-091377": Hybrid and
+ * AVID-linked sections, ...) to the course's canonical course_id.
+ *
+ * Usage:
+ *   resolveCourseId(courseCatalogData.alternate_index, '091376-091377'); // '001376-001377'
+ */
+
+/**
+ * Canonical course_id for any course or alternate ID
+ * @param {Object|undefined} alternateIndex
+ * @param {string} courseId
+ * @returns {string}
+ */
+export function resolveCourseId(alternateIndex, courseId) {
+  return alternateIndex?.[courseId] || courseId;
+}
+
+/**
+ * Scheduled courses with alternate IDs replaced by their canonical course
+ * (schedules saved before the alternates were folded into one record)
+ * @param {Array} courses - [{ courseId, ... }]
+ * @param {Object|undefined} alternateIndex
+ * @returns {Array}
+ */
+export function resolveScheduledCourses(courses, alternateIndex) {
+  if (!alternateIndex) return courses;
+  return courses.map(c => {
+    const courseId = resolveCourseId(alternateIndex, c.courseId);
+    return courseId === c.courseId ? c : { ...c, courseId };
+  });
+}
@@ -0,0 +1,44 @@
+/**
+ * catalogBundle.js
+ *
+ * Decoder for the compact catalog bundle written by catalog_bundle.py.
+ * Dictionary-encoded fields are stored as one array of integer codes per
+ * field; the mostly-unique text fields are kept per course in `rows`.
+ *
+ * Usage:
+ *   import catalogBundle from '../data/courses_bundle.json';
+ *   const catalog = decodeCatalog(catalogBundle); // same shape as courses_complete.json
+ */
+
+const BUNDLE_FORMAT = 1;
+const KEYS_COLUMN = '_keys';
+
+export function decodeCatalog(bundle) {
+  if (bundle.format !== BUNDLE_FORMAT) {
+    throw new Error(`Unsupported catalog bundle format: ${bundle.format}`);
+  }
+
+  const { fields, columns, rows } = bundle;
+  const rowPosition = new Map(bundle.row_fields.map((field, i) => [field, i]));
+  const keys = columns[KEYS_COLUMN];
+
+  const courses = new Array(rows.length);
+  for (let i = 0; i < rows.length; i++) {
+    const course = {};
+    for (const f of keys.dict[keys.codes[i]]) {
+      const field = fields[f];
+      const position = rowPosition.get(field);
+      if (position !== undefined) {
+        course[field] = rows[i][position];
+      } else {
+        const column = columns[field];
+        // Shared dictionary values are copied so callers can mutate courses
+        const value = column.dict[column.codes[i]];
+        course[field] = Array.isArray(value) ? value.slice() : value;
+      }
+    }
+    courses[i] = course;
+  }
+
+  return { ...bundle.meta, courses };
+}
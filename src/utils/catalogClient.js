@@ -0,0 +1,130 @@
+/**
+ * catalogClient.js
+ *
+ * Loads a published catalog edition (see publish_catalog.py) with long-term
+ * client caching. The manifest is the only request that has to revalidate:
+ * catalog bundles and patches have content-hashed names and are immutable.
+ * A client holding an older version applies the patches between it and
+ * the current one instead of downloading the whole catalog.
+ *
+ * Not used by the app yet: App.jsx still imports the catalog bundle built
+ * into src/data/courses_bundle.json.
+ *
+ * Usage:
+ *   const catalog = await loadPublishedCatalog();          // latest edition
+ *   const catalog = await loadPublishedCatalog('2025-2026');
+ */
+
+import { decodeCatalog } from './catalogBundle.js';
+
+const CATALOG_URL = '/data/catalog/';
+const CACHE_KEY = 'publishedCatalog';
+const PATCH_FORMAT = 1;
+
+async function fetchJson(url, options) {
+  const response = await fetch(url, options);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: ${response.status}`);
+  }
+  return response.json();
+}
+
+/**
+ * Patch key of each course: its course_id, with #n on the nth repeat
+ */
+function courseKeys(courses) {
+  const seen = new Map();
+  return courses.map(course => {
+    const n = seen.get(course.course_id) || 0;
+    seen.set(course.course_id, n + 1);
+    return n === 0 ? course.course_id : `${course.course_id}#${n}`;
+  });
+}
+
+/**
+ * A catalog with a course-level patch applied
+ */
+export function applyCatalogPatch(catalog, patch) {
+  if (patch.format !== PATCH_FORMAT) {
+    throw new Error(`Unsupported catalog patch format: ${patch.format}`);
+  }
+
+  const keys = courseKeys(catalog.courses);
+  const courses = new Map(keys.map((key, i) => [key, catalog.courses[i]]));
+  for (const key of patch.remove) {
+    courses.delete(key);
+  }
+  for (const [key, course] of patch.upsert) {
+    courses.set(key, course);
+  }
+
+  const order = patch.order || [...courses.keys()];
+  return { ...patch.meta, courses: order.map(key => courses.get(key)) };
+}
+
+/**
+ * Patches leading from one published version of an edition to another, or
+ * null if the chain is broken (an unpublished or too-large patch)
+ */
+function patchChain(versions, edition, fromHash, toHash) {
+  const editionVersions = versions.filter(v => v.edition === edition);
+  let i = editionVersions.map(v => v.sha256).lastIndexOf(toHash);
+  const chain = [];
+  while (i > 0) {
+    if (!editionVersions[i].patch) return null;
+    chain.unshift(editionVersions[i].patch);
+    if (editionVersions[i - 1].sha256 === fromHash) return chain;
+    i--;
+  }
+  return null;
+}
+
+function readCache(storage) {
+  try {
+    const item = storage.getItem(CACHE_KEY);
+    return item ? JSON.parse(item) : null;
+  } catch (error) {
+    console.error('Error reading cached catalog:', error);
+    return null;
+  }
+}
+
+function writeCache(storage, sha256, catalog) {
+  try {
+    storage.setItem(CACHE_KEY, JSON.stringify({ sha256, catalog }));
+  } catch (error) {
+    console.error('Error caching catalog:', error);
+  }
+}
+
+/**
+ * The catalog of a published edition, from cache, patches or the full bundle
+ */
+export async function loadPublishedCatalog(edition = null, storage = localStorage) {
+  const manifest = await fetchJson(CATALOG_URL + 'manifest.json', { cache: 'no-cache' });
+  const name = edition || manifest.latest;
+  const target = manifest.editions[name];
+  if (!target) {
+    throw new Error(`No published catalog edition "${name}"`);
+  }
+
+  const cached = readCache(storage);
+  if (cached && cached.sha256 === target) {
+    return cached.catalog;
+  }
+
+  let catalog = null;
+  const chain = cached && patchChain(manifest.versions, name, cached.sha256, target);
+  if (chain) {
+    catalog = cached.catalog;
+    for (const name of chain) {
+      catalog = applyCatalogPatch(catalog, await fetchJson(CATALOG_URL + name));
+    }
+  } else {
+    const version = manifest.versions.find(v => v.sha256 === target);
+    catalog = decodeCatalog(await fetchJson(CATALOG_URL + version.catalog));
+  }
+
+  writeCache(storage, target, catalog);
+  return catalog;
+}
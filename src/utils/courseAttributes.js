@@ -0,0 +1,47 @@
+/**
+ * courseAttributes.js
+ *
+ * Name-derived course attributes. The catalog build (course_enrichment.py)
+ * stores them on every course as language, level_start/level_end,
+ * base_name, is_ap, is_honors and sequence_index; these helpers read the
+ * stored fields and only parse the name for courses built without them.
+ */
+
+const LEVEL_PATTERN = /(\d+)-(\d+)/;
+
+/**
+ * Extract language name from course title
+ * @param {string} courseName - e.g., "SPANISH 3-4" or "CHINESE MANDARIN 1-2"
+ * @returns {string} - e.g., "SPANISH" or "CHINESE MANDARIN"
+ */
+export function extractLanguage(courseName) {
+  const words = courseName.toUpperCase().split(' ');
+
+  // Multi-word languages (e.g., "CHINESE MANDARIN")
+  if (words.length > 1 && words[1].match(/^[A-Z]+$/)) {
+    return `${words[0]} ${words[1]}`;
+  }
+
+  // Single-word languages (e.g., "SPANISH")
+  return words[0];
+}
+
+/**
+ * Language of a Foreign Language course
+ * @param {Object} course - Catalog course
+ * @returns {string} - e.g., "SPANISH"
+ */
+export function getLanguage(course) {
+  return course.language || extractLanguage(course.full_name);
+}
+
+/**
+ * First number of the level range in a course name ("SPANISH 3-4" -> 3)
+ * @param {Object} course - Catalog course
+ * @returns {number} - Level, or 0 if the name has none
+ */
+export function getLevelNumber(course) {
+  if ('level_start' in course) return course.level_start || 0;
+  const match = course.full_name.match(LEVEL_PATTERN);
+  return match ? parseInt(match[1]) : 0;
+}
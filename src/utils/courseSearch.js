@@ -0,0 +1,239 @@
+/**
+ * courseSearch.js
+ *
+ * Queries over the BM25 course search index search_index.py writes to
+ * /data/search-index.json. Each term's postings hold the courses it
+ * occurs in (name, description, "For students interested in" text) with
+ * their BM25 weight precomputed, best first, so a query is a few postings
+ * lookups and a sum instead of a catalog scan. The index is fetched at
+ * most once; postings are decoded the first time a query needs them.
+ *
+ * Usage:
+ *   const index = createSearchIndex(await loadSearchIndex());
+ *   searchIndex(index, 'marine bio', 20); // [{ courseId, score }, ...]
+ */
+
+const INDEX_URL = '/data/search-index.json';
+const INDEX_FORMAT = 2;
+
+// Mirrors search_index.py: tokenizer, stop words and stemmer
+const TOKEN = /[a-z0-9]+/g;
+const STOP_WORDS = new Set(
+  ('a an and are as at be by for from has have in is it its of on or that the their this to ' +
+   'will with who which students student course courses').split(' ')
+);
+const SUFFIX_RULES = [['ational', 'ate'], ['ization', 'ize'], ['ies', 'y'], ['sses', 'ss'],
+                      ['ing', ''], ['ed', ''], ['ly', ''], ['s', '']];
+const MIN_STEM = 3;
+const KEPT_DOUBLES = 'lsz';
+
+let indexPromise = null;
+
+/**
+ * Stem of a lowercase word ("programming" -> "program")
+ * @param {string} word
+ * @returns {string}
+ */
+export function stem(word) {
+  if (/^\d+$/.test(word)) return word;
+  for (const [suffix, replacement] of SUFFIX_RULES) {
+    if (word.endsWith(suffix) && word.length - suffix.length >= MIN_STEM) {
+      if (suffix === 's' && 'sui'.includes(word[word.length - 2])) return word;
+      let base = word.slice(0, -suffix.length) + replacement;
+      const last = base[base.length - 1];
+      if ((suffix === 'ing' || suffix === 'ed') && last === base[base.length - 2] &&
+          !KEPT_DOUBLES.includes(last) && !'aeiou'.includes(last)) {
+        base = base.slice(0, -1);
+      }
+      return base;
+    }
+  }
+  return word;
+}
+
+function words(text) {
+  return (text.toLowerCase().match(TOKEN) || []).filter(w => !STOP_WORDS.has(w));
+}
+
+function decodePostings(flat) {
+  const postings = new Map();
+  for (let i = 0; i < flat.length; i += 2) {
+    postings.set(flat[i], flat[i + 1]);
+  }
+  return postings;
+}
+
+/**
+ * Fetch the serialized index (once)
+ * @returns {Promise<Object>}
+ */
+export function loadSearchIndex() {
+  if (!indexPromise) {
+    indexPromise = fetch(INDEX_URL)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`Failed to load ${INDEX_URL}: ${response.status}`);
+        }
+        return response.json();
+      })
+      .catch(error => {
+        indexPromise = null; // allow a retry on the next request
+        throw error;
+      });
+  }
+  return indexPromise;
+}
+
+/**
+ * Queryable index over a serialized one (postings are decoded on first use)
+ * @param {Object} serialized
+ * @returns {Object}
+ */
+export function createSearchIndex(serialized) {
+  if (serialized.format !== INDEX_FORMAT) {
+    throw new Error(`Unsupported search index format: ${serialized.format}`);
+  }
+  return {
+    serialized,
+    termIndex: new Map(serialized.terms.map((term, i) => [term, i])),
+    decoded: new Map()
+  };
+}
+
+function decoded(index, key, flat) {
+  if (!index.decoded.has(key)) index.decoded.set(key, decodePostings(flat));
+  return index.decoded.get(key);
+}
+
+function termPostings(index, position) {
+  return decoded(index, position, index.serialized.postings[position]);
+}
+
+function lowerBound(terms, value, start = 0) {
+  let lo = start;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (terms[mid] < value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+// Each doc's best weight over several postings (unordered unless there is only one)
+function mergeBest(lists) {
+  if (lists.length === 1) return lists[0];
+  const sorted = [...lists].sort((a, b) => b.size - a.size);
+  const best = new Map(sorted[0]);
+  for (const postings of sorted.slice(1)) {
+    for (const [doc, weight] of postings) {
+      if (weight > (best.get(doc) || 0)) best.set(doc, weight);
+    }
+  }
+  return best;
+}
+
+// [postings, best first] of the terms starting with prefix; with top (at most
+// prefix_top), only the best top docs are needed and a precomputed list will do
+function prefixPostings(index, prefix, top = Infinity) {
+  const { serialized } = index;
+  if (top <= serialized.prefix_top && serialized.prefixes[prefix]) {
+    return [decoded(index, `^${prefix}`, serialized.prefixes[prefix]), true];
+  }
+  const first = lowerBound(serialized.terms, prefix);
+  const last = lowerBound(serialized.terms, prefix + '\uffff', first);
+  const lists = [];
+  for (let i = first; i < last; i++) lists.push(termPostings(index, i));
+  return [mergeBest(lists.length ? lists : [new Map()]), last - first <= 1];
+}
+
+// [postings, best first] of each query word; the last one is also matched as a prefix
+function queryPostings(index, query, limit = Infinity) {
+  const queryWords = words(query);
+  // A trailing space means the last word is finished
+  const typing = queryWords.length > 0 && !/\s$/.test(query);
+  return queryWords.map((word, i) => {
+    const term = stem(word);
+    const position = index.termIndex.get(term);
+    let postings = position !== undefined ? termPostings(index, position) : new Map();
+    let ordered = true;
+    if (typing && i === queryWords.length - 1) {
+      const top = queryWords.length === 1 ? limit : Infinity;
+      const [prefixed, prefixOrdered] = prefixPostings(index, word, top);
+      // The prefix postings already include the word's own term unless stemming shortened it
+      if (term.startsWith(word)) {
+        [postings, ordered] = [prefixed, prefixOrdered];
+      } else if (prefixed.size) {
+        [postings, ordered] = [mergeBest([postings, prefixed]), false];
+      }
+    }
+    return [postings, ordered];
+  });
+}
+
+const byScore = (a, b) => b[1] - a[1] || a[0] - b[0];
+
+/**
+ * Courses matching every word of a query, best first (mirrors search() in search_index.py)
+ * @param {Object} index - from createSearchIndex
+ * @param {string} query
+ * @param {number} [limit]
+ * @returns {Array<{courseId: string, score: number}>}
+ */
+export function searchIndex(index, query, limit = Infinity) {
+  const wordPostings = queryPostings(index, query, limit);
+  if (!wordPostings.length) return [];
+  const courseIds = index.serialized.course_ids;
+  const toResults = ranked => ranked.map(([doc, score]) => ({ courseId: courseIds[doc], score }));
+
+  if (wordPostings.length === 1 && wordPostings[0][1]) {
+    const ranked = [];
+    for (const entry of wordPostings[0][0]) {
+      if (ranked.length >= limit) break;
+      ranked.push(entry);
+    }
+    return toResults(ranked);
+  }
+
+  const [smallest, ...rest] = wordPostings.map(([postings]) => postings).sort((a, b) => a.size - b.size);
+  const scores = [];
+  for (const [doc, weight] of smallest) {
+    let score = weight;
+    let matched = true;
+    for (const postings of rest) {
+      const other = postings.get(doc);
+      if (other === undefined) {
+        matched = false;
+        break;
+      }
+      score += other;
+    }
+    if (matched) scores.push([doc, score]);
+  }
+  return toResults(scores.sort(byScore).slice(0, limit));
+}
+
+/**
+ * Catalog courses matching a query, best first. Courses are matched to
+ * the index by course_id or by any of their course numbers, so catalogs
+ * with their own IDs (src/data/courses.json) can use the index too.
+ * @param {Object} index - from createSearchIndex
+ * @param {Array} courses
+ * @param {string} query
+ * @returns {Array}
+ */
+export function rankCourses(index, courses, query) {
+  const scores = new Map();
+  for (const { courseId, score } of searchIndex(index, query)) {
+    for (const key of [courseId, ...(courseId.match(/\d{6}/g) || [])]) {
+      if (score > (scores.get(key) || 0)) scores.set(key, score);
+    }
+  }
+  const courseScore = course => Math.max(0, ...[course.course_id, ...(course.course_numbers || [])]
+    .map(key => scores.get(key) || 0));
+  return courses
+    .map(course => [course, courseScore(course)])
+    .filter(([, score]) => score > 0)
+    .sort((a, b) => b[1] - a[1])
+    .map(([course]) => course);
+}
@@ -71,9 +71,33 @@ export function isGraduationRequirement(course) {
 }
 
 /**
- * Get all courses in a sequence (following linked_courses)
+ * Get all courses in a sequence, from this course up
+ *
+ * Catalogs built with course_enrichment.py place each course in its
+ * sequence with base_name and sequence_index; the next level is the course
+ * one sequence_index up (the one matching this course's Honors/AP-ness when
+ * a level has several). Catalogs without those fields list the next course
+ * first in linked_courses.
  */
 export function getCourseSequence(course, courseLookup) {
+  if (course.sequence_index != null) {
+    const levels = new Map();
+    for (const other of new Set(Object.values(courseLookup))) {
+      if (other.base_name === course.base_name && other.sequence_index > course.sequence_index) {
+        if (!levels.has(other.sequence_index)) levels.set(other.sequence_index, []);
+        levels.get(other.sequence_index).push(other);
+      }
+    }
+
+    const sequence = [course];
+    for (const index of [...levels.keys()].sort((a, b) => a - b)) {
+      const candidates = levels.get(index);
+      sequence.push(candidates.find(c => c.is_honors === course.is_honors && c.is_ap === course.is_ap)
+        || candidates[0]);
+    }
+    return sequence;
+  }
+
   const sequence = [course];
   let current = course;
 
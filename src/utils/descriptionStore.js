@@ -0,0 +1,71 @@
+/**
+ * descriptionStore.js
+ *
+ * On-demand loader for the course description store written by
+ * description_store.py. Descriptions live outside the core catalog in a
+ * few text shards; the index maps each course_id to a byte range in one
+ * of them. The index and each shard are fetched at most once.
+ *
+ * Usage:
+ *   const text = await loadDescription('001395-001396'); // null if none
+ */
+
+const STORE_URL = '/data/descriptions/';
+const STORE_FORMAT = 1;
+
+const decoder = new TextDecoder();
+let indexPromise = null;
+const shardPromises = new Map();
+
+function fetchOk(url) {
+  return fetch(url).then(response => {
+    if (!response.ok) {
+      throw new Error(`Failed to load ${url}: ${response.status}`);
+    }
+    return response;
+  });
+}
+
+function loadIndex() {
+  if (!indexPromise) {
+    indexPromise = fetchOk(STORE_URL + 'index.json')
+      .then(response => response.json())
+      .then(index => {
+        if (index.format !== STORE_FORMAT) {
+          throw new Error(`Unsupported description store format: ${index.format}`);
+        }
+        return index;
+      })
+      .catch(error => {
+        indexPromise = null; // allow a retry on the next request
+        throw error;
+      });
+  }
+  return indexPromise;
+}
+
+function loadShard(index, shard) {
+  if (!shardPromises.has(shard)) {
+    const promise = fetchOk(STORE_URL + index.shards[shard])
+      .then(response => response.arrayBuffer())
+      .catch(error => {
+        shardPromises.delete(shard);
+        throw error;
+      });
+    shardPromises.set(shard, promise);
+  }
+  return shardPromises.get(shard);
+}
+
+/**
+ * Full description of a course, or null if the store has none
+ */
+export async function loadDescription(courseId) {
+  const index = await loadIndex();
+  const entry = index.courses[courseId];
+  if (!entry) return null;
+
+  const [shard, offset, length] = entry;
+  const buffer = await loadShard(index, shard);
+  return decoder.decode(new Uint8Array(buffer, offset, length));
+}
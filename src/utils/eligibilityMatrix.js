@@ -0,0 +1,83 @@
+/**
+ * eligibilityMatrix.js
+ *
+ * Lookup over the grade x term eligibility matrix eligibility_matrix.py
+ * adds to the catalog (courseCatalogData.eligibility). Each cell is a
+ * bitset over `course_ids`; cells are decoded into ID lists once, so
+ * "which courses can a 10th grader take in spring" is an array lookup
+ * instead of a catalog scan.
+ *
+ * Usage:
+ *   const eligibility = createEligibilityLookup(courseCatalogData.eligibility);
+ *   eligibility.eligibleCourses(10, 'spring'); // ['000150', ...]
+ *   eligibility.isEligible('000150', 10);      // grades_allowed only
+ */
+
+const MATRIX_FORMAT = 1;
+const ANY_TERM = 'any';
+
+function decodeBits(hexBits, count) {
+  const bits = new Array(count);
+  for (let i = 0; i < count; i++) {
+    bits[i] = ((parseInt(hexBits[i >> 2], 16) >> (i & 3)) & 1) === 1;
+  }
+  return bits;
+}
+
+/**
+ * Whether a course is offered in a term (the matrix's rule, for catalogs
+ * built without one)
+ * @param {Object} course
+ * @param {string} term - 'fall' or 'spring'
+ * @returns {boolean}
+ */
+export function isOfferedInTerm(course, term) {
+  const restriction = course.semester_restrictions;
+  return (course.offered_terms || []).includes(term) &&
+    (restriction == null || restriction === `${term} only`);
+}
+
+/**
+ * Build the lookup for a matrix; returns null when there is none, so
+ * callers can fall back to filtering the catalog
+ * @param {Object|undefined} matrix
+ * @returns {Object|null}
+ */
+export function createEligibilityLookup(matrix) {
+  if (!matrix) return null;
+  if (matrix.format !== MATRIX_FORMAT) {
+    throw new Error(`Unsupported eligibility matrix format: ${matrix.format}`);
+  }
+
+  const courseIds = matrix.course_ids;
+  const cells = new Map();
+  const eligibleSets = new Map();
+  for (const [grade, terms] of Object.entries(matrix.cells)) {
+    for (const [term, hexBits] of Object.entries(terms)) {
+      const bits = decodeBits(hexBits, courseIds.length);
+      const ids = courseIds.filter((_, i) => bits[i]);
+      cells.set(`${grade}-${term}`, ids);
+      if (term === ANY_TERM) eligibleSets.set(Number(grade), new Set(ids));
+    }
+  }
+
+  return {
+    /**
+     * Course IDs a student in `grade` can take in `term`
+     * @param {number|string} grade - 9-12
+     * @param {string} term - 'fall', 'spring', a quarter ('Q1'-'Q4'), or omitted for any term
+     * @returns {Array<string>}
+     */
+    eligibleCourses(grade, term = ANY_TERM) {
+      const semester = matrix.quarters[term] || term;
+      return cells.get(`${parseInt(grade)}-${semester}`) || [];
+    },
+
+    /**
+     * Whether grades_allowed includes `grade`
+     */
+    isEligible(courseId, grade) {
+      return eligibleSets.get(parseInt(grade))?.has(courseId) || false;
+    }
+  };
+}
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Infer term structure from course-number adjacency.
+Course numbers are allocated in runs: a two-semester course is a fall/spring
+pair of consecutive numbers ("001395-001396") and a four-part course is
+A-D quarters ("001670-001673"). Instead of correcting term_length after
+the fact one subject at a time (fix_english_terms.py,
+fix_yearlong_courses.js, ...), this stage indexes every course number
+numerically and, in one pass over the sorted index, sets for the whole
+catalog:
+
+    fall_to_spring_dependency  true for consecutive fall/spring pairs (within
+                               one course, or two single-number courses with
+                               the same base name) and four-part courses
+    term_length                "yearlong" for four-part courses; two-semester
+                               pairs are kept as "semester" or "yearlong" and
+                               only moved off "quarter" (or a missing value)
+
+term_length otherwise keeps its hand-curated value (the yearlong courses
+the fixers set from user feedback are not number-derived), and credits
+follow a term_length change as in the fixers (yearlong 10, semester 5).
+linked_courses is left to the catalog's own "linked w/" links; the levels
+of a sequence come from base_name and sequence_index (course_enrichment.py).
+
+    python3 term_inference.py            # report only
+    python3 term_inference.py --write    # update courses_complete.json
+"""
+
+import argparse
+import json
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from course_enrichment import base_name
+from course_record import Course, load_catalog
+from parser_diff import course_numbers
+
+CATALOG_PATH = "src/data/courses_complete.json"
+
+TERM_CREDITS = {'yearlong': 10, 'semester': 5}
+
+def number_span(course) -> Optional[Tuple[int, int]]:
+    """First and last course number as integers, None without numbers or for irregular ranges"""
+    numbers = [int(n) for n in course_numbers(course)]
+    if not numbers:
+        return None
+    start, end = numbers[0], numbers[-1]
+    if end < start or (len(numbers) == 2 and end == start):
+        return None
+    return start, end
+
+def number_index(courses: List) -> List[Tuple[int, int, int]]:
+    """(first number, last number, course index), sorted by number"""
+    index = []
+    for i, course in enumerate(courses):
+        span = number_span(course)
+        if span is not None:
+            index.append((span[0], span[1], i))
+    index.sort()
+    return index
+
+def term_length_for(parts: int, current: Optional[str]) -> Optional[str]:
+    """term_length implied by a course's number of parts, None to keep the current one"""
+    if parts == 4:
+        return 'yearlong'
+    if parts == 2 and current not in ('semester', 'yearlong'):
+        return 'semester'
+    if parts == 1 and current not in ('semester', 'yearlong', 'quarter'):
+        return 'semester'
+    return None
+
+def infer_terms(courses: List) -> Dict[int, Dict[str, Any]]:
+    """Inferred fields for each course index (one sorted pass over the number index)
+
+    Returns {index: {"term_length"?, "fall_to_spring_dependency"}}.
+    """
+    inferred: Dict[int, Dict[str, Any]] = {}
+    previous = None
+
+    for start, end, i in number_index(courses):
+        course = courses[i]
+        parts = end - start + 1
+        entry = inferred[i] = {'fall_to_spring_dependency': parts in (2, 4)}
+
+        term_length = term_length_for(parts, course.get('term_length'))
+        if term_length is not None:
+            entry['term_length'] = term_length
+
+        # Fall and spring halves listed as two single-number courses
+        if previous is not None:
+            prev_start, prev_end, j = previous
+            if (parts == 1 and prev_start == prev_end and prev_end + 1 == start
+                    and base_name(courses[j].get('full_name') or '') == base_name(course.get('full_name') or '')):
+                entry['fall_to_spring_dependency'] = True
+                inferred[j]['fall_to_spring_dependency'] = True
+        previous = (start, end, i)
+
+    return inferred
+
+def apply_inference(courses: List, inferred: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Write the inferred fields; returns the changes"""
+    changes = []
+
+    def update(course, field, value):
+        old = course.get(field)
+        if old != value:
+            changes.append({'course': course['full_name'], 'field': field, 'old': old, 'new': value})
+            course[field] = value
+
+    for i, fields in inferred.items():
+        course = courses[i]
+        if 'term_length' in fields:
+            update(course, 'term_length', fields['term_length'])
+            update(course, 'credits', TERM_CREDITS[fields['term_length']])
+        update(course, 'fall_to_spring_dependency', fields['fall_to_spring_dependency'])
+    return changes
+
+def main():
+    parser = argparse.ArgumentParser(description="Infer term structure from course-number adjacency")
+    parser.add_argument('catalog', nargs='?', default=CATALOG_PATH)
+    parser.add_argument('--write', action='store_true', help="Save the inferred fields to the catalog")
+    args = parser.parse_args()
+
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        data = load_catalog(f)
+    courses = data['courses']
+
+    start = time.perf_counter()
+    inferred = infer_terms(courses)
+    elapsed = (time.perf_counter() - start) * 1000
+    changes = apply_inference(courses, inferred)
+
+    print(f"{len(inferred)}/{len(courses)} courses indexed by number ({elapsed:.1f} ms)")
+    print(f"  fall/spring dependencies: "
+          f"{sum(1 for f in inferred.values() if f['fall_to_spring_dependency'])}")
+
+    by_field: Dict[str, List[Dict[str, Any]]] = {}
+    for change in changes:
+        by_field.setdefault(change['field'], []).append(change)
+    print(f"\n{len(changes)} changes {'made' if args.write else 'proposed'}:")
+    for field, field_changes in by_field.items():
+        print(f"\n{field} ({len(field_changes)}):")
+        for change in field_changes:
+            if field != 'fall_to_spring_dependency':
+                print(f"  {change['course'][:44]:<44} {change['old']} -> {change['new']}")
+        if field == 'fall_to_spring_dependency':
+            turned_on = sum(1 for c in field_changes if c['new'])
+            print(f"  {turned_on} set, {len(field_changes) - turned_on} cleared")
+
+    if args.write:
+        with open(args.catalog, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=Course.to_dict)
+        print(f"\nSaved to {args.catalog}")
+
+if __name__ == "__main__":
+    main()
@@ -10,21 +10,26 @@ import re
 from typing import List, Dict, Any, Optional
 import sys
 
+from column_extraction import extract_pdf_pages
+
 def extract_courses_from_pdf(pdf_path: str) -> List[Dict[str, Any]]:
     """Extract all courses from the Westview catalog PDF"""
 
-    courses = []
-
     with pdfplumber.open(pdf_path) as pdf:
         print(f"Processing {len(pdf.pages)} pages...")
 
-        full_text = ""
-        for i, page in enumerate(pdf.pages, 1):
-            text = page.extract_text()
-            if text:
-                full_text += text + "\n"
-            if i % 10 == 0:
-                print(f"  Extracted {i}/{len(pdf.pages)} pages...")
+    # Columns are extracted separately so two-column pages don't interleave
+    full_text = ""
+    for text in extract_pdf_pages(pdf_path):
+        if text:
+            full_text += text + "\n"
+
+    return parse_courses_from_text(full_text)
+
+def parse_courses_from_text(full_text: str) -> List[Dict[str, Any]]:
+    """Find and parse every course in the catalog's extracted text"""
+
+    courses = []
 
     print(f"\nTotal text extracted: {len(full_text)} characters")
     print("Parsing courses...\n")
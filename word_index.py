@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Word-level spatial index for catalog pages.
+Stores page.extract_words() output in a uniform grid so label-relative
+lookups ("text to the right of 'Length of Course:' on the same baseline")
+only touch the few cells on that line instead of rescanning page text.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+
+# Field labels that start a line in course entries
+FIELD_LABELS = [
+    'Recommended Prerequisites:',
+    'Required Prerequisites:',
+    'For students interested in:',
+    'Length of Course:',
+    'Alternate Course ID Numbers:',
+    'Alternate Course ID Number:',
+]
+
+# Grid cell size in PDF points; rows are about one text line tall
+CELL_WIDTH = 100.0
+CELL_HEIGHT = 12.0
+
+# Words whose bottoms differ by less than this share a baseline
+BASELINE_TOLERANCE = 2.0
+
+class PageWordIndex:
+    """Grid index over the words of one page"""
+
+    def __init__(self, words: List[Dict], page_no: int = 0):
+        self.page_no = page_no
+        self.words = words
+        self.cells = defaultdict(list)
+        self.by_text = defaultdict(list)
+
+        for i, word in enumerate(words):
+            row = int(word['bottom'] // CELL_HEIGHT)
+            for col in range(int(word['x0'] // CELL_WIDTH), int(word['x1'] // CELL_WIDTH) + 1):
+                self.cells[(row, col)].append(i)
+            self.by_text[word['text']].append(i)
+
+        # Occupied columns of each row, sorted, so a lookup bisects to its
+        # x range instead of walking every column of the page
+        self.row_cols = defaultdict(list)
+        for row, col in sorted(self.cells):
+            self.row_cols[row].append(col)
+
+    @classmethod
+    def from_page(cls, page, page_no: int = 0) -> 'PageWordIndex':
+        """Build the index from a pdfplumber page (or cropped page)"""
+        return cls(page.extract_words(), page_no)
+
+    def words_on_baseline(self, bottom: float, x_min: float = 0.0,
+                          x_max: Optional[float] = None) -> List[Dict]:
+        """Words sharing a baseline, between x_min and x_max, left to right"""
+        rows = range(int((bottom - BASELINE_TOLERANCE) // CELL_HEIGHT),
+                     int((bottom + BASELINE_TOLERANCE) // CELL_HEIGHT) + 1)
+        first_col = int(x_min // CELL_WIDTH)
+
+        found = set()
+        for row in rows:
+            cols = self.row_cols.get(row, [])
+            start = bisect_left(cols, first_col)
+            end = len(cols) if x_max is None else bisect_right(cols, int(x_max // CELL_WIDTH), start)
+            for col in cols[start:end]:
+                for i in self.cells[(row, col)]:
+                    word = self.words[i]
+                    if abs(word['bottom'] - bottom) > BASELINE_TOLERANCE:
+                        continue
+                    if word['x0'] < x_min or (x_max is not None and word['x1'] > x_max):
+                        continue
+                    found.add(i)
+
+        return [self.words[i] for i in sorted(found, key=lambda i: self.words[i]['x0'])]
+
+    def find_label(self, label: str, top: float = 0.0, bottom: Optional[float] = None,
+                   x_min: float = 0.0, x_max: Optional[float] = None) -> List[Dict]:
+        """Last word of every occurrence of a (multi-word) label in a region"""
+        tokens = label.split()
+        matches = []
+
+        for i in self.by_text.get(tokens[0], ()):
+            first = self.words[i]
+            if first['top'] < top or (bottom is not None and first['bottom'] > bottom):
+                continue
+            if first['x0'] < x_min or (x_max is not None and first['x1'] > x_max):
+                continue
+
+            if len(tokens) == 1:
+                matches.append(first)
+                continue
+
+            line = self.words_on_baseline(first['bottom'], first['x0'], x_max)
+            if [w['text'] for w in line[:len(tokens)]] == tokens:
+                matches.append(line[len(tokens) - 1])
+
+        return sorted(matches, key=lambda w: w['top'])
+
+    def text_right_of(self, label: str, top: float = 0.0, bottom: Optional[float] = None,
+                      x_min: float = 0.0, x_max: Optional[float] = None) -> Optional[str]:
+        """Text to the right of a label on the same baseline
+
+        Returns the first occurrence within the region, or None if the label
+        does not appear there. x_max keeps the value inside its column.
+        """
+        anchors = self.find_label(label, top, bottom, x_min, x_max)
+        if not anchors:
+            return None
+
+        anchor = anchors[0]
+        words = self.words_on_baseline(anchor['bottom'], anchor['x1'], x_max)
+        return ' '.join(w['text'] for w in words if w is not anchor).strip()
+
+def extract_label_fields(regions: List[Tuple[PageWordIndex, Tuple[float, float, float, float]]],
+                         labels: List[str] = FIELD_LABELS) -> Dict[str, str]:
+    """Field values for one course from its page regions
+
+    regions holds (page index, bbox) for each region the course spans,
+    with bbox as (x0, top, x1, bottom). Keys are the labels without the
+    trailing colon.
+    """
+    fields = {}
+    for label in labels:
+        key = label.rstrip(':')
+        for index, (x0, top, x1, bottom) in regions:
+            value = index.text_right_of(label, top, bottom, x0 - 1, x1 + 1)
+            if value is not None:
+                fields[key] = value
+                break
+    return fields